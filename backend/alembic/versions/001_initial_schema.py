@@ -4,7 +4,18 @@ Revision ID: 001_initial_schema
 Revises: 
 Create Date: 2025-11-21 10:00:00.000000
 
+Secondary indexes are created with CREATE INDEX CONCURRENTLY inside an
+autocommit block, so this revision is not fully transactional: tables are
+created in the migration transaction, indexes are built after it commits.
+
+audit_event is range-partitioned by month on created_at. Its indexes are
+created on the (still empty) parent inside the transaction, because
+partitioned tables do not support CREATE INDEX CONCURRENTLY. Future monthly
+partitions are created by the ensure_audit_partitions Celery task, run daily
+by Celery beat.
+
 """
+from datetime import date, datetime, timezone
 from typing import Sequence, Union
 
 from alembic import op
@@ -17,93 +28,157 @@ down_revision: Union[str, None] = None
 branch_labels: Union[str, Sequence[str], None] = None
 depends_on: Union[str, Sequence[str], None] = None
 
+# Monthly audit_event partitions created up front, beyond the current month
+AUDIT_PARTITION_MONTHS_AHEAD = 2
+
+
+def _add_months(month_start: date, months: int) -> date:
+    """Return the first day of the month `months` after `month_start`."""
+    index = month_start.year * 12 + month_start.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def _audit_partition_ddl(month_start: date) -> str:
+    """Build CREATE TABLE for the audit_event partition covering one month."""
+    month_end = _add_months(month_start, 1)
+    return (
+        f"CREATE TABLE IF NOT EXISTS audit_event_{month_start:%Y_%m} "
+        f"PARTITION OF audit_event "
+        f"FOR VALUES FROM ('{month_start.isoformat()}') TO ('{month_end.isoformat()}')"
+    )
+
 
 def upgrade() -> None:
     """Upgrade database schema."""
+    # gen_random_uuid() for primary key defaults
+    op.execute('CREATE EXTENSION IF NOT EXISTS pgcrypto')
+
     # Create tenant table
     op.create_table(
         'tenant',
-        sa.Column('id', sa.String(36), nullable=False),
+        sa.Column('id', postgresql.UUID(as_uuid=True), server_default=sa.text('gen_random_uuid()'), nullable=False),
         sa.Column('name', sa.String(255), nullable=False),
         sa.Column('tier', sa.String(50), nullable=False, server_default='standard'),
         sa.Column('is_active', sa.Boolean(), nullable=False, server_default='true'),
         sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
         sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
-        sa.PrimaryKeyConstraint('id')
+        sa.PrimaryKeyConstraint('id'),
+        sa.CheckConstraint("tier IN ('standard', 'premium', 'enterprise')", name='ck_tenant_tier'),
     )
 
     # Create report_definition table
     op.create_table(
         'report_definition',
-        sa.Column('id', sa.String(36), nullable=False),
-        sa.Column('tenant_id', sa.String(36), nullable=False),
+        sa.Column('id', postgresql.UUID(as_uuid=True), server_default=sa.text('gen_random_uuid()'), nullable=False),
+        sa.Column('tenant_id', postgresql.UUID(as_uuid=True), nullable=False),
         sa.Column('name', sa.String(255), nullable=False),
         sa.Column('description', sa.Text(), nullable=True),
-        sa.Column('query_spec', postgresql.JSON(astext_type=sa.Text()), nullable=False),
+        sa.Column('query_spec', postgresql.JSONB(), nullable=False),
         sa.Column('template_ref', sa.String(500), nullable=False),
         sa.Column('output_format', sa.String(50), nullable=False, server_default='pdf'),
-        sa.Column('created_by', sa.String(36), nullable=False),
+        sa.Column('created_by', postgresql.UUID(as_uuid=True), nullable=False),
         sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
         sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
         sa.ForeignKeyConstraint(['tenant_id'], ['tenant.id'], ),
-        sa.PrimaryKeyConstraint('id')
+        sa.PrimaryKeyConstraint('id'),
+        sa.CheckConstraint(
+            "output_format IN ('pdf', 'csv', 'xlsx')", name='ck_report_output_format'
+        ),
     )
-    op.create_index('idx_report_tenant_id', 'report_definition', ['tenant_id'])
 
     # Create schedule table
     op.create_table(
         'schedule',
-        sa.Column('id', sa.String(36), nullable=False),
-        sa.Column('tenant_id', sa.String(36), nullable=False),
-        sa.Column('report_definition_id', sa.String(36), nullable=False),
-        sa.Column('name', sa.String(255), nullable=False),
-        sa.Column('cron_expression', sa.String(100), nullable=False),
-        sa.Column('timezone', sa.String(50), nullable=False, server_default='UTC'),
-        sa.Column('is_active', sa.Boolean(), nullable=False, server_default='true'),
+        # Fixed-width columns first, widest alignment first, so the row carries
+        # no alignment padding; variable-width columns follow.
+        sa.Column('id', postgresql.UUID(as_uuid=True), server_default=sa.text('gen_random_uuid()'), nullable=False),
+        sa.Column('tenant_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('report_definition_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('created_by', postgresql.UUID(as_uuid=True), nullable=False),
         sa.Column('next_run_at', sa.DateTime(timezone=True), nullable=True),
         sa.Column('last_run_at', sa.DateTime(timezone=True), nullable=True),
-        sa.Column('email_delivery_config', postgresql.JSON(astext_type=sa.Text()), nullable=True),
-        sa.Column('created_by', sa.String(36), nullable=False),
         sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
         sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.Column('is_active', sa.Boolean(), nullable=False, server_default='true'),
+        sa.Column('name', sa.String(255), nullable=False),
+        sa.Column('cron_expression', sa.String(100), nullable=False),
+        sa.Column('timezone', sa.String(50), nullable=False, server_default='UTC'),
+        sa.Column('email_delivery_config', postgresql.JSONB(), nullable=True),
         sa.ForeignKeyConstraint(['tenant_id'], ['tenant.id'], ),
         sa.ForeignKeyConstraint(['report_definition_id'], ['report_definition.id'], ),
         sa.PrimaryKeyConstraint('id')
     )
-    op.create_index('idx_schedule_tenant_id', 'schedule', ['tenant_id'])
-    op.create_index('idx_schedule_next_run', 'schedule', ['next_run_at', 'is_active'])
-    op.create_index('idx_schedule_report_id', 'schedule', ['report_definition_id'])
+    # Leave free space in each page so run-bookkeeping updates that do not
+    # touch an indexed column can be applied as HOT updates.
+    op.execute('ALTER TABLE schedule SET (fillfactor = 90)')
 
     # Create execution_run table
     op.create_table(
         'execution_run',
-        sa.Column('id', sa.String(36), nullable=False),
-        sa.Column('tenant_id', sa.String(36), nullable=False),
-        sa.Column('schedule_id', sa.String(36), nullable=True),
-        sa.Column('report_definition_id', sa.String(36), nullable=False),
+        sa.Column('id', postgresql.UUID(as_uuid=True), server_default=sa.text('gen_random_uuid()'), nullable=False),
+        sa.Column('tenant_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('schedule_id', postgresql.UUID(as_uuid=True), nullable=True),
+        sa.Column('report_definition_id', postgresql.UUID(as_uuid=True), nullable=False),
         sa.Column('status', sa.String(50), nullable=False, server_default='pending'),
         sa.Column('started_at', sa.DateTime(timezone=True), nullable=True),
         sa.Column('completed_at', sa.DateTime(timezone=True), nullable=True),
         sa.Column('duration_seconds', sa.Integer(), nullable=True),
         sa.Column('error_message', sa.Text(), nullable=True),
-        sa.Column('execution_metadata', postgresql.JSON(astext_type=sa.Text()), nullable=True),
+        sa.Column('execution_metadata', postgresql.JSONB(), nullable=True),
         sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
         sa.ForeignKeyConstraint(['tenant_id'], ['tenant.id'], ),
         sa.ForeignKeyConstraint(['schedule_id'], ['schedule.id'], ),
         sa.ForeignKeyConstraint(['report_definition_id'], ['report_definition.id'], ),
-        sa.PrimaryKeyConstraint('id')
+        sa.PrimaryKeyConstraint('id'),
+        sa.CheckConstraint(
+            "status IN ('pending', 'running', 'completed', 'failed')", name='ck_execution_status'
+        ),
+    )
+
+    # In-flight (pending/running) executions per tenant, maintained by trigger
+    # so concurrency limits can be checked without scanning execution_run
+    op.create_table(
+        'tenant_concurrency',
+        sa.Column('tenant_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('running_count', sa.Integer(), nullable=False, server_default='0'),
+        sa.ForeignKeyConstraint(['tenant_id'], ['tenant.id'], ),
+        sa.PrimaryKeyConstraint('tenant_id')
     )
-    op.create_index('idx_execution_tenant_id', 'execution_run', ['tenant_id'])
-    op.create_index('idx_execution_schedule_id', 'execution_run', ['schedule_id'])
-    op.create_index('idx_execution_status', 'execution_run', ['status'])
-    op.create_index('idx_execution_created_at', 'execution_run', ['created_at'])
+    op.execute("""
+        CREATE FUNCTION track_tenant_concurrency() RETURNS trigger AS $$
+        DECLARE
+            delta integer := 0;
+            target uuid;
+        BEGIN
+            IF TG_OP IN ('UPDATE', 'DELETE') AND OLD.status IN ('pending', 'running') THEN
+                delta := delta - 1;
+            END IF;
+            IF TG_OP IN ('INSERT', 'UPDATE') AND NEW.status IN ('pending', 'running') THEN
+                delta := delta + 1;
+            END IF;
+            IF delta <> 0 THEN
+                target := CASE WHEN TG_OP = 'DELETE' THEN OLD.tenant_id ELSE NEW.tenant_id END;
+                INSERT INTO tenant_concurrency (tenant_id, running_count)
+                VALUES (target, GREATEST(delta, 0))
+                ON CONFLICT (tenant_id) DO UPDATE
+                SET running_count = GREATEST(tenant_concurrency.running_count + delta, 0);
+            END IF;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    op.execute("""
+        CREATE TRIGGER execution_run_track_concurrency
+        AFTER INSERT OR UPDATE OF status OR DELETE ON execution_run
+        FOR EACH ROW EXECUTE FUNCTION track_tenant_concurrency()
+    """)
 
     # Create artifact table
     op.create_table(
         'artifact',
-        sa.Column('id', sa.String(36), nullable=False),
-        sa.Column('tenant_id', sa.String(36), nullable=False),
-        sa.Column('execution_run_id', sa.String(36), nullable=False),
+        sa.Column('id', postgresql.UUID(as_uuid=True), server_default=sa.text('gen_random_uuid()'), nullable=False),
+        sa.Column('tenant_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('execution_run_id', postgresql.UUID(as_uuid=True), nullable=False),
         sa.Column('blob_path', sa.String(1000), nullable=False),
         sa.Column('file_size_bytes', sa.Integer(), nullable=False),
         sa.Column('file_format', sa.String(50), nullable=False),
@@ -113,17 +188,16 @@ def upgrade() -> None:
         sa.ForeignKeyConstraint(['tenant_id'], ['tenant.id'], ),
         sa.ForeignKeyConstraint(['execution_run_id'], ['execution_run.id'], ),
         sa.PrimaryKeyConstraint('id'),
-        sa.UniqueConstraint('execution_run_id')
+        sa.UniqueConstraint('execution_run_id'),
+        sa.CheckConstraint("file_format IN ('pdf', 'csv', 'xlsx')", name='ck_artifact_file_format'),
     )
-    op.create_index('idx_artifact_tenant_id', 'artifact', ['tenant_id'])
-    op.create_index('idx_artifact_created_at', 'artifact', ['created_at'])
 
     # Create delivery_receipt table
     op.create_table(
         'delivery_receipt',
-        sa.Column('id', sa.String(36), nullable=False),
-        sa.Column('tenant_id', sa.String(36), nullable=False),
-        sa.Column('artifact_id', sa.String(36), nullable=False),
+        sa.Column('id', postgresql.UUID(as_uuid=True), server_default=sa.text('gen_random_uuid()'), nullable=False),
+        sa.Column('tenant_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('artifact_id', postgresql.UUID(as_uuid=True), nullable=False),
         sa.Column('channel', sa.String(50), nullable=False),
         sa.Column('recipient', sa.String(500), nullable=False),
         sa.Column('status', sa.String(50), nullable=False, server_default='pending'),
@@ -132,28 +206,154 @@ def upgrade() -> None:
         sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
         sa.ForeignKeyConstraint(['tenant_id'], ['tenant.id'], ),
         sa.ForeignKeyConstraint(['artifact_id'], ['artifact.id'], ),
-        sa.PrimaryKeyConstraint('id')
+        sa.PrimaryKeyConstraint('id'),
+        sa.CheckConstraint("channel IN ('email', 'webhook', 'slack')", name='ck_delivery_channel'),
+        sa.CheckConstraint(
+            "status IN ('pending', 'sent', 'failed', 'bounced')", name='ck_delivery_status'
+        ),
     )
-    op.create_index('idx_delivery_tenant_id', 'delivery_receipt', ['tenant_id'])
-    op.create_index('idx_delivery_artifact_id', 'delivery_receipt', ['artifact_id'])
 
     # Create audit_event table
     op.create_table(
         'audit_event',
-        sa.Column('id', sa.String(36), nullable=False),
-        sa.Column('tenant_id', sa.String(36), nullable=False),
-        sa.Column('user_id', sa.String(36), nullable=False),
+        sa.Column('id', postgresql.UUID(as_uuid=True), server_default=sa.text('gen_random_uuid()'), nullable=False),
+        sa.Column('tenant_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('user_id', postgresql.UUID(as_uuid=True), nullable=True),
         sa.Column('event_type', sa.String(100), nullable=False),
         sa.Column('resource_type', sa.String(100), nullable=False),
-        sa.Column('resource_id', sa.String(36), nullable=False),
-        sa.Column('event_data', postgresql.JSON(astext_type=sa.Text()), nullable=True),
+        sa.Column('resource_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('event_data', postgresql.JSONB(), nullable=True),
         sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
         sa.ForeignKeyConstraint(['tenant_id'], ['tenant.id'], ),
-        sa.PrimaryKeyConstraint('id')
+        sa.PrimaryKeyConstraint('id', 'created_at'),
+        postgresql_partition_by='RANGE (created_at)',
+    )
+    op.execute('CREATE TABLE audit_event_default PARTITION OF audit_event DEFAULT')
+    today = datetime.now(timezone.utc).date()
+    for offset in range(AUDIT_PARTITION_MONTHS_AHEAD + 1):
+        op.execute(_audit_partition_ddl(_add_months(today.replace(day=1), offset)))
+
+    op.create_index(
+        'idx_audit_tenant_created', 'audit_event', ['tenant_id', sa.text('created_at DESC')],
+    )
+    # Event ids are ULIDs, so id order is creation order and serves as a cursor
+    op.create_index(
+        'idx_audit_tenant_id_desc', 'audit_event', ['tenant_id', sa.text('id DESC')],
     )
-    op.create_index('idx_audit_tenant_id', 'audit_event', ['tenant_id'])
-    op.create_index('idx_audit_created_at', 'audit_event', ['created_at'])
-    op.create_index('idx_audit_event_type', 'audit_event', ['event_type'])
+    # Per-artifact audit trail and per-user activity, newest first
+    op.create_index(
+        'idx_audit_tenant_resource', 'audit_event',
+        ['tenant_id', 'resource_type', 'resource_id', sa.text('id DESC')],
+    )
+    op.create_index(
+        'idx_audit_tenant_user', 'audit_event', ['tenant_id', 'user_id', sa.text('id DESC')],
+    )
+    op.create_index(
+        'idx_audit_created_at', 'audit_event', ['created_at'],
+        postgresql_using='brin',
+        postgresql_with={'pages_per_range': 32},
+    )
+    op.create_index(
+        'idx_audit_event_type', 'audit_event', ['event_type'],
+    )
+    op.create_index(
+        'idx_audit_event_data_gin', 'audit_event', ['event_data'],
+        postgresql_using='gin',
+        postgresql_ops={'event_data': 'jsonb_path_ops'},
+    )
+
+
+    # Secondary indexes are built outside the migration transaction so that
+    # re-running against a populated database never blocks writes.
+    # created_at on the append-only tables (execution_run, artifact)
+    # correlates with physical order, so those use BRIN.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'idx_report_tenant_id', 'report_definition', ['tenant_id'],
+            postgresql_concurrently=True,
+        )
+
+        # Scheduler hot path: active schedules for a tenant ordered by due time.
+        # The leftmost tenant_id prefix also serves plain tenant lookups.
+        op.create_index(
+            'idx_schedule_active_due',
+            'schedule',
+            ['tenant_id', 'next_run_at'],
+            postgresql_where=sa.text('is_active = true'),
+            postgresql_concurrently=True,
+        )
+        # Dispatcher claim: all active schedules in due order, across tenants,
+        # matching find_due_schedules' predicate and ORDER BY next_run_at, id.
+        # Paused and never-scheduled rows are left out of the index entirely.
+        op.create_index(
+            'idx_schedule_due',
+            'schedule',
+            ['next_run_at', 'id'],
+            postgresql_where=sa.text('is_active = true AND next_run_at IS NOT NULL'),
+            postgresql_concurrently=True,
+        )
+        # Schedule list page: keyset order (created_at DESC, id DESC) per tenant.
+        # is_active is carried as a payload column so the optional filter is
+        # evaluated from the index without visiting non-matching heap rows.
+        op.create_index(
+            'idx_schedule_tenant_list',
+            'schedule',
+            ['tenant_id', sa.text('created_at DESC'), sa.text('id DESC')],
+            postgresql_include=['is_active'],
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            'idx_schedule_report_id', 'schedule', ['report_definition_id'],
+            postgresql_concurrently=True,
+        )
+
+        op.create_index(
+            'idx_execution_tenant_created', 'execution_run', ['tenant_id', sa.text('created_at DESC')],
+            postgresql_concurrently=True,
+        )
+        # Recent runs for a schedule; schedule_id already pins the tenant.
+        op.create_index(
+            'idx_execution_schedule_time', 'execution_run', ['schedule_id', sa.text('created_at DESC')],
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            'idx_execution_status', 'execution_run', ['status'],
+            postgresql_concurrently=True,
+        )
+        # In-flight runs only: small, and serves burst-protection lookups
+        op.create_index(
+            'idx_execution_active_tenant',
+            'execution_run',
+            ['tenant_id'],
+            postgresql_where=sa.text("status IN ('pending', 'running')"),
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            'idx_execution_created_at', 'execution_run', ['created_at'],
+            postgresql_using='brin',
+            postgresql_with={'pages_per_range': 32},
+            postgresql_concurrently=True,
+        )
+
+        op.create_index(
+            'idx_artifact_tenant_id', 'artifact', ['tenant_id'],
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            'idx_artifact_created_at', 'artifact', ['created_at'],
+            postgresql_using='brin',
+            postgresql_with={'pages_per_range': 32},
+            postgresql_concurrently=True,
+        )
+
+        op.create_index(
+            'idx_delivery_tenant_id', 'delivery_receipt', ['tenant_id'],
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            'idx_delivery_artifact_id', 'delivery_receipt', ['artifact_id'],
+            postgresql_concurrently=True,
+        )
 
 
 def downgrade() -> None:
@@ -161,6 +361,9 @@ def downgrade() -> None:
     op.drop_table('audit_event')
     op.drop_table('delivery_receipt')
     op.drop_table('artifact')
+    op.execute('DROP TRIGGER IF EXISTS execution_run_track_concurrency ON execution_run')
+    op.execute('DROP FUNCTION IF EXISTS track_tenant_concurrency()')
+    op.drop_table('tenant_concurrency')
     op.drop_table('execution_run')
     op.drop_table('schedule')
     op.drop_table('report_definition')
@@ -1,70 +1,5 @@
-"""Logging middleware for request/response tracking."""
+"""API middleware."""
 
-import time
-import logging
-import uuid
-from typing import Callable
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.requests import Request
-from starlette.responses import Response
+from src.api.middleware.logging import LoggingMiddleware
 
-logger = logging.getLogger(__name__)
-
-
-class LoggingMiddleware(BaseHTTPMiddleware):
-    """Middleware to log all HTTP requests and responses."""
-
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
-        """Process request and log details."""
-        # Generate request ID
-        request_id = str(uuid.uuid4())
-        request.state.request_id = request_id
-
-        # Log request
-        start_time = time.time()
-        logger.info(
-            "Incoming request",
-            extra={
-                "request_id": request_id,
-                "method": request.method,
-                "path": request.url.path,
-                "query_params": str(request.query_params),
-                "client_host": request.client.host if request.client else None,
-            },
-        )
-
-        # Process request
-        try:
-            response = await call_next(request)
-            duration = time.time() - start_time
-
-            # Log response
-            logger.info(
-                "Request completed",
-                extra={
-                    "request_id": request_id,
-                    "method": request.method,
-                    "path": request.url.path,
-                    "status_code": response.status_code,
-                    "duration_seconds": round(duration, 3),
-                },
-            )
-
-            # Add request ID to response headers
-            response.headers["X-Request-ID"] = request_id
-            return response
-
-        except Exception as exc:
-            duration = time.time() - start_time
-            logger.error(
-                "Request failed",
-                exc_info=True,
-                extra={
-                    "request_id": request_id,
-                    "method": request.method,
-                    "path": request.url.path,
-                    "duration_seconds": round(duration, 3),
-                    "error": str(exc),
-                },
-            )
-            raise
+__all__ = ["LoggingMiddleware"]
@@ -3,68 +3,88 @@
 import time
 import logging
 import uuid
-from typing import Callable
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.requests import Request
-from starlette.responses import Response
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 logger = logging.getLogger(__name__)
 
 
-class LoggingMiddleware(BaseHTTPMiddleware):
-    """Middleware to log all HTTP requests and responses."""
+class LoggingMiddleware:
+    """Middleware to log all HTTP requests and responses.
+
+    Plain ASGI rather than BaseHTTPMiddleware: the response is passed
+    through as-is instead of being re-streamed through a memory channel,
+    and no Request/Response objects are built per call.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
 
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """Process request and log details."""
-        # Generate request ID
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        # Generate request ID, exposed to handlers as request.state.request_id
         request_id = str(uuid.uuid4())
-        request.state.request_id = request_id
+        scope.setdefault("state", {})["request_id"] = request_id
+
+        method = scope["method"]
+        path = scope["path"]
+        client = scope.get("client")
 
         # Log request
-        start_time = time.time()
+        start_time = time.perf_counter()
         logger.info(
             "Incoming request",
             extra={
                 "request_id": request_id,
-                "method": request.method,
-                "path": request.url.path,
-                "query_params": str(request.query_params),
-                "client_host": request.client.host if request.client else None,
+                "method": method,
+                "path": path,
+                "query_params": scope.get("query_string", b"").decode("latin-1"),
+                "client_host": client[0] if client else None,
             },
         )
 
-        # Process request
-        try:
-            response = await call_next(request)
-            duration = time.time() - start_time
+        status_code = None
+        request_id_header = (b"x-request-id", request_id.encode("ascii"))
 
-            # Log response
-            logger.info(
-                "Request completed",
-                extra={
-                    "request_id": request_id,
-                    "method": request.method,
-                    "path": request.url.path,
-                    "status_code": response.status_code,
-                    "duration_seconds": round(duration, 3),
-                },
-            )
-
-            # Add request ID to response headers
-            response.headers["X-Request-ID"] = request_id
-            return response
+        async def send_with_request_id(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                # Add request ID to response headers
+                message["headers"] = [*message.get("headers", ()), request_id_header]
+            await send(message)
 
+        # Process request
+        try:
+            await self.app(scope, receive, send_with_request_id)
         except Exception as exc:
-            duration = time.time() - start_time
+            duration = time.perf_counter() - start_time
             logger.error(
                 "Request failed",
                 exc_info=True,
                 extra={
                     "request_id": request_id,
-                    "method": request.method,
-                    "path": request.url.path,
+                    "method": method,
+                    "path": path,
                     "duration_seconds": round(duration, 3),
                     "error": str(exc),
                 },
             )
             raise
+
+        # Log response
+        duration = time.perf_counter() - start_time
+        logger.info(
+            "Request completed",
+            extra={
+                "request_id": request_id,
+                "method": method,
+                "path": path,
+                "status_code": status_code,
+                "duration_seconds": round(duration, 3),
+            },
+        )
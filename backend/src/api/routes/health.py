@@ -1,6 +1,7 @@
 """Health check endpoints."""
 
 from fastapi import APIRouter, status
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
 from typing import Dict, Any
 import sys
@@ -23,23 +24,36 @@ class ReadinessResponse(BaseModel):
     checks: Dict[str, Any]
 
 
+# Probe payloads never change at runtime, so build them once at import.
+_PYTHON_VERSION = f"{sys.version_info.major}.{sys.version_info.minor}.{sys.version_info.micro}"
+_HEALTH_RESPONSE = HealthResponse(
+    status="healthy",
+    version="1.0.0",
+    python_version=_PYTHON_VERSION,
+).model_dump()
+_READINESS_RESPONSE = ReadinessResponse(
+    status="ready",
+    checks={
+        "database": "not_implemented",  # TODO: Check PostgreSQL connection
+        "redis": "not_implemented",  # TODO: Check Redis connection
+        "service_bus": "not_implemented",  # TODO: Check Service Bus connection
+    },
+).model_dump()
+
+
 @router.get("/health", response_model=HealthResponse, status_code=status.HTTP_200_OK)
-async def health_check() -> HealthResponse:
+async def health_check() -> ORJSONResponse:
     """
     Liveness probe endpoint.
 
     Returns 200 if the application is running.
     Used by Kubernetes/Container Apps for liveness checks.
     """
-    return HealthResponse(
-        status="healthy",
-        version="1.0.0",
-        python_version=f"{sys.version_info.major}.{sys.version_info.minor}.{sys.version_info.micro}",
-    )
+    return ORJSONResponse(_HEALTH_RESPONSE)
 
 
 @router.get("/health/ready", response_model=ReadinessResponse, status_code=status.HTTP_200_OK)
-async def readiness_check() -> ReadinessResponse:
+async def readiness_check() -> ORJSONResponse:
     """
     Readiness probe endpoint.
 
@@ -48,15 +62,9 @@ async def readiness_check() -> ReadinessResponse:
 
     TODO Phase 1: Add actual database and Redis connectivity checks.
     """
-    checks = {
-        "database": "not_implemented",  # TODO: Check PostgreSQL connection
-        "redis": "not_implemented",  # TODO: Check Redis connection
-        "service_bus": "not_implemented",  # TODO: Check Service Bus connection
-    }
-
     # For now, always return healthy
     # In Phase 1, implement actual health checks
-    return ReadinessResponse(status="ready", checks=checks)
+    return ORJSONResponse(_READINESS_RESPONSE)
 
 
 @router.get("/", include_in_schema=False)
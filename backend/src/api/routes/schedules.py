@@ -1,8 +1,10 @@
 """Schedule API endpoints."""
 
-from typing import Optional
+import uuid
+from typing import NamedTuple, Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.api.schemas.schedule import (
@@ -18,13 +20,19 @@ from src.infrastructure.database.repositories.postgres_schedule_repository impor
     PostgresScheduleRepository,
 )
 from src.infrastructure.database.session import get_db
-from src.utils.cron import get_human_readable_cron, get_next_n_runs
+from src.scheduler.scheduler_loop import wake_scheduler
+from src.utils.cron import get_human_readable_cron, get_next_n_runs_cached
 
-router = APIRouter(prefix="/v1/schedules", tags=["schedules"])
+router = APIRouter(
+    prefix="/v1/schedules",
+    tags=["schedules"],
+    default_response_class=ORJSONResponse,
+)
 
 
-# Dependency to get service (in real app, this would use proper DI)
-def get_schedule_service(
+# Dependency to get service (in real app, this would use proper DI).
+# Declared async so FastAPI builds it inline instead of via the threadpool.
+async def get_schedule_service(
     db: AsyncSession = Depends(get_db),
 ) -> ScheduleService:
     """Get schedule service with dependencies."""
@@ -32,17 +40,47 @@ def get_schedule_service(
     return ScheduleService(repository)
 
 
+class TenantContext(NamedTuple):
+    """Authenticated tenant and user for the current request."""
+
+    tenant_id: uuid.UUID
+    tier: str
+    user_id: uuid.UUID
+
+
+# Mock tenant context returned until real auth is wired in. Fixed UUIDs, as
+# tenant and user ids are native uuid columns.
+_MOCK_TENANT = TenantContext(
+    tenant_id=uuid.UUID("00000000-0000-4000-8000-000000000123"),
+    tier="premium",
+    user_id=uuid.UUID("00000000-0000-4000-8000-000000000456"),
+)
+
+
 # Mock function to get current tenant context (replace with real auth)
-async def get_current_tenant() -> tuple[str, str, str]:
+async def get_current_tenant() -> TenantContext:
     """Get current tenant from auth context.
     
     In production, this would extract tenant info from JWT token.
     
     Returns:
-        Tuple of (tenant_id, tenant_tier, user_id)
+        The tenant context (tenant_id, tier, user_id)
     """
-    # TODO: Replace with real authentication
-    return "tenant-123", "premium", "user-456"
+    # TODO: Replace with real authentication. Keep this async: FastAPI runs
+    # plain def dependencies in the threadpool, which costs more per request
+    # than awaiting a coroutine that does no I/O.
+    return _MOCK_TENANT
+
+
+async def get_current_tenant_id(
+    tenant_context: TenantContext = Depends(get_current_tenant),
+) -> uuid.UUID:
+    """Get only the current tenant ID, for endpoints that need nothing else.
+    
+    Returns:
+        The tenant unique identifier
+    """
+    return tenant_context.tenant_id
 
 
 @router.post(
@@ -54,7 +92,7 @@ async def get_current_tenant() -> tuple[str, str, str]:
 async def create_schedule(
     request: CreateScheduleRequest,
     service: ScheduleService = Depends(get_schedule_service),
-    tenant_context: tuple[str, str, str] = Depends(get_current_tenant),
+    tenant_context: TenantContext = Depends(get_current_tenant),
 ) -> ScheduleResponse:
     """Create a new schedule for a report.
     
@@ -69,21 +107,19 @@ async def create_schedule(
     Raises:
         HTTPException: If validation fails or quota exceeded
     """
-    tenant_id, tenant_tier, user_id = tenant_context
-
     schedule, error = await service.create_schedule(
-        tenant_id=tenant_id,
-        tenant_tier=tenant_tier,
+        tenant_id=tenant_context.tenant_id,
+        tenant_tier=tenant_context.tier,
         report_definition_id=request.report_definition_id,
         name=request.name,
         cron_expression=request.cron_expression,
-        timezone=request.timezone,
+        tz_name=request.timezone,
         email_delivery_config=(
             request.email_delivery_config.model_dump()
             if request.email_delivery_config
             else None
         ),
-        created_by=user_id,
+        created_by=tenant_context.user_id,
     )
 
     if error:
@@ -92,6 +128,7 @@ async def create_schedule(
             detail=error,
         )
 
+    await wake_scheduler(schedule.next_run_at)
     return ScheduleResponse.model_validate(schedule)
 
 
@@ -105,7 +142,7 @@ async def list_schedules(
     limit: int = Query(20, ge=1, le=100, description="Number of items to return"),
     is_active: Optional[bool] = Query(None, description="Filter by active status"),
     service: ScheduleService = Depends(get_schedule_service),
-    tenant_context: tuple[str, str, str] = Depends(get_current_tenant),
+    tenant_id: uuid.UUID = Depends(get_current_tenant_id),
 ) -> ScheduleListResponse:
     """List schedules for the current tenant with pagination.
     
@@ -114,13 +151,11 @@ async def list_schedules(
         limit: Maximum number of items to return (1-100)
         is_active: Filter by active status (None = all)
         service: The schedule service (injected)
-        tenant_context: Current tenant context (injected)
+        tenant_id: Current tenant ID (injected)
         
     Returns:
         Paginated list of schedules
     """
-    tenant_id, _, _ = tenant_context
-
     schedules, next_cursor = await service.list_schedules(
         tenant_id=tenant_id,
         cursor=cursor,
@@ -129,7 +164,7 @@ async def list_schedules(
     )
 
     return ScheduleListResponse(
-        items=[ScheduleResponse.model_validate(s) for s in schedules],
+        items=[ScheduleResponse.from_orm_row(s) for s in schedules],
         next_cursor=next_cursor,
     )
 
@@ -140,16 +175,16 @@ async def list_schedules(
     summary="Get a schedule by ID",
 )
 async def get_schedule(
-    schedule_id: str,
+    schedule_id: uuid.UUID,
     service: ScheduleService = Depends(get_schedule_service),
-    tenant_context: tuple[str, str, str] = Depends(get_current_tenant),
+    tenant_id: uuid.UUID = Depends(get_current_tenant_id),
 ) -> ScheduleResponse:
     """Get a single schedule by ID.
     
     Args:
         schedule_id: The schedule unique identifier
         service: The schedule service (injected)
-        tenant_context: Current tenant context (injected)
+        tenant_id: Current tenant ID (injected)
         
     Returns:
         The schedule
@@ -157,8 +192,6 @@ async def get_schedule(
     Raises:
         HTTPException: If schedule not found
     """
-    tenant_id, _, _ = tenant_context
-
     schedule = await service.get_schedule(
         schedule_id=schedule_id,
         tenant_id=tenant_id,
@@ -179,10 +212,10 @@ async def get_schedule(
     summary="Update a schedule",
 )
 async def update_schedule(
-    schedule_id: str,
+    schedule_id: uuid.UUID,
     request: UpdateScheduleRequest,
     service: ScheduleService = Depends(get_schedule_service),
-    tenant_context: tuple[str, str, str] = Depends(get_current_tenant),
+    tenant_id: uuid.UUID = Depends(get_current_tenant_id),
 ) -> ScheduleResponse:
     """Update an existing schedule.
     
@@ -190,7 +223,7 @@ async def update_schedule(
         schedule_id: The schedule unique identifier
         request: The schedule update request
         service: The schedule service (injected)
-        tenant_context: Current tenant context (injected)
+        tenant_id: Current tenant ID (injected)
         
     Returns:
         The updated schedule
@@ -198,14 +231,12 @@ async def update_schedule(
     Raises:
         HTTPException: If schedule not found or validation fails
     """
-    tenant_id, _, _ = tenant_context
-
     schedule, error = await service.update_schedule(
         schedule_id=schedule_id,
         tenant_id=tenant_id,
         name=request.name,
         cron_expression=request.cron_expression,
-        timezone=request.timezone,
+        tz_name=request.timezone,
         email_delivery_config=(
             request.email_delivery_config.model_dump()
             if request.email_delivery_config
@@ -221,6 +252,7 @@ async def update_schedule(
         )
         raise HTTPException(status_code=status_code, detail=error)
 
+    await wake_scheduler(schedule.next_run_at)
     return ScheduleResponse.model_validate(schedule)
 
 
@@ -230,22 +262,20 @@ async def update_schedule(
     summary="Delete a schedule",
 )
 async def delete_schedule(
-    schedule_id: str,
+    schedule_id: uuid.UUID,
     service: ScheduleService = Depends(get_schedule_service),
-    tenant_context: tuple[str, str, str] = Depends(get_current_tenant),
+    tenant_id: uuid.UUID = Depends(get_current_tenant_id),
 ) -> None:
     """Delete a schedule.
     
     Args:
         schedule_id: The schedule unique identifier
         service: The schedule service (injected)
-        tenant_context: Current tenant context (injected)
+        tenant_id: Current tenant ID (injected)
         
     Raises:
         HTTPException: If schedule not found
     """
-    tenant_id, _, _ = tenant_context
-
     deleted = await service.delete_schedule(
         schedule_id=schedule_id,
         tenant_id=tenant_id,
@@ -264,16 +294,16 @@ async def delete_schedule(
     summary="Pause a schedule",
 )
 async def pause_schedule(
-    schedule_id: str,
+    schedule_id: uuid.UUID,
     service: ScheduleService = Depends(get_schedule_service),
-    tenant_context: tuple[str, str, str] = Depends(get_current_tenant),
+    tenant_id: uuid.UUID = Depends(get_current_tenant_id),
 ) -> ScheduleResponse:
     """Pause a schedule (set is_active to False).
     
     Args:
         schedule_id: The schedule unique identifier
         service: The schedule service (injected)
-        tenant_context: Current tenant context (injected)
+        tenant_id: Current tenant ID (injected)
         
     Returns:
         The updated schedule
@@ -281,8 +311,6 @@ async def pause_schedule(
     Raises:
         HTTPException: If schedule not found
     """
-    tenant_id, _, _ = tenant_context
-
     schedule, error = await service.pause_schedule(
         schedule_id=schedule_id,
         tenant_id=tenant_id,
@@ -303,16 +331,16 @@ async def pause_schedule(
     summary="Resume a schedule",
 )
 async def resume_schedule(
-    schedule_id: str,
+    schedule_id: uuid.UUID,
     service: ScheduleService = Depends(get_schedule_service),
-    tenant_context: tuple[str, str, str] = Depends(get_current_tenant),
+    tenant_id: uuid.UUID = Depends(get_current_tenant_id),
 ) -> ScheduleResponse:
     """Resume a paused schedule (set is_active to True).
     
     Args:
         schedule_id: The schedule unique identifier
         service: The schedule service (injected)
-        tenant_context: Current tenant context (injected)
+        tenant_id: Current tenant ID (injected)
         
     Returns:
         The updated schedule
@@ -320,8 +348,6 @@ async def resume_schedule(
     Raises:
         HTTPException: If schedule not found or validation fails
     """
-    tenant_id, _, _ = tenant_context
-
     schedule, error = await service.resume_schedule(
         schedule_id=schedule_id,
         tenant_id=tenant_id,
@@ -335,6 +361,7 @@ async def resume_schedule(
         )
         raise HTTPException(status_code=status_code, detail=error)
 
+    await wake_scheduler(schedule.next_run_at)
     return ScheduleResponse.model_validate(schedule)
 
 
@@ -361,7 +388,7 @@ async def preview_cron(
     """
     try:
         description = get_human_readable_cron(request.cron_expression)
-        next_runs = get_next_n_runs(
+        next_runs = get_next_n_runs_cached(
             cron_expr=request.cron_expression,
             n=request.count,
             tz=request.timezone,
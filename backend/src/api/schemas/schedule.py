@@ -1,9 +1,13 @@
 """Pydantic schemas for schedule API requests and responses."""
 
+import re
+import uuid
 from datetime import datetime
 from typing import Optional
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+
+_EMAIL_RE = re.compile(r"[^@\s]+@[^@\s]+\.[^@\s]+")
 
 
 class EmailDeliveryConfig(BaseModel):
@@ -20,16 +24,16 @@ class EmailDeliveryConfig(BaseModel):
         """Validate email addresses."""
         if v is None:
             return v
-        for email in v:
-            if "@" not in email or len(email) < 5:
-                raise ValueError(f"Invalid email address: {email}")
+        bad = next((email for email in v if not _EMAIL_RE.fullmatch(email)), None)
+        if bad is not None:
+            raise ValueError(f"Invalid email address: {bad}")
         return v
 
 
 class CreateScheduleRequest(BaseModel):
     """Request schema for creating a schedule."""
 
-    report_definition_id: str = Field(..., min_length=1, max_length=100)
+    report_definition_id: uuid.UUID
     name: str = Field(..., min_length=1, max_length=255)
     cron_expression: str = Field(..., min_length=5, max_length=100)
     timezone: str = Field(default="UTC", max_length=50)
@@ -48,9 +52,11 @@ class UpdateScheduleRequest(BaseModel):
 class ScheduleResponse(BaseModel):
     """Response schema for schedule data."""
 
-    id: str
-    tenant_id: str
-    report_definition_id: str
+    model_config = ConfigDict(from_attributes=True)
+
+    id: uuid.UUID
+    tenant_id: uuid.UUID
+    report_definition_id: uuid.UUID
     name: str
     cron_expression: str
     timezone: str
@@ -58,14 +64,20 @@ class ScheduleResponse(BaseModel):
     next_run_at: Optional[datetime]
     last_run_at: Optional[datetime]
     email_delivery_config: Optional[dict]
-    created_by: str
+    created_by: uuid.UUID
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        """Pydantic config."""
+    @classmethod
+    def from_orm_row(cls, schedule: object) -> "ScheduleResponse":
+        """Build a response from a trusted ORM row without re-validation.
 
-        from_attributes = True
+        Rows loaded from the database already satisfy the column types, so
+        list endpoints use this instead of model_validate.
+        """
+        return cls.model_construct(
+            **{name: getattr(schedule, name) for name in cls.model_fields}
+        )
 
 
 class ScheduleListResponse(BaseModel):
@@ -73,7 +85,6 @@ class ScheduleListResponse(BaseModel):
 
     items: list[ScheduleResponse]
     next_cursor: Optional[str] = None
-    total_count: Optional[int] = None
 
 
 class CronPreviewRequest(BaseModel):
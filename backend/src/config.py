@@ -1,5 +1,6 @@
 """Application configuration using Pydantic Settings."""
 
+from functools import cached_property, lru_cache
 from typing import List
 from pydantic import field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -20,9 +21,25 @@ class Settings(BaseSettings):
     DATABASE_URL: str
     DB_POOL_SIZE: int = 20
     DB_POOL_MAX_OVERFLOW: int = 10
+    DB_STATEMENT_CACHE_SIZE: int = 500  # Per connection; set 0 behind PgBouncer
+    DB_POOL_RECYCLE_SECONDS: int = 1800  # Replace connections older than this
+    DB_POOL_TIMEOUT_SECONDS: int = 30  # Wait for a free connection before failing
+    # Per Celery worker process, which runs one task (one session) at a time
+    WORKER_DB_POOL_SIZE: int = 2
+    WORKER_DB_POOL_MAX_OVERFLOW: int = 3
+
+    # Reports with at least PDF_CHROMIUM_MIN_ROWS rows are printed by headless
+    # Chromium at this path instead of WeasyPrint; empty keeps WeasyPrint only
+    PDF_CHROMIUM_PATH: str = ""
+    PDF_CHROMIUM_MIN_ROWS: int = 500
+    PDF_CHROMIUM_TIMEOUT_SECONDS: int = 300
+    # WeasyPrint renders longer reports as separate documents of this many
+    # rows and joins their pages; table layout grows superlinearly with length
+    PDF_SHARD_ROWS: int = 1000
 
     # Redis
     REDIS_URL: str
+    REDIS_POOL_SIZE: int = 50  # Max connections per shared client
 
     # Azure Storage
     AZURE_STORAGE_CONNECTION_STRING: str
@@ -67,16 +84,31 @@ class Settings(BaseSettings):
                 return [origin.strip() for origin in v.split(",")]
         return v
 
-    @property
+    @cached_property
     def is_production(self) -> bool:
         """Check if running in production environment."""
         return self.ENVIRONMENT == "production"
 
-    @property
+    @cached_property
     def is_development(self) -> bool:
         """Check if running in development/local environment."""
         return self.ENVIRONMENT in ("dev", "local", "development")
 
+    @cached_property
+    def is_test(self) -> bool:
+        """Check if running under the test suite."""
+        return self.ENVIRONMENT == "test"
 
-# Global settings instance
-settings = Settings()
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Return the process-wide settings instance.
+
+    The environment and .env file are parsed once; forked workers inherit
+    the already-validated instance.
+    """
+    return Settings()
+
+
+# Global settings instance, shared with get_settings()
+settings = get_settings()
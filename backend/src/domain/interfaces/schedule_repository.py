@@ -1,5 +1,6 @@
 """Schedule repository interface."""
 
+import uuid
 from abc import ABC, abstractmethod
 from datetime import datetime
 from typing import Optional
@@ -10,6 +11,8 @@ from src.infrastructure.database.models import Schedule
 class IScheduleRepository(ABC):
     """Abstract interface for schedule persistence operations."""
 
+    __slots__ = ()
+
     @abstractmethod
     async def create(self, schedule: Schedule) -> Schedule:
         """Create a new schedule.
@@ -22,11 +25,23 @@ class IScheduleRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    async def bulk_create(self, schedules: list[Schedule]) -> list[Schedule]:
+        """Create several schedules in one batched insert.
+        
+        Args:
+            schedules: The schedule entities to persist
+            
+        Returns:
+            The created schedules, in input order
+        """
+        pass
+
     @abstractmethod
     async def find_by_id(
         self,
-        schedule_id: str,
-        tenant_id: str,
+        schedule_id: uuid.UUID,
+        tenant_id: uuid.UUID,
     ) -> Optional[Schedule]:
         """Find a schedule by ID within a tenant.
         
@@ -42,16 +57,22 @@ class IScheduleRepository(ABC):
     @abstractmethod
     async def find_by_tenant_id(
         self,
-        tenant_id: str,
+        tenant_id: uuid.UUID,
         cursor: Optional[str] = None,
         limit: int = 20,
         is_active: Optional[bool] = None,
     ) -> tuple[list[Schedule], Optional[str]]:
         """Find schedules for a tenant with cursor-based pagination.
         
+        Pagination is keyset, never OFFSET: results are ordered by
+        (created_at DESC, id DESC) and the cursor encodes the last row's
+        (created_at, id). Implementations must resume with a row-value
+        comparison, (created_at, id) < (cursor_created_at, cursor_id), so the
+        database can turn it into an index range condition.
+        
         Args:
             tenant_id: The tenant unique identifier
-            cursor: Opaque cursor for pagination (base64-encoded timestamp+id)
+            cursor: Opaque cursor for pagination (signed created_at+id token)
             limit: Maximum number of schedules to return (default: 20, max: 100)
             is_active: Filter by active status (None = all schedules)
             
@@ -78,6 +99,16 @@ class IScheduleRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    async def find_next_run_at(self) -> Optional[datetime]:
+        """Find the earliest upcoming run time across active schedules.
+        
+        Returns:
+            The smallest next_run_at of any active schedule, or None if there
+            are none
+        """
+        pass
+
     @abstractmethod
     async def update(self, schedule: Schedule) -> Schedule:
         """Update an existing schedule.
@@ -90,11 +121,21 @@ class IScheduleRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    async def update_run_times(self, updates: list[dict]) -> None:
+        """Set run bookkeeping columns on many schedules in one batch.
+        
+        Args:
+            updates: One dict per schedule with id, last_run_at, next_run_at
+                and is_active
+        """
+        pass
+
     @abstractmethod
     async def delete(
         self,
-        schedule_id: str,
-        tenant_id: str,
+        schedule_id: uuid.UUID,
+        tenant_id: uuid.UUID,
     ) -> bool:
         """Delete a schedule by ID within a tenant.
         
@@ -110,7 +151,7 @@ class IScheduleRepository(ABC):
     @abstractmethod
     async def count_by_tenant_id(
         self,
-        tenant_id: str,
+        tenant_id: uuid.UUID,
         is_active: Optional[bool] = None,
     ) -> int:
         """Count schedules for a tenant.
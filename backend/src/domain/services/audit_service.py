@@ -1,181 +1,488 @@
 """Audit and compliance tracking service."""
 
+import asyncio
 import logging
-from datetime import datetime, timezone
-from typing import Optional
+import uuid
+from datetime import date, datetime, timedelta, timezone
+from typing import AsyncIterator, Optional
 
-from sqlalchemy import desc, select
-from sqlalchemy.ext.asyncio import AsyncSession
+from redis.asyncio import Redis
+from sqlalchemy import (
+    String,
+    any_,
+    bindparam,
+    delete,
+    desc,
+    distinct,
+    func,
+    insert,
+    select,
+)
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from ulid import ULID
 
+from src.config import settings
 from src.infrastructure.database.models import Artifact, AuditEvent
 
 logger = logging.getLogger(__name__)
 
 
+class UniqueCountSketches:
+    """Daily HyperLogLog sketches of distinct users and artifacts per tenant.
+    
+    Each sketch is ~12KB in Redis regardless of cardinality, so approximate
+    unique counts over long ranges are one PFCOUNT over the days' keys.
+    """
+    
+    KEY_PREFIX = "audit_hll:"
+    TTL_SECONDS = 400 * 24 * 3600
+    
+    def __init__(self, redis_client: Optional[Redis] = None):
+        """Initialize the sketches.
+        
+        Args:
+            redis_client: Optional Redis client (creates new one if not provided)
+        """
+        self._redis = redis_client
+    
+    async def _get_redis(self) -> Redis:
+        """Get or create Redis client."""
+        if self._redis is None:
+            self._redis = Redis.from_url(
+                settings.REDIS_URL,
+                encoding="utf-8",
+                decode_responses=True,
+            )
+        return self._redis
+    
+    def _key(self, kind: str, tenant_id: str, day: date) -> str:
+        """Return the sketch key for one tenant, metric and UTC day."""
+        return f"{self.KEY_PREFIX}{kind}:{tenant_id}:{day.isoformat()}"
+    
+    async def add(self, rows: list[dict]) -> None:
+        """Add the users and artifacts of written audit rows to their sketches.
+        
+        Failures are logged and ignored; exact counts remain available in SQL.
+        Ids are added as strings, since redis-py rejects UUID values.
+        
+        Args:
+            rows: AuditEvent column values
+        """
+        members: dict[str, list[str]] = {}
+        for row in rows:
+            day = row["created_at"].astimezone(timezone.utc).date()
+            if row.get("user_id"):
+                members.setdefault(
+                    self._key("users", row["tenant_id"], day), []
+                ).append(str(row["user_id"]))
+            if row.get("resource_type") == "artifact" and row.get("resource_id"):
+                members.setdefault(
+                    self._key("artifacts", row["tenant_id"], day), []
+                ).append(str(row["resource_id"]))
+        
+        if not members:
+            return
+        
+        try:
+            redis = await self._get_redis()
+            async with redis.pipeline(transaction=False) as pipe:
+                for key, values in members.items():
+                    pipe.pfadd(key, *values)
+                    pipe.expire(key, self.TTL_SECONDS)
+                await pipe.execute()
+        except Exception as e:
+            logger.warning(f"Failed to update audit unique-count sketches: {e}")
+    
+    async def count(
+        self,
+        kind: str,
+        tenant_id: str,
+        start_date: datetime,
+        end_date: datetime,
+    ) -> int:
+        """Estimate distinct members over the UTC days touching a range.
+        
+        Args:
+            kind: "users" or "artifacts"
+            tenant_id: The tenant ID
+            start_date: Start of date range
+            end_date: End of date range
+            
+        Returns:
+            Approximate distinct count (~0.81% standard error)
+        """
+        first = start_date.astimezone(timezone.utc).date()
+        last = end_date.astimezone(timezone.utc).date()
+        keys = [
+            self._key(kind, tenant_id, first + timedelta(days=offset))
+            for offset in range((last - first).days + 1)
+        ]
+        redis = await self._get_redis()
+        return await redis.pfcount(*keys)
+
+
+# Process-wide sketches, fed by the audit writer
+unique_sketches = UniqueCountSketches()
+
+
+class AuditEventWriter:
+    """Write-behind buffer that batches audit event inserts.
+    
+    Events are queued in memory and written by a background task, up to
+    MAX_BATCH_SIZE rows per transaction or whatever has arrived within
+    FLUSH_INTERVAL_SECONDS of the first queued row. A failed batch is retried
+    with exponential backoff, then written row by row so one bad row cannot
+    take the rest of the batch with it.
+    """
+    
+    MAX_BATCH_SIZE = 200
+    FLUSH_INTERVAL_SECONDS = 0.1
+    MAX_QUEUE_SIZE = 10_000
+    # Batch attempts before falling back to per-row inserts; waits double
+    # from WRITE_RETRY_BASE_SECONDS (0.5s, 1s, 2s) while events keep queueing
+    WRITE_ATTEMPTS = 4
+    WRITE_RETRY_BASE_SECONDS = 0.5
+    
+    def __init__(
+        self,
+        session_factory: Optional[async_sessionmaker] = None,
+        sketches: Optional[UniqueCountSketches] = None,
+    ):
+        """Initialize the writer.
+        
+        Args:
+            session_factory: Optional session factory (defaults to the API session factory)
+            sketches: Optional unique-count sketches to update after each batch
+        """
+        self._session_factory = session_factory
+        self._sketches = sketches
+        self._queue: Optional[asyncio.Queue[Optional[dict]]] = None
+        self._task: Optional[asyncio.Task] = None
+    
+    @property
+    def is_running(self) -> bool:
+        """Whether the background flusher is accepting events."""
+        return self._task is not None and not self._task.done()
+    
+    def start(self) -> None:
+        """Start the background flusher on the running event loop."""
+        if self.is_running:
+            return
+        
+        if self._session_factory is None:
+            from src.infrastructure.database.session import AsyncSessionLocal
+            
+            self._session_factory = AsyncSessionLocal
+        
+        self._queue = asyncio.Queue(maxsize=self.MAX_QUEUE_SIZE)
+        self._task = asyncio.create_task(self._run())
+        logger.info("Audit event writer started")
+    
+    async def stop(self) -> None:
+        """Flush queued events and stop the background flusher."""
+        if not self.is_running:
+            return
+        
+        # Sentinel: the flusher writes what it holds and exits
+        await self._queue.put(None)
+        await self._task
+        self._task = None
+        logger.info("Audit event writer stopped")
+    
+    def enqueue(self, row: dict) -> bool:
+        """Queue an audit event row for the next batch.
+        
+        Args:
+            row: AuditEvent column values
+            
+        Returns:
+            True if queued, False if the writer is stopped or the queue is full
+        """
+        if not self.is_running:
+            return False
+        try:
+            self._queue.put_nowait(row)
+            return True
+        except asyncio.QueueFull:
+            logger.warning("Audit event queue full, writing event directly")
+            return False
+    
+    async def _run(self) -> None:
+        """Collect queued rows into batches and write them."""
+        loop = asyncio.get_running_loop()
+        
+        while True:
+            first = await self._queue.get()
+            if first is None:
+                return
+            
+            batch = [first]
+            deadline = loop.time() + self.FLUSH_INTERVAL_SECONDS
+            stopping = False
+            
+            while len(batch) < self.MAX_BATCH_SIZE:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    row = await asyncio.wait_for(self._queue.get(), timeout)
+                except TimeoutError:
+                    break
+                if row is None:
+                    stopping = True
+                    break
+                batch.append(row)
+            
+            await self._write(batch)
+            
+            if stopping:
+                return
+    
+    async def _write(self, batch: list[dict]) -> None:
+        """Insert one batch of rows, retrying transient failures.
+        
+        Args:
+            batch: AuditEvent column values
+        """
+        written = batch
+        for attempt in range(self.WRITE_ATTEMPTS):
+            try:
+                await self._insert(batch)
+                break
+            except Exception as e:
+                if attempt == self.WRITE_ATTEMPTS - 1:
+                    logger.error(
+                        f"Failed to write {len(batch)} audit events after "
+                        f"{self.WRITE_ATTEMPTS} attempts, writing them one by one: {e}",
+                        exc_info=True,
+                        extra={"count": len(batch)},
+                    )
+                    written = await self._write_rows(batch)
+                    break
+                delay = self.WRITE_RETRY_BASE_SECONDS * 2 ** attempt
+                logger.warning(
+                    f"Failed to write {len(batch)} audit events, retrying in {delay}s: {e}",
+                    extra={"count": len(batch), "attempt": attempt + 1},
+                )
+                await asyncio.sleep(delay)
+        
+        if self._sketches is not None and written:
+            await self._sketches.add(written)
+    
+    async def _write_rows(self, batch: list[dict]) -> list[dict]:
+        """Insert rows one per transaction, logging any that still fail.
+        
+        A failing row is logged in full, so it can be recovered from the logs.
+        
+        Args:
+            batch: AuditEvent column values
+            
+        Returns:
+            The rows that were written
+        """
+        written = []
+        for row in batch:
+            try:
+                await self._insert([row])
+                written.append(row)
+            except Exception as e:
+                logger.error(
+                    f"Failed to write audit event {row.get('id')}: {e}",
+                    exc_info=True,
+                    extra={"audit_event": row},
+                )
+        return written
+    
+    async def _insert(self, rows: list[dict]) -> None:
+        """Insert rows in a single transaction.
+        
+        Args:
+            rows: AuditEvent column values
+        """
+        async with self._session_factory() as session:
+            await session.execute(insert(AuditEvent.__table__), rows)
+            await session.commit()
+
+
+# Process-wide writer, started and stopped with the API application
+audit_writer = AuditEventWriter(sketches=unique_sketches)
+
+
+def _new_event_id() -> str:
+    """Generate a time-ordered audit event ID.
+    
+    A ULID rendered in UUID form: it fits the uuid id column, and sorting by
+    id follows creation order, so id doubles as a keyset cursor.
+    """
+    return str(ULID().to_uuid())
+
+
 class AuditService:
-    """Service for tracking audit events and compliance reporting."""
+    """Service for tracking audit events and compliance reporting.
+    
+    Bound to one session and tenant, typically for the span of a request,
+    with a logger adapter carrying the tenant context for every record.
+    """
+    
+    __slots__ = ("_session", "_tenant_id", "_log")
+    
+    def __init__(self, session: AsyncSession, tenant_id: str):
+        """Initialize the service.
+        
+        Args:
+            session: Database session
+            tenant_id: The tenant ID all events and queries are scoped to
+        """
+        self._session = session
+        self._tenant_id = tenant_id
+        self._log = logging.LoggerAdapter(logger, {"tenant_id": tenant_id})
+    
+    async def _record(self, row: dict) -> str:
+        """Hand an event to the write-behind queue, or insert it directly.
+        
+        Args:
+            row: AuditEvent column values, including a pre-assigned id
+            
+        Returns:
+            The audit event ID
+        """
+        if not audit_writer.enqueue(row):
+            await self._session.execute(insert(AuditEvent.__table__), [row])
+            await self._session.commit()
+            await unique_sketches.add([row])
+        return row["id"]
     
-    @staticmethod
     async def track_report_view(
-        session: AsyncSession,
-        tenant_id: str,
+        self,
         artifact_id: str,
         user_id: Optional[str] = None,
         ip_address: Optional[str] = None,
         user_agent: Optional[str] = None,
-    ) -> AuditEvent:
+    ) -> str:
         """Track when a report is viewed (signed URL accessed).
         
         Args:
-            session: Database session
-            tenant_id: The tenant ID
             artifact_id: The artifact being viewed
             user_id: Optional user ID who viewed the report
             ip_address: Optional IP address of viewer
             user_agent: Optional user agent string
             
         Returns:
-            Created AuditEvent record
+            The audit event ID
         """
-        event = AuditEvent(
-            id=f"audit_{datetime.now().strftime('%Y%m%d_%H%M%S%f')}",
-            tenant_id=tenant_id,
-            event_type="report_viewed",
-            event_metadata={
-                "artifact_id": artifact_id,
+        event_id = await self._record(
+            {
+                "id": _new_event_id(),
+                "tenant_id": self._tenant_id,
                 "user_id": user_id,
-                "ip_address": ip_address,
-                "user_agent": user_agent,
+                "event_type": "report_viewed",
+                "resource_type": "artifact",
+                "resource_id": artifact_id,
+                "event_data": {
+                    "artifact_id": artifact_id,
+                    "user_id": user_id,
+                    "ip_address": ip_address,
+                    "user_agent": user_agent,
+                },
+                "created_at": datetime.now(timezone.utc),
             },
-            created_at=datetime.now(timezone.utc),
         )
         
-        session.add(event)
-        await session.commit()
-        await session.refresh(event)
+        self._log.info(f"Tracked report view for artifact {artifact_id} by {user_id}")
         
-        logger.info(
-            f"Tracked report view for artifact {artifact_id}",
-            extra={
-                "tenant_id": tenant_id,
-                "artifact_id": artifact_id,
-                "user_id": user_id,
-            },
-        )
-        
-        return event
+        return event_id
     
-    @staticmethod
     async def track_report_download(
-        session: AsyncSession,
-        tenant_id: str,
+        self,
         artifact_id: str,
         user_id: Optional[str] = None,
         download_method: str = "direct_link",
-    ) -> AuditEvent:
+    ) -> str:
         """Track when a report is downloaded.
         
         Args:
-            session: Database session
-            tenant_id: The tenant ID
             artifact_id: The artifact being downloaded
             user_id: Optional user ID who downloaded
             download_method: How the report was downloaded
             
         Returns:
-            Created AuditEvent record
+            The audit event ID
         """
-        event = AuditEvent(
-            id=f"audit_{datetime.now().strftime('%Y%m%d_%H%M%S%f')}",
-            tenant_id=tenant_id,
-            event_type="report_downloaded",
-            event_metadata={
-                "artifact_id": artifact_id,
+        event_id = await self._record(
+            {
+                "id": _new_event_id(),
+                "tenant_id": self._tenant_id,
                 "user_id": user_id,
-                "download_method": download_method,
+                "event_type": "report_downloaded",
+                "resource_type": "artifact",
+                "resource_id": artifact_id,
+                "event_data": {
+                    "artifact_id": artifact_id,
+                    "user_id": user_id,
+                    "download_method": download_method,
+                },
+                "created_at": datetime.now(timezone.utc),
             },
-            created_at=datetime.now(timezone.utc),
         )
         
-        session.add(event)
-        await session.commit()
-        await session.refresh(event)
-        
-        logger.info(
-            f"Tracked report download for artifact {artifact_id}",
-            extra={
-                "tenant_id": tenant_id,
-                "artifact_id": artifact_id,
-                "user_id": user_id,
-            },
-        )
+        self._log.info(f"Tracked report download for artifact {artifact_id} by {user_id}")
         
-        return event
+        return event_id
     
-    @staticmethod
     async def track_report_shared(
-        session: AsyncSession,
-        tenant_id: str,
+        self,
         artifact_id: str,
         shared_by_user_id: str,
         shared_with: list[str],
         share_method: str = "email",
-    ) -> AuditEvent:
+    ) -> str:
         """Track when a report is shared.
         
         Args:
-            session: Database session
-            tenant_id: The tenant ID
             artifact_id: The artifact being shared
             shared_by_user_id: User ID who shared the report
             shared_with: List of recipients (emails or user IDs)
             share_method: How the report was shared
             
         Returns:
-            Created AuditEvent record
+            The audit event ID
         """
-        event = AuditEvent(
-            id=f"audit_{datetime.now().strftime('%Y%m%d_%H%M%S%f')}",
-            tenant_id=tenant_id,
-            event_type="report_shared",
-            event_metadata={
-                "artifact_id": artifact_id,
-                "shared_by_user_id": shared_by_user_id,
-                "shared_with": shared_with,
-                "share_method": share_method,
-                "recipient_count": len(shared_with),
+        event_id = await self._record(
+            {
+                "id": _new_event_id(),
+                "tenant_id": self._tenant_id,
+                "user_id": shared_by_user_id,
+                "event_type": "report_shared",
+                "resource_type": "artifact",
+                "resource_id": artifact_id,
+                "event_data": {
+                    "artifact_id": artifact_id,
+                    "shared_by_user_id": shared_by_user_id,
+                    "shared_with": shared_with,
+                    "share_method": share_method,
+                    "recipient_count": len(shared_with),
+                },
+                "created_at": datetime.now(timezone.utc),
             },
-            created_at=datetime.now(timezone.utc),
         )
         
-        session.add(event)
-        await session.commit()
-        await session.refresh(event)
-        
-        logger.info(
-            f"Tracked report share for artifact {artifact_id}",
-            extra={
-                "tenant_id": tenant_id,
-                "artifact_id": artifact_id,
-                "recipient_count": len(shared_with),
-            },
+        self._log.info(
+            f"Tracked report share for artifact {artifact_id} "
+            f"to {len(shared_with)} recipients"
         )
         
-        return event
+        return event_id
     
-    @staticmethod
     async def get_artifact_audit_trail(
-        session: AsyncSession,
+        self,
         artifact_id: str,
-        tenant_id: str,
         limit: int = 100,
     ) -> list[AuditEvent]:
         """Get audit trail for a specific artifact.
         
         Args:
-            session: Database session
             artifact_id: The artifact ID
-            tenant_id: The tenant ID
             limit: Max number of events to return
             
         Returns:
@@ -184,22 +491,21 @@ class AuditService:
         query = (
             select(AuditEvent)
             .where(
-                AuditEvent.tenant_id == tenant_id,
-                AuditEvent.event_metadata["artifact_id"].astext == artifact_id,
+                AuditEvent.tenant_id == self._tenant_id,
+                AuditEvent.resource_type == "artifact",
+                AuditEvent.resource_id == artifact_id,
             )
-            .order_by(desc(AuditEvent.created_at))
+            .order_by(desc(AuditEvent.id))
             .limit(limit)
         )
         
-        result = await session.execute(query)
+        result = await self._session.execute(query)
         events = result.scalars().all()
         
         return list(events)
     
-    @staticmethod
     async def get_user_activity(
-        session: AsyncSession,
-        tenant_id: str,
+        self,
         user_id: str,
         event_types: Optional[list[str]] = None,
         limit: int = 100,
@@ -207,8 +513,6 @@ class AuditService:
         """Get audit events for a specific user.
         
         Args:
-            session: Database session
-            tenant_id: The tenant ID
             user_id: The user ID
             event_types: Optional filter by event types
             limit: Max number of events to return
@@ -217,90 +521,136 @@ class AuditService:
             List of AuditEvent records
         """
         query = select(AuditEvent).where(
-            AuditEvent.tenant_id == tenant_id,
-            AuditEvent.event_metadata["user_id"].astext == user_id,
+            AuditEvent.tenant_id == self._tenant_id,
+            AuditEvent.user_id == user_id,
         )
         
         if event_types:
-            query = query.where(AuditEvent.event_type.in_(event_types))
+            # One array parameter keeps the SQL text identical for any number
+            # of types, so the prepared statement is reused
+            query = query.where(
+                AuditEvent.event_type
+                == any_(bindparam("event_types", event_types, type_=ARRAY(String)))
+            )
         
-        query = query.order_by(desc(AuditEvent.created_at)).limit(limit)
+        query = query.order_by(desc(AuditEvent.id)).limit(limit)
         
-        result = await session.execute(query)
+        result = await self._session.execute(query)
         events = result.scalars().all()
         
         return list(events)
     
-    @staticmethod
     async def generate_compliance_report(
-        session: AsyncSession,
-        tenant_id: str,
+        self,
         start_date: datetime,
         end_date: datetime,
+        include_events: bool = False,
+        cursor: Optional[str] = None,
+        limit: int = 500,
+        exact: bool = True,
     ) -> dict:
         """Generate compliance report for a date range.
         
+        Metrics are aggregated in the database; raw events are only loaded
+        when requested, one keyset page at a time. With exact=False, unique
+        users and artifacts are estimated from daily HyperLogLog sketches
+        instead of COUNT(DISTINCT), covering whole UTC days of the range.
+        
         Args:
-            session: Database session
-            tenant_id: The tenant ID
             start_date: Start of date range
             end_date: End of date range
+            include_events: Whether to include a page of raw events
+            cursor: ID of the last event from the previous page
+            limit: Max number of events per page (max: 500)
+            exact: Whether unique counts must be exact (SQL) or may be estimated
             
         Returns:
-            Dict with compliance metrics
+            Dict with compliance metrics, plus events and next_cursor if requested
         """
-        query = select(AuditEvent).where(
-            AuditEvent.tenant_id == tenant_id,
+        in_range = (
+            AuditEvent.tenant_id == self._tenant_id,
             AuditEvent.created_at >= start_date,
             AuditEvent.created_at <= end_date,
         )
         
-        result = await session.execute(query)
-        events = result.scalars().all()
-        
-        # Aggregate metrics
-        event_counts = {}
-        unique_users = set()
-        unique_artifacts = set()
+        counts_result = await self._session.execute(
+            select(AuditEvent.event_type, func.count())
+            .where(*in_range)
+            .group_by(AuditEvent.event_type)
+        )
+        event_counts = dict(counts_result.all())
         
-        for event in events:
-            # Count by event type
-            event_type = event.event_type
-            event_counts[event_type] = event_counts.get(event_type, 0) + 1
-            
-            # Track unique users
-            user_id = event.event_metadata.get("user_id")
-            if user_id:
-                unique_users.add(user_id)
-            
-            # Track unique artifacts
-            artifact_id = event.event_metadata.get("artifact_id")
-            if artifact_id:
-                unique_artifacts.add(artifact_id)
+        if exact:
+            unique_users = await self._session.scalar(
+                select(func.count(distinct(AuditEvent.user_id))).where(*in_range)
+            )
+            unique_artifacts = await self._session.scalar(
+                select(func.count(distinct(AuditEvent.resource_id))).where(
+                    *in_range, AuditEvent.resource_type == "artifact"
+                )
+            )
+        else:
+            unique_users = await unique_sketches.count(
+                "users", self._tenant_id, start_date, end_date
+            )
+            unique_artifacts = await unique_sketches.count(
+                "artifacts", self._tenant_id, start_date, end_date
+            )
         
-        return {
-            "tenant_id": tenant_id,
+        report = {
+            "tenant_id": self._tenant_id,
             "start_date": start_date.isoformat(),
             "end_date": end_date.isoformat(),
-            "total_events": len(events),
+            "total_events": sum(event_counts.values()),
             "event_counts": event_counts,
-            "unique_users": len(unique_users),
-            "unique_artifacts": len(unique_artifacts),
-            "events": [
-                {
-                    "id": e.id,
-                    "event_type": e.event_type,
-                    "created_at": e.created_at.isoformat(),
-                    "metadata": e.event_metadata,
-                }
-                for e in events
-            ],
+            "unique_users": unique_users or 0,
+            "unique_artifacts": unique_artifacts or 0,
+            "unique_counts_exact": exact,
         }
+        
+        if not include_events:
+            return report
+        
+        limit = min(limit, 500)
+        # Plain column rows: no ORM identity map or instance construction
+        query = select(
+            AuditEvent.id,
+            AuditEvent.event_type,
+            AuditEvent.created_at,
+            AuditEvent.event_data,
+        ).where(*in_range)
+        if cursor:
+            query = query.where(AuditEvent.id < cursor)
+        query = query.order_by(desc(AuditEvent.id)).limit(limit + 1)
+        
+        result = await self._session.execute(query)
+        rows = result.all()
+        
+        next_cursor: Optional[str] = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = str(rows[-1].id)
+        
+        report["events"] = [
+            {
+                "id": str(event_id),
+                "event_type": event_type,
+                "created_at": created_at.isoformat(),
+                "metadata": event_data,
+            }
+            for event_id, event_type, created_at, event_data in rows
+        ]
+        report["next_cursor"] = next_cursor
+        
+        return report
 
 
 class ArtifactRetentionService:
     """Service for managing artifact retention and cleanup."""
     
+    # Max blob deletions in flight at once
+    BLOB_DELETE_CONCURRENCY = 32
+    
     @staticmethod
     async def find_expired_artifacts(
         session: AsyncSession,
@@ -317,6 +667,40 @@ class ArtifactRetentionService:
         Returns:
             List of expired Artifact records
         """
+        artifacts = []
+        async for chunk in ArtifactRetentionService.iter_expired_artifacts(
+            session, tenant_id, retention_days
+        ):
+            artifacts.extend(chunk)
+        
+        logger.info(
+            f"Found {len(artifacts)} expired artifacts (retention: {retention_days} days)",
+            extra={"tenant_id": tenant_id, "count": len(artifacts)},
+        )
+        
+        return artifacts
+    
+    @staticmethod
+    async def iter_expired_artifacts(
+        session: AsyncSession,
+        tenant_id: Optional[str] = None,
+        retention_days: int = 90,
+        chunk_size: int = 1000,
+    ) -> AsyncIterator[list[Artifact]]:
+        """Stream artifacts that have exceeded retention period in chunks.
+        
+        Rows are fetched through a server-side cursor, so memory stays
+        bounded by chunk_size regardless of how many artifacts expired.
+        
+        Args:
+            session: Database session
+            tenant_id: Optional tenant ID to filter by
+            retention_days: Number of days to retain artifacts
+            chunk_size: Number of artifacts per yielded chunk
+            
+        Yields:
+            Lists of up to chunk_size expired Artifact records
+        """
         cutoff_date = datetime.now(timezone.utc) - timedelta(days=retention_days)
         
         query = select(Artifact).where(Artifact.created_at < cutoff_date)
@@ -324,15 +708,11 @@ class ArtifactRetentionService:
         if tenant_id:
             query = query.where(Artifact.tenant_id == tenant_id)
         
-        result = await session.execute(query)
-        artifacts = result.scalars().all()
-        
-        logger.info(
-            f"Found {len(artifacts)} expired artifacts (retention: {retention_days} days)",
-            extra={"tenant_id": tenant_id, "count": len(artifacts)},
+        result = await session.stream_scalars(
+            query.execution_options(yield_per=chunk_size)
         )
-        
-        return list(artifacts)
+        async for chunk in result.partitions(chunk_size):
+            yield list(chunk)
     
     @staticmethod
     async def delete_expired_artifacts(
@@ -354,59 +734,102 @@ class ArtifactRetentionService:
         Returns:
             Dict with deletion results
         """
-        from datetime import timedelta
-        
-        expired_artifacts = await ArtifactRetentionService.find_expired_artifacts(
-            session, tenant_id, retention_days
-        )
-        
+        total_expired = 0
         deleted_count = 0
         failed_count = 0
         total_size_bytes = 0
         
-        for artifact in expired_artifacts:
-            total_size_bytes += artifact.file_size_bytes
+        # Each chunk is processed while the cursor produces the next one
+        async for chunk in ArtifactRetentionService.iter_expired_artifacts(
+            session, tenant_id, retention_days
+        ):
+            total_expired += len(chunk)
+            total_size_bytes += sum(artifact.file_size_bytes for artifact in chunk)
             
             if dry_run:
-                logger.info(
-                    f"[DRY RUN] Would delete artifact {artifact.id} ({artifact.blob_path})"
-                )
-                deleted_count += 1
+                for artifact in chunk:
+                    logger.info(
+                        f"[DRY RUN] Would delete artifact {artifact.id} ({artifact.blob_path})"
+                    )
+                deleted_count += len(chunk)
                 continue
             
-            try:
-                # Delete from blob storage
-                blob_storage_service.delete_artifact(artifact.blob_path)
-                
-                # Delete from database
-                await session.delete(artifact)
-                
-                deleted_count += 1
-                
-                logger.info(
-                    f"Deleted expired artifact {artifact.id}",
-                    extra={
-                        "artifact_id": artifact.id,
-                        "blob_path": artifact.blob_path,
-                        "size_bytes": artifact.file_size_bytes,
-                    },
-                )
-                
-            except Exception as e:
-                failed_count += 1
-                logger.error(
-                    f"Failed to delete artifact {artifact.id}: {e}",
-                    exc_info=True,
+            deleted_ids = await ArtifactRetentionService._delete_blobs(
+                blob_storage_service, chunk
+            )
+            deleted_count += len(deleted_ids)
+            failed_count += len(chunk) - len(deleted_ids)
+            
+            # Remove every artifact in the chunk whose blob is gone in one statement
+            if deleted_ids:
+                await session.execute(
+                    delete(Artifact).where(
+                        Artifact.id
+                        == any_(bindparam("ids", deleted_ids, type_=ARRAY(Artifact.id.type)))
+                    )
                 )
         
+        logger.info(
+            f"Found {total_expired} expired artifacts (retention: {retention_days} days)",
+            extra={"tenant_id": tenant_id, "count": total_expired},
+        )
+        
         if not dry_run:
             await session.commit()
         
         return {
-            "total_expired": len(expired_artifacts),
+            "total_expired": total_expired,
             "deleted_count": deleted_count,
             "failed_count": failed_count,
             "total_size_bytes": total_size_bytes,
             "total_size_mb": round(total_size_bytes / 1024 / 1024, 2),
             "dry_run": dry_run,
         }
+    
+    @staticmethod
+    async def _delete_blobs(
+        blob_storage_service, artifacts: list[Artifact]
+    ) -> list[uuid.UUID]:
+        """Delete artifact blobs concurrently.
+        
+        Deletions are awaited concurrently on the event loop, bounded by
+        BLOB_DELETE_CONCURRENCY.
+        
+        Args:
+            blob_storage_service: BlobStorageService instance
+            artifacts: Artifacts whose blobs should be deleted
+            
+        Returns:
+            IDs of artifacts whose blobs were deleted (or already absent)
+        """
+        semaphore = asyncio.Semaphore(ArtifactRetentionService.BLOB_DELETE_CONCURRENCY)
+        
+        async def _delete(artifact: Artifact) -> None:
+            async with semaphore:
+                await blob_storage_service.delete_artifact(artifact.blob_path)
+        
+        results = await asyncio.gather(
+            *(_delete(artifact) for artifact in artifacts),
+            return_exceptions=True,
+        )
+        
+        deleted_ids: list[uuid.UUID] = []
+        for artifact, result in zip(artifacts, results, strict=True):
+            if isinstance(result, Exception):
+                logger.error(
+                    f"Failed to delete artifact {artifact.id}: {result}",
+                    exc_info=result,
+                )
+                continue
+            
+            deleted_ids.append(artifact.id)
+            logger.info(
+                f"Deleted expired artifact {artifact.id}",
+                extra={
+                    "artifact_id": artifact.id,
+                    "blob_path": artifact.blob_path,
+                    "size_bytes": artifact.file_size_bytes,
+                },
+            )
+        
+        return deleted_ids
@@ -1,7 +1,9 @@
 """Burst protection service to prevent resource exhaustion."""
 
+import asyncio
 import logging
-from datetime import datetime, timezone
+import time
+from functools import lru_cache
 from typing import Optional
 
 from redis.asyncio import Redis
@@ -9,10 +11,25 @@ from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.config import settings
-from src.infrastructure.database.models import ExecutionRun
+from src.infrastructure.database.models import ExecutionRun, TenantConcurrency
 
 logger = logging.getLogger(__name__)
 
+# Process-wide short-lived counts: tenant_id -> (tenant_running, global_running, expires_at).
+# Services are created per scheduling decision, so the cache lives at module scope.
+_count_cache: dict[str, tuple[int, int, float]] = {}
+# In-flight cache refills by tenant, so concurrent misses for one tenant share a read
+_count_loads: dict[str, asyncio.Future] = {}
+
+_COUNTER_PREFIX = "concurrent_executions:"
+_GLOBAL_COUNTER_KEY = f"{_COUNTER_PREFIX}global"
+
+
+@lru_cache(maxsize=4096)
+def _tenant_counter_key(tenant_id: str) -> str:
+    """Return the Redis counter key for a tenant (formatted once per tenant)."""
+    return f"{_COUNTER_PREFIX}tenant:{tenant_id}"
+
 
 class BurstProtectionService:
     """Service to enforce concurrency limits and prevent resource exhaustion."""
@@ -22,7 +39,34 @@ class BurstProtectionService:
     DEFAULT_MAX_CONCURRENT_GLOBAL = 50
     
     LOCK_PREFIX = "burst_protection:"
-    COUNTER_PREFIX = "concurrent_executions:"
+    COUNTER_PREFIX = _COUNTER_PREFIX
+    # tenant_concurrency is authoritative. Counters expire this long after
+    # they were seeded from it (increments never extend the expiry), so drift
+    # such as a worker dying between INCR and DECR lasts at most this long.
+    COUNTER_TTL_SECONDS = 60
+    
+    # How long counts read from Redis are reused in-process; bursts of checks
+    # for one tenant within this window cost a single round trip
+    COUNT_CACHE_TTL_SECONDS = 0.05
+    
+    # KEYS: tenant counter, global counter. Only seeded counters are
+    # incremented; a missing one is re-seeded from the table on next read.
+    INCREMENT_LUA = """
+for _, key in ipairs(KEYS) do
+    if redis.call('EXISTS', key) == 1 then
+        redis.call('INCR', key)
+    end
+end
+"""
+    
+    # KEYS: tenant counter, global counter. Never decrements below zero.
+    DECREMENT_LUA = """
+for _, key in ipairs(KEYS) do
+    if tonumber(redis.call('GET', key) or '0') > 0 then
+        redis.call('DECR', key)
+    end
+end
+"""
     
     def __init__(self, redis_client: Optional[Redis] = None):
         """Initialize burst protection service.
@@ -31,44 +75,58 @@ class BurstProtectionService:
             redis_client: Optional Redis client
         """
         self._redis = redis_client
+        self._increment_script = None
+        self._decrement_script = None
     
     async def _get_redis(self) -> Redis:
-        """Get or create Redis client."""
+        """Get or create Redis client and register the counter scripts."""
         if self._redis is None:
             self._redis = Redis.from_url(
                 settings.REDIS_URL,
                 encoding="utf-8",
                 decode_responses=True,
             )
+        if self._increment_script is None:
+            # Scripts run via EVALSHA, falling back to EVAL if not yet cached
+            self._increment_script = self._redis.register_script(self.INCREMENT_LUA)
+            self._decrement_script = self._redis.register_script(self.DECREMENT_LUA)
         return self._redis
     
+    def _counter_keys(self, tenant_id: str) -> list[str]:
+        """Return the [tenant, global] counter keys."""
+        return [_tenant_counter_key(tenant_id), _GLOBAL_COUNTER_KEY]
+    
     async def check_can_execute(
         self,
         tenant_id: str,
         max_concurrent_per_tenant: Optional[int] = None,
         max_concurrent_global: Optional[int] = None,
+        session: Optional[AsyncSession] = None,
     ) -> tuple[bool, Optional[str]]:
         """Check if a new execution can be started.
         
+        Redis counters are the fast path. When they are missing (cold start
+        or every COUNTER_TTL_SECONDS) and a session is given, the
+        trigger-maintained tenant_concurrency table is used instead and
+        Redis is re-seeded from it.
+        Counts are reused in-process for COUNT_CACHE_TTL_SECONDS.
+        
         Args:
             tenant_id: The tenant ID
             max_concurrent_per_tenant: Max concurrent executions per tenant
             max_concurrent_global: Max concurrent executions globally
+            session: Optional database session for the cold-start fallback
             
         Returns:
             Tuple of (can_execute, reason_if_not)
         """
-        redis = await self._get_redis()
-        
         max_tenant = max_concurrent_per_tenant or self.DEFAULT_MAX_CONCURRENT_PER_TENANT
         max_global = max_concurrent_global or self.DEFAULT_MAX_CONCURRENT_GLOBAL
         
         try:
-            # Check tenant limit
-            tenant_key = f"{self.COUNTER_PREFIX}tenant:{tenant_id}"
-            tenant_count = await redis.get(tenant_key)
-            tenant_running = int(tenant_count) if tenant_count else 0
+            tenant_running, global_running = await self._get_counts(tenant_id, session)
             
+            # Check tenant limit
             if tenant_running >= max_tenant:
                 reason = (
                     f"Tenant {tenant_id} has reached max concurrent executions "
@@ -78,10 +136,6 @@ class BurstProtectionService:
                 return False, reason
             
             # Check global limit
-            global_key = f"{self.COUNTER_PREFIX}global"
-            global_count = await redis.get(global_key)
-            global_running = int(global_count) if global_count else 0
-            
             if global_running >= max_global:
                 reason = (
                     f"Global max concurrent executions reached "
@@ -90,6 +144,7 @@ class BurstProtectionService:
                 logger.warning(reason)
                 return False, reason
             
+            self._record_pending_start(tenant_id)
             return True, None
             
         except Exception as e:
@@ -97,25 +152,208 @@ class BurstProtectionService:
             # Fail open - allow execution if check fails
             return True, None
     
+    async def check_can_execute_many(
+        self,
+        tenant_ids: list[str],
+        max_concurrent_per_tenant: Optional[int] = None,
+        max_concurrent_global: Optional[int] = None,
+        session: Optional[AsyncSession] = None,
+    ) -> list[tuple[bool, Optional[str]]]:
+        """Check a batch of prospective executions with one Redis read.
+        
+        Counters for every distinct tenant plus the global counter are
+        fetched in a single MGET. Decisions are then made in input order,
+        each admitted execution counting against the limits for the ones
+        after it, so a batch never over-admits a tenant or the cluster.
+        
+        Args:
+            tenant_ids: The tenant ID of each prospective execution
+            max_concurrent_per_tenant: Max concurrent executions per tenant
+            max_concurrent_global: Max concurrent executions globally
+            session: Optional database session for the cold-start fallback
+            
+        Returns:
+            One (can_execute, reason_if_not) tuple per entry in tenant_ids
+        """
+        if not tenant_ids:
+            return []
+        
+        max_tenant = max_concurrent_per_tenant or self.DEFAULT_MAX_CONCURRENT_PER_TENANT
+        max_global = max_concurrent_global or self.DEFAULT_MAX_CONCURRENT_GLOBAL
+        
+        try:
+            tenant_running, global_running = await self._get_counts_many(
+                list(dict.fromkeys(tenant_ids)), session
+            )
+        except Exception as e:
+            logger.error(f"Failed to check burst protection: {e}", exc_info=True)
+            # Fail open - allow execution if check fails
+            return [(True, None)] * len(tenant_ids)
+        
+        decisions: list[tuple[bool, Optional[str]]] = []
+        for tenant_id in tenant_ids:
+            running = tenant_running[tenant_id]
+            if running >= max_tenant:
+                reason = (
+                    f"Tenant {tenant_id} has reached max concurrent executions "
+                    f"({running}/{max_tenant})"
+                )
+                logger.warning(reason)
+                decisions.append((False, reason))
+            elif global_running >= max_global:
+                reason = (
+                    f"Global max concurrent executions reached "
+                    f"({global_running}/{max_global})"
+                )
+                logger.warning(reason)
+                decisions.append((False, reason))
+            else:
+                tenant_running[tenant_id] = running + 1
+                global_running += 1
+                decisions.append((True, None))
+        
+        # Later single checks in the cache window see this batch's admissions
+        expires_at = time.monotonic() + self.COUNT_CACHE_TTL_SECONDS
+        for tenant_id, running in tenant_running.items():
+            _count_cache[tenant_id] = (running, global_running, expires_at)
+        
+        return decisions
+    
+    async def _get_counts_many(
+        self,
+        tenant_ids: list[str],
+        session: Optional[AsyncSession] = None,
+    ) -> tuple[dict[str, int], int]:
+        """Read the counters of several tenants and the global one at once.
+        
+        Args:
+            tenant_ids: Distinct tenant IDs
+            session: Optional database session for the cold-start fallback
+            
+        Returns:
+            Tuple of (tenant_id -> tenant_running, global_running)
+        """
+        redis = await self._get_redis()
+        
+        keys = [_tenant_counter_key(tenant_id) for tenant_id in tenant_ids]
+        keys.append(_GLOBAL_COUNTER_KEY)
+        *tenant_counts, global_count = await redis.mget(keys)
+        
+        tenant_running: dict[str, int] = {}
+        global_running = int(global_count) if global_count else 0
+        for tenant_id, tenant_count in zip(tenant_ids, tenant_counts, strict=True):
+            if (tenant_count is None or global_count is None) and session is not None:
+                # Cold start for this tenant: same fallback as a single check
+                tenant_running[tenant_id], global_running = await self._load_counts_from_db(
+                    session, tenant_id
+                )
+                global_count = str(global_running)
+            else:
+                tenant_running[tenant_id] = int(tenant_count) if tenant_count else 0
+        
+        return tenant_running, global_running
+    
+    async def _get_counts(
+        self,
+        tenant_id: str,
+        session: Optional[AsyncSession] = None,
+    ) -> tuple[int, int]:
+        """Get (tenant_running, global_running), reusing recent in-process reads.
+        
+        Args:
+            tenant_id: The tenant ID
+            session: Optional database session for the cold-start fallback
+            
+        Returns:
+            Tuple of (tenant_running, global_running)
+        """
+        cached = _count_cache.get(tenant_id)
+        if cached is not None and time.monotonic() < cached[2]:
+            return cached[0], cached[1]
+        
+        # Concurrent misses for a tenant wait for its first reader instead of
+        # each going to Redis; other tenants' reads are not held up
+        pending = _count_loads.get(tenant_id)
+        if pending is not None:
+            return await asyncio.shield(pending)
+        
+        pending = asyncio.get_running_loop().create_future()
+        _count_loads[tenant_id] = pending
+        try:
+            counts = await self._read_counts(tenant_id, session)
+        except Exception as e:
+            pending.set_exception(e)
+            # Mark it retrieved so a load without waiters logs nothing
+            pending.exception()
+            raise
+        else:
+            pending.set_result(counts)
+            return counts
+        finally:
+            if not pending.done():
+                pending.cancel()
+            _count_loads.pop(tenant_id, None)
+    
+    async def _read_counts(
+        self,
+        tenant_id: str,
+        session: Optional[AsyncSession] = None,
+    ) -> tuple[int, int]:
+        """Read a tenant's counts from Redis (or the DB) and cache them.
+        
+        Args:
+            tenant_id: The tenant ID
+            session: Optional database session for the cold-start fallback
+            
+        Returns:
+            Tuple of (tenant_running, global_running)
+        """
+        redis = await self._get_redis()
+        
+        # Read both counters in one round trip
+        tenant_count, global_count = await redis.mget(self._counter_keys(tenant_id))
+        
+        if (tenant_count is None or global_count is None) and session is not None:
+            tenant_running, global_running = await self._load_counts_from_db(
+                session, tenant_id
+            )
+        else:
+            tenant_running = int(tenant_count) if tenant_count else 0
+            global_running = int(global_count) if global_count else 0
+        
+        _count_cache[tenant_id] = (
+            tenant_running,
+            global_running,
+            time.monotonic() + self.COUNT_CACHE_TTL_SECONDS,
+        )
+        return tenant_running, global_running
+    
+    @staticmethod
+    def _record_pending_start(tenant_id: str) -> None:
+        """Count an allowed execution in the cached counts (best effort).
+        
+        The worker's Redis INCR stays authoritative; this only keeps later
+        checks in the same cache window from over-admitting.
+        
+        Args:
+            tenant_id: The tenant ID
+        """
+        cached = _count_cache.get(tenant_id)
+        if cached is not None:
+            _count_cache[tenant_id] = (cached[0] + 1, cached[1] + 1, cached[2])
+    
     async def increment_execution_count(self, tenant_id: str) -> None:
         """Increment execution counters when starting an execution.
         
         Args:
             tenant_id: The tenant ID
         """
-        redis = await self._get_redis()
+        await self._get_redis()
         
         try:
-            tenant_key = f"{self.COUNTER_PREFIX}tenant:{tenant_id}"
-            global_key = f"{self.COUNTER_PREFIX}global"
-            
-            # Increment counters
-            await redis.incr(tenant_key)
-            await redis.incr(global_key)
-            
-            # Set expiry to prevent stale counters (1 hour)
-            await redis.expire(tenant_key, 3600)
-            await redis.expire(global_key, 3600)
+            # Increment both counters atomically in one round trip, keeping
+            # their expiry so they are re-seeded from the table on schedule
+            await self._increment_script(keys=self._counter_keys(tenant_id))
             
             logger.debug(f"Incremented execution count for tenant {tenant_id}")
             
@@ -128,20 +366,12 @@ class BurstProtectionService:
         Args:
             tenant_id: The tenant ID
         """
-        redis = await self._get_redis()
+        await self._get_redis()
         
         try:
-            tenant_key = f"{self.COUNTER_PREFIX}tenant:{tenant_id}"
-            global_key = f"{self.COUNTER_PREFIX}global"
-            
-            # Decrement counters (but not below 0)
-            tenant_count = await redis.get(tenant_key)
-            if tenant_count and int(tenant_count) > 0:
-                await redis.decr(tenant_key)
-            
-            global_count = await redis.get(global_key)
-            if global_count and int(global_count) > 0:
-                await redis.decr(global_key)
+            # Decrement counters (but not below 0) atomically in one round trip
+            await self._decrement_script(keys=self._counter_keys(tenant_id))
+            _count_cache.pop(tenant_id, None)
             
             logger.debug(f"Decremented execution count for tenant {tenant_id}")
             
@@ -164,17 +394,15 @@ class BurstProtectionService:
         try:
             result = {}
             
-            # Get global count
-            global_key = f"{self.COUNTER_PREFIX}global"
-            global_count = await redis.get(global_key)
-            result["global_running"] = int(global_count) if global_count else 0
-            
-            # Get tenant count if specified
             if tenant_id:
-                tenant_key = f"{self.COUNTER_PREFIX}tenant:{tenant_id}"
-                tenant_count = await redis.get(tenant_key)
+                # Fetch tenant and global counts in one round trip
+                tenant_count, global_count = await redis.mget(self._counter_keys(tenant_id))
                 result["tenant_running"] = int(tenant_count) if tenant_count else 0
                 result["tenant_id"] = tenant_id
+            else:
+                global_count = await redis.get(_GLOBAL_COUNTER_KEY)
+            
+            result["global_running"] = int(global_count) if global_count else 0
             
             return result
             
@@ -215,57 +443,48 @@ class BurstProtectionService:
             logger.error(f"Failed to get running executions from DB: {e}", exc_info=True)
             return []
     
-    async def sync_counters_with_db(self, session: AsyncSession) -> dict:
-        """Sync Redis counters with actual database state.
-        
-        This can be run periodically to correct any drift between Redis and DB.
+    async def _load_counts_from_db(
+        self,
+        session: AsyncSession,
+        tenant_id: str,
+    ) -> tuple[int, int]:
+        """Read in-flight counts from tenant_concurrency and seed Redis.
         
         Args:
             session: Database session
+            tenant_id: The tenant ID
             
         Returns:
-            Dict with sync results
+            Tuple of (tenant_running, global_running)
         """
-        redis = await self._get_redis()
-        
-        try:
-            # Get actual running count from database
-            query = select(
-                ExecutionRun.tenant_id,
-                func.count(ExecutionRun.id).label("count"),
-            ).where(
-                ExecutionRun.status.in_(["pending", "running"])
-            ).group_by(
-                ExecutionRun.tenant_id
-            )
-            
-            result = await session.execute(query)
-            tenant_counts = {row.tenant_id: row.count for row in result}
-            
-            # Update Redis counters
-            for tenant_id, count in tenant_counts.items():
-                tenant_key = f"{self.COUNTER_PREFIX}tenant:{tenant_id}"
-                await redis.set(tenant_key, count, ex=3600)
-            
-            # Update global count
-            total_running = sum(tenant_counts.values())
-            global_key = f"{self.COUNTER_PREFIX}global"
-            await redis.set(global_key, total_running, ex=3600)
-            
-            logger.info(
-                f"Synced burst protection counters: {len(tenant_counts)} tenants, "
-                f"{total_running} total running"
+        tenant_count = await session.scalar(
+            select(TenantConcurrency.running_count).where(
+                TenantConcurrency.tenant_id == tenant_id
             )
-            
-            return {
-                "tenants_synced": len(tenant_counts),
-                "total_running": total_running,
-                "tenant_counts": tenant_counts,
-            }
-            
-        except Exception as e:
-            logger.error(f"Failed to sync counters with DB: {e}", exc_info=True)
-            return {"tenants_synced": 0, "total_running": 0}
+        )
+        global_count = await session.scalar(
+            select(func.coalesce(func.sum(TenantConcurrency.running_count), 0))
+        )
+        tenant_running = int(tenant_count or 0)
+        global_running = int(global_count or 0)
+        
+        # Overwrite whatever Redis holds; the table is authoritative
+        tenant_key, global_key = self._counter_keys(tenant_id)
+        async with self._redis.pipeline(transaction=False) as pipe:
+            pipe.set(tenant_key, tenant_running, ex=self.COUNTER_TTL_SECONDS)
+            pipe.set(global_key, global_running, ex=self.COUNTER_TTL_SECONDS)
+            await pipe.execute()
+        
+        logger.info(
+            f"Loaded execution counts from database for tenant {tenant_id}",
+            extra={
+                "tenant_id": tenant_id,
+                "tenant_running": tenant_running,
+                "global_running": global_running,
+            },
+        )
+        
+        return tenant_running, global_running
     
     async def close(self):
         """Close Redis connection."""
@@ -2,22 +2,30 @@
 
 import uuid
 from datetime import datetime, timezone
+from types import MappingProxyType
 from typing import Optional
 
+from ulid import ULID
+
 from src.domain.interfaces.schedule_repository import IScheduleRepository
 from src.infrastructure.database.models import Schedule
-from src.utils.cron import calculate_next_run, validate_cron_expression
+from src.utils.cron import compile_cron, next_run_from
+
+# Tier-based quota limits, built once and read-only
+_SCHEDULE_LIMITS = MappingProxyType({
+    "standard": 10,
+    "premium": 50,
+    "enterprise": 200,
+})
+_DEFAULT_SCHEDULE_LIMIT = 10
 
 
 class ScheduleService:
     """Service for schedule business logic and orchestration."""
 
-    # Tier-based quota limits
-    SCHEDULE_LIMITS = {
-        "standard": 10,
-        "premium": 50,
-        "enterprise": 200,
-    }
+    __slots__ = ("_repository",)
+
+    SCHEDULE_LIMITS = _SCHEDULE_LIMITS
 
     def __init__(self, repository: IScheduleRepository):
         """Initialize service with repository dependency.
@@ -29,12 +37,12 @@ class ScheduleService:
 
     async def create_schedule(
         self,
-        tenant_id: str,
+        tenant_id: uuid.UUID,
         tenant_tier: str,
-        report_definition_id: str,
+        report_definition_id: uuid.UUID,
         name: str,
         cron_expression: str,
-        timezone: str,
+        tz_name: str,
         email_delivery_config: Optional[dict],
         created_by: str,
     ) -> tuple[Optional[Schedule], Optional[str]]:
@@ -46,7 +54,7 @@ class ScheduleService:
             report_definition_id: The report definition to schedule
             name: The schedule name
             cron_expression: The cron expression (e.g., "0 9 * * *")
-            timezone: The timezone string (e.g., "America/New_York")
+            tz_name: The timezone string (e.g., "America/New_York")
             email_delivery_config: Optional email configuration with recipients/subject
             created_by: The user ID creating the schedule
             
@@ -54,8 +62,16 @@ class ScheduleService:
             Tuple of (created_schedule, error_message)
             error_message is None if successful
         """
+        # Validate cron expression and timezone once, then reuse the parse.
+        # This is in-process and cached, so it runs before the quota query:
+        # invalid requests are rejected without a database round trip.
+        try:
+            compiled = compile_cron(cron_expression, tz_name)
+        except ValueError as e:
+            return None, str(e)
+
         # Check tenant quota
-        schedule_limit = self.SCHEDULE_LIMITS.get(tenant_tier, 10)
+        schedule_limit = _SCHEDULE_LIMITS.get(tenant_tier, _DEFAULT_SCHEDULE_LIMIT)
         current_count = await self._repository.count_by_tenant_id(
             tenant_id=tenant_id,
             is_active=True,
@@ -63,44 +79,105 @@ class ScheduleService:
         if current_count >= schedule_limit:
             return None, f"Schedule limit reached ({schedule_limit} for {tenant_tier} tier)"
 
-        # Validate cron expression
-        is_valid, error = validate_cron_expression(cron_expression)
-        if not is_valid:
-            return None, error
-
         # Calculate next run time
-        try:
-            next_run_at = calculate_next_run(
-                cron_expr=cron_expression,
-                tz=timezone,
-            )
-        except ValueError as e:
-            return None, str(e)
+        next_run_at = next_run_from(compiled)
 
         # Create schedule entity
+        now = datetime.now(timezone.utc)
         schedule = Schedule(
-            id=str(uuid.uuid4()),
+            id=ULID().to_uuid(),
             tenant_id=tenant_id,
             report_definition_id=report_definition_id,
             name=name,
             cron_expression=cron_expression,
-            timezone=timezone,
+            timezone=tz_name,
             is_active=True,
             next_run_at=next_run_at,
+            last_run_at=None,
             email_delivery_config=email_delivery_config,
             created_by=created_by,
-            created_at=datetime.now(timezone.utc),
-            updated_at=datetime.now(timezone.utc),
+            created_at=now,
+            updated_at=now,
         )
 
         # Persist to database
         created = await self._repository.create(schedule)
         return created, None
 
+    async def create_schedules_bulk(
+        self,
+        tenant_id: uuid.UUID,
+        tenant_tier: str,
+        schedules: list[dict],
+        created_by: str,
+    ) -> tuple[list[Schedule], Optional[str]]:
+        """Create many schedules at once, e.g. for an import.
+        
+        All-or-nothing: every entry is validated, then the quota is checked
+        once for the whole batch and all rows are inserted in one batch.
+        
+        Args:
+            tenant_id: The tenant unique identifier
+            tenant_tier: The tenant tier (standard/premium/enterprise)
+            schedules: Dicts with report_definition_id, name, cron_expression,
+                timezone and optional email_delivery_config
+            created_by: The user ID creating the schedules
+            
+        Returns:
+            Tuple of (created_schedules, error_message)
+            error_message is None if successful
+        """
+        if not schedules:
+            return [], None
+
+        # Validate every entry before touching the database
+        next_runs = []
+        for index, entry in enumerate(schedules):
+            try:
+                compiled = compile_cron(entry["cron_expression"], entry["timezone"])
+            except ValueError as e:
+                return [], f"Schedule {index}: {e}"
+            next_runs.append(next_run_from(compiled))
+
+        # Check tenant quota once for the whole batch
+        schedule_limit = _SCHEDULE_LIMITS.get(tenant_tier, _DEFAULT_SCHEDULE_LIMIT)
+        current_count = await self._repository.count_by_tenant_id(
+            tenant_id=tenant_id,
+            is_active=True,
+        )
+        if current_count + len(schedules) > schedule_limit:
+            return [], (
+                f"Schedule limit reached ({schedule_limit} for {tenant_tier} tier, "
+                f"{current_count} existing, {len(schedules)} requested)"
+            )
+
+        now = datetime.now(timezone.utc)
+        entities = [
+            Schedule(
+                id=ULID().to_uuid(),
+                tenant_id=tenant_id,
+                report_definition_id=entry["report_definition_id"],
+                name=entry["name"],
+                cron_expression=entry["cron_expression"],
+                timezone=entry["timezone"],
+                is_active=True,
+                next_run_at=next_run_at,
+                last_run_at=None,
+                email_delivery_config=entry.get("email_delivery_config"),
+                created_by=created_by,
+                created_at=now,
+                updated_at=now,
+            )
+            for entry, next_run_at in zip(schedules, next_runs, strict=True)
+        ]
+
+        created = await self._repository.bulk_create(entities)
+        return created, None
+
     async def get_schedule(
         self,
-        schedule_id: str,
-        tenant_id: str,
+        schedule_id: uuid.UUID,
+        tenant_id: uuid.UUID,
     ) -> Optional[Schedule]:
         """Get a schedule by ID.
         
@@ -118,7 +195,7 @@ class ScheduleService:
 
     async def list_schedules(
         self,
-        tenant_id: str,
+        tenant_id: uuid.UUID,
         cursor: Optional[str] = None,
         limit: int = 20,
         is_active: Optional[bool] = None,
@@ -143,11 +220,11 @@ class ScheduleService:
 
     async def update_schedule(
         self,
-        schedule_id: str,
-        tenant_id: str,
+        schedule_id: uuid.UUID,
+        tenant_id: uuid.UUID,
         name: Optional[str] = None,
         cron_expression: Optional[str] = None,
-        timezone: Optional[str] = None,
+        tz_name: Optional[str] = None,
         email_delivery_config: Optional[dict] = None,
     ) -> tuple[Optional[Schedule], Optional[str]]:
         """Update an existing schedule.
@@ -157,7 +234,7 @@ class ScheduleService:
             tenant_id: The tenant unique identifier (for multi-tenancy isolation)
             name: New schedule name (optional)
             cron_expression: New cron expression (optional)
-            timezone: New timezone (optional)
+            tz_name: New timezone (optional)
             email_delivery_config: New email configuration (optional)
             
         Returns:
@@ -172,34 +249,41 @@ class ScheduleService:
         if not schedule:
             return None, "Schedule not found"
 
-        # Update fields
-        if name is not None:
+        # Update fields, tracking whether anything actually changed
+        dirty = False
+        if name is not None and name != schedule.name:
             schedule.name = name
+            dirty = True
 
         # If cron or timezone changes, recalculate next_run_at
         recalculate_next_run = False
-        if cron_expression is not None:
-            is_valid, error = validate_cron_expression(cron_expression)
-            if not is_valid:
-                return None, error
+        if cron_expression is not None and cron_expression != schedule.cron_expression:
             schedule.cron_expression = cron_expression
             recalculate_next_run = True
 
-        if timezone is not None:
-            schedule.timezone = timezone
+        if tz_name is not None and tz_name != schedule.timezone:
+            schedule.timezone = tz_name
             recalculate_next_run = True
 
         if recalculate_next_run:
+            # One parse validates the new cron/timezone and yields next_run_at
             try:
-                schedule.next_run_at = calculate_next_run(
-                    cron_expr=schedule.cron_expression,
-                    tz=schedule.timezone,
-                )
+                compiled = compile_cron(schedule.cron_expression, schedule.timezone)
             except ValueError as e:
                 return None, str(e)
+            schedule.next_run_at = next_run_from(compiled)
+            dirty = True
 
-        if email_delivery_config is not None:
+        if (
+            email_delivery_config is not None
+            and email_delivery_config != schedule.email_delivery_config
+        ):
             schedule.email_delivery_config = email_delivery_config
+            dirty = True
+
+        # Nothing changed: skip the UPDATE and leave updated_at untouched
+        if not dirty:
+            return schedule, None
 
         # Persist changes
         updated = await self._repository.update(schedule)
@@ -207,8 +291,8 @@ class ScheduleService:
 
     async def delete_schedule(
         self,
-        schedule_id: str,
-        tenant_id: str,
+        schedule_id: uuid.UUID,
+        tenant_id: uuid.UUID,
     ) -> bool:
         """Delete a schedule.
         
@@ -226,8 +310,8 @@ class ScheduleService:
 
     async def pause_schedule(
         self,
-        schedule_id: str,
-        tenant_id: str,
+        schedule_id: uuid.UUID,
+        tenant_id: uuid.UUID,
     ) -> tuple[Optional[Schedule], Optional[str]]:
         """Pause a schedule (set is_active to False).
         
@@ -251,8 +335,8 @@ class ScheduleService:
 
     async def resume_schedule(
         self,
-        schedule_id: str,
-        tenant_id: str,
+        schedule_id: uuid.UUID,
+        tenant_id: uuid.UUID,
     ) -> tuple[Optional[Schedule], Optional[str]]:
         """Resume a schedule (set is_active to True and recalculate next_run_at).
         
@@ -271,14 +355,14 @@ class ScheduleService:
             return None, "Schedule not found"
 
         schedule.is_active = True
-        # Recalculate next run time from now
-        try:
-            schedule.next_run_at = calculate_next_run(
-                cron_expr=schedule.cron_expression,
-                tz=schedule.timezone,
-            )
-        except ValueError as e:
-            return None, str(e)
+        # A stored next run still in the future is already the next cron
+        # occurrence after now; only recalculate when it has gone stale
+        if schedule.next_run_at is None or schedule.next_run_at <= datetime.now(timezone.utc):
+            try:
+                compiled = compile_cron(schedule.cron_expression, schedule.timezone)
+            except ValueError as e:
+                return None, str(e)
+            schedule.next_run_at = next_run_from(compiled)
 
         updated = await self._repository.update(schedule)
         return updated, None
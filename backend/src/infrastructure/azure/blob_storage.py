@@ -1,54 +1,119 @@
 """Azure Blob Storage service for artifact management."""
 
+import io
 import logging
-from datetime import datetime, timedelta, timezone
-from typing import Optional
-from uuid import uuid4
+import math
+import time
+from datetime import datetime, timezone
+from functools import lru_cache
+from typing import IO, Optional, Union
+from urllib.parse import quote
 
 from azure.core.exceptions import AzureError
-from azure.storage.blob import BlobServiceClient, BlobSasPermissions, generate_blob_sas
+from azure.storage.blob import BlobSasPermissions, generate_blob_sas
+from azure.storage.blob.aio import BlobServiceClient
 
 from src.config import settings
 
 logger = logging.getLogger(__name__)
 
+# Read-only permission, built once rather than per signed URL
+_READ_PERMISSION = BlobSasPermissions(read=True)
+
+
+@lru_cache(maxsize=4096)
+def _read_sas_token(
+    account_name: str,
+    account_key: str,
+    container_name: str,
+    blob_path: str,
+    expiry_epoch: int,
+) -> str:
+    """Sign a read SAS token; identical inputs reuse the previous HMAC."""
+    return generate_blob_sas(
+        account_name=account_name,
+        container_name=container_name,
+        blob_name=blob_path,
+        account_key=account_key,
+        permission=_READ_PERMISSION,
+        expiry=datetime.fromtimestamp(expiry_epoch, tz=timezone.utc),
+    )
+
 
 class BlobStorageService:
-    """Service for managing artifacts in Azure Blob Storage."""
+    """Service for managing artifacts in Azure Blob Storage.
+    
+    Uses the asyncio SDK, so storage I/O never blocks the event loop. Call
+    async_init before first use and close when done, or use the service as
+    an async context manager.
+    """
+    
+    # Parallel block uploads per artifact; payloads above the SDK's single-put
+    # threshold are split into blocks and sent concurrently
+    UPLOAD_MAX_CONCURRENCY = 8
+    
+    # SAS expiries are rounded up to this granularity so repeated requests
+    # for the same blob share one cached token
+    SAS_EXPIRY_BUCKET_SECONDS = 300
     
     def __init__(self):
-        """Initialize Blob Storage client."""
+        """Initialize Blob Storage client (no I/O until first call)."""
         self._client = BlobServiceClient.from_connection_string(
             settings.AZURE_STORAGE_CONNECTION_STRING
         )
         self._container_name = settings.STORAGE_CONTAINER_NAME
-        self._ensure_container_exists()
+        
+        # SAS signing inputs, resolved once; the account key is looked up on
+        # first signing, since SAS and AAD credentials have none
+        self._account_name = self._client.account_name
+        self._account_key: Optional[str] = None
+        self._container_url = (
+            f"{self._client.url.rstrip('/')}/{quote(self._container_name)}"
+        )
+    
+    async def __aenter__(self) -> "BlobStorageService":
+        await self.async_init()
+        return self
+    
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
     
-    def _ensure_container_exists(self) -> None:
-        """Create container if it doesn't exist."""
+    async def async_init(self) -> None:
+        """Create the artifact container if it doesn't exist.
+        
+        Raises:
+            AzureError: If the container cannot be checked or created
+        """
         try:
             container_client = self._client.get_container_client(self._container_name)
-            if not container_client.exists():
-                container_client.create_container()
+            if not await container_client.exists():
+                await container_client.create_container()
                 logger.info(f"Created blob container: {self._container_name}")
         except AzureError as e:
             logger.error(f"Failed to ensure container exists: {e}")
             raise
     
-    def upload_artifact(
+    async def close(self) -> None:
+        """Close the underlying HTTP session."""
+        await self._client.close()
+    
+    async def upload_artifact(
         self,
         tenant_id: str,
         execution_run_id: str,
-        file_content: bytes,
+        file_content: Union[bytes, IO[bytes]],
         file_format: str,
         file_name: Optional[str] = None,
     ) -> tuple[str, int]:
         """Upload artifact to blob storage.
         
+        A file object is streamed from its current position in blocks, so
+        large artifacts need not be read into memory.
+        
         Args:
             tenant_id: The tenant unique identifier
             execution_run_id: The execution run unique identifier
-            file_content: The file content as bytes
+            file_content: The file content as bytes or a readable binary file
             file_format: The file format (pdf, csv, xlsx)
             file_name: Optional custom file name (defaults to generated name)
             
@@ -64,6 +129,13 @@ class BlobStorageService:
         
         blob_path = f"{tenant_id}/{execution_run_id}/{file_name}"
         
+        if isinstance(file_content, (bytes, bytearray)):
+            file_size_bytes = len(file_content)
+        else:
+            position = file_content.tell()
+            file_size_bytes = file_content.seek(0, io.SEEK_END) - position
+            file_content.seek(position)
+        
         try:
             blob_client = self._client.get_blob_client(
                 container=self._container_name,
@@ -71,19 +143,20 @@ class BlobStorageService:
             )
             
             # Upload with metadata
-            blob_client.upload_blob(
+            await blob_client.upload_blob(
                 file_content,
                 overwrite=True,
+                length=file_size_bytes,
+                max_concurrency=self.UPLOAD_MAX_CONCURRENCY,
+                # The SDK strips every metadata value, so all must be str
                 metadata={
-                    "tenant_id": tenant_id,
-                    "execution_run_id": execution_run_id,
+                    "tenant_id": str(tenant_id),
+                    "execution_run_id": str(execution_run_id),
                     "file_format": file_format,
                     "uploaded_at": datetime.now(timezone.utc).isoformat(),
                 },
             )
             
-            file_size_bytes = len(file_content)
-            
             logger.info(
                 f"Uploaded artifact to blob storage: {blob_path} ({file_size_bytes} bytes)",
                 extra={
@@ -115,6 +188,9 @@ class BlobStorageService:
     ) -> tuple[str, datetime]:
         """Generate a SAS URL for accessing a blob.
         
+        The expiry is rounded up to SAS_EXPIRY_BUCKET_SECONDS, so it may be
+        up to that much later than requested.
+        
         Args:
             blob_path: The blob path in the container
             expiry_hours: Hours until the SAS URL expires (default: 24)
@@ -126,26 +202,29 @@ class BlobStorageService:
             AzureError: If SAS generation fails
         """
         try:
-            blob_client = self._client.get_blob_client(
-                container=self._container_name,
-                blob=blob_path,
-            )
+            if self._account_key is None:
+                self._account_key = getattr(self._client.credential, "account_key", None)
+                if not self._account_key:
+                    raise AzureError(
+                        "Signing SAS URLs requires an account key connection string"
+                    )
             
-            # Calculate expiry time
-            expires_at = datetime.now(timezone.utc) + timedelta(hours=expiry_hours)
+            # Calculate expiry time, rounded up to the bucket boundary
+            bucket = self.SAS_EXPIRY_BUCKET_SECONDS
+            expiry_epoch = math.ceil((time.time() + expiry_hours * 3600) / bucket) * bucket
+            expires_at = datetime.fromtimestamp(expiry_epoch, tz=timezone.utc)
             
             # Generate SAS token
-            sas_token = generate_blob_sas(
-                account_name=blob_client.account_name,
-                container_name=self._container_name,
-                blob_name=blob_path,
-                account_key=self._client.credential.account_key,
-                permission=BlobSasPermissions(read=True),
-                expiry=expires_at,
+            sas_token = _read_sas_token(
+                self._account_name,
+                self._account_key,
+                self._container_name,
+                blob_path,
+                expiry_epoch,
             )
             
-            # Construct full URL with SAS token
-            signed_url = f"{blob_client.url}?{sas_token}"
+            # Construct full URL with SAS token (quoted as BlobClient.url does)
+            signed_url = f"{self._container_url}/{quote(blob_path, safe='~/')}?{sas_token}"
             
             logger.debug(
                 f"Generated SAS URL for blob: {blob_path}",
@@ -162,7 +241,7 @@ class BlobStorageService:
             )
             raise
     
-    def delete_artifact(self, blob_path: str) -> bool:
+    async def delete_artifact(self, blob_path: str) -> bool:
         """Delete an artifact from blob storage.
         
         Args:
@@ -177,7 +256,7 @@ class BlobStorageService:
                 blob=blob_path,
             )
             
-            blob_client.delete_blob()
+            await blob_client.delete_blob()
             logger.info(f"Deleted artifact: {blob_path}")
             return True
             
@@ -188,7 +267,7 @@ class BlobStorageService:
             logger.error(f"Failed to delete artifact: {e}", exc_info=True)
             raise
     
-    def get_artifact_metadata(self, blob_path: str) -> Optional[dict]:
+    async def get_artifact_metadata(self, blob_path: str) -> Optional[dict]:
         """Get metadata for an artifact.
         
         Args:
@@ -203,7 +282,7 @@ class BlobStorageService:
                 blob=blob_path,
             )
             
-            properties = blob_client.get_blob_properties()
+            properties = await blob_client.get_blob_properties()
             
             return {
                 "size": properties.size,
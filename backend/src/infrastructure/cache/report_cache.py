@@ -1,24 +1,66 @@
 """Report caching service using Redis for performance optimization."""
 
+import asyncio
 import hashlib
-import json
 import logging
-from datetime import datetime, timedelta
+import time
+import weakref
+from collections import OrderedDict
 from typing import Optional
 
+import orjson
+import zstandard
 from redis.asyncio import Redis
 
 from src.config import settings
 
 logger = logging.getLogger(__name__)
 
+# One pooled client per event loop: connections are bound to the loop that
+# opened them, and the API and each Celery worker process run their own loop.
+_shared_redis: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Redis]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def get_shared_redis() -> Redis:
+    """Get the pooled cache Redis client for the running event loop.
+    
+    Returns:
+        The shared Redis client (bytes responses)
+    """
+    loop = asyncio.get_running_loop()
+    client = _shared_redis.get(loop)
+    if client is None:
+        client = Redis.from_url(
+            settings.REDIS_URL,
+            max_connections=settings.REDIS_POOL_SIZE,
+            health_check_interval=30,
+            socket_keepalive=True,
+            decode_responses=False,  # We'll handle bytes for PDF content
+        )
+        _shared_redis[loop] = client
+    return client
+
+
+# Process-local L1 in front of Redis: cache_key -> (expires_at, report dict),
+# kept in LRU order. Module-level because services are created per task.
+_local_cache: "OrderedDict[str, tuple[float, dict]]" = OrderedDict()
+
+
+async def close_shared_redis() -> None:
+    """Close the shared cache client of the running event loop, if any."""
+    client = _shared_redis.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aclose()
+
 
 class ReportCacheService:
     """Service for caching report generation results.
     
     Caches are keyed by a hash of:
     - Report definition ID
-    - Query parameters
+    - Query parameters, less entries that don't affect the output
     - Date range parameters
     
     This prevents redundant query execution and PDF generation for identical reports.
@@ -27,25 +69,110 @@ class ReportCacheService:
     DEFAULT_TTL_SECONDS = 3600  # 1 hour default
     CACHE_KEY_PREFIX = "report_cache:"
     METADATA_SUFFIX = ":meta"
+    # SET of cache keys per report definition, for invalidation without SCAN
+    INDEX_KEY_PREFIX = "report_index:"
+    
+    # In-process L1: hot reports skip the Redis round trip and PDF transfer.
+    # Other processes' copies are not invalidated, so the TTL bounds staleness.
+    LOCAL_CACHE_MAX_ENTRIES = 128
+    LOCAL_CACHE_TTL_SECONDS = 60
+    LOCAL_CACHE_MAX_ITEM_BYTES = 4 * 1024 * 1024
+    
+    # Adaptive TTLs: an EMA of the age at which each report's cache entries
+    # are hit. Entries still being read late in life get longer TTLs, ones
+    # only read soon after caching get shorter, within TTL_MIN/MAX_FACTOR of
+    # the report's configured cache_ttl_seconds.
+    TTL_STATS_KEY_PREFIX = "report_ttl_stats:"
+    TTL_STATS_RETENTION_SECONDS = 7 * 24 * 3600
+    TTL_EMA_ALPHA = 0.2
+    TTL_HIT_AGE_FACTOR = 2.0
+    TTL_MIN_FACTOR = 0.25
+    TTL_MAX_FACTOR = 4.0
+    
+    # KEYS: PDF, metadata, TTL stats. ARGV: now (epoch seconds), EMA alpha,
+    # stats retention. Returns [pdf, metadata] and folds the hit's age into
+    # the report's EMA server-side, so a hit is one atomic round trip.
+    READ_HIT_LUA = """
+local pdf = redis.call('GET', KEYS[1])
+if not pdf then
+    return {false, false}
+end
+local meta = redis.call('GET', KEYS[2])
+if meta then
+    local ok, decoded = pcall(cjson.decode, meta)
+    local cached_at = ok and type(decoded) == 'table' and decoded['cached_at']
+    if type(cached_at) == 'number' then
+        local age = math.max(tonumber(ARGV[1]) - cached_at, 0)
+        local ema = tonumber(redis.call('GET', KEYS[3]))
+        if ema then
+            local alpha = tonumber(ARGV[2])
+            age = alpha * age + (1 - alpha) * ema
+        end
+        redis.call('SET', KEYS[3], string.format('%.1f', age), 'EX', ARGV[3])
+    end
+end
+return {pdf, meta or false}
+"""
+    
+    # query_spec entries that describe or tune a query without changing its
+    # result; left out of the cache key so such edits still hit
+    NON_SEMANTIC_QUERY_KEYS = frozenset({
+        "description",
+        "comment",
+        "label",
+        "tags",
+        "timeout_seconds",
+        "request_id",
+    })
+    
+    # Keys sized per pipelined round trip in get_cache_stats
+    STATS_BATCH_SIZE = 500
+    
+    # PDFs at least this large are stored zstd-compressed when that saves at
+    # least COMPRESS_MIN_SAVING of the size (WeasyPrint output is often
+    # already Flate-compressed, in which case the raw bytes are kept).
+    COMPRESS_MIN_BYTES = 64 * 1024
+    COMPRESS_MIN_SAVING = 0.1
+    COMPRESS_LEVEL = 3
     
     def __init__(self, redis_client: Optional[Redis] = None):
         """Initialize report cache service.
         
         Args:
-            redis_client: Optional Redis client (creates new one if not provided)
+            redis_client: Optional Redis client (uses the shared pooled client if not provided)
         """
         self._redis = redis_client
+        self._read_hit_script = None
     
     async def _get_redis(self) -> Redis:
-        """Get or create Redis client."""
+        """Get the injected Redis client, or the shared pooled one."""
         if self._redis is None:
-            self._redis = Redis.from_url(
-                settings.REDIS_URL,
-                encoding="utf-8",
-                decode_responses=False,  # We'll handle bytes for PDF content
-            )
+            return get_shared_redis()
         return self._redis
     
+    @classmethod
+    def _canonical_parameters(cls, value):
+        """Reduce query parameters to the parts that affect the report.
+        
+        Drops NON_SEMANTIC_QUERY_KEYS and None-valued entries at every depth,
+        so specs that differ only in those serialize identically.
+        
+        Args:
+            value: Query parameters, or a nested value within them
+            
+        Returns:
+            The canonical form of value
+        """
+        if isinstance(value, dict):
+            return {
+                key: cls._canonical_parameters(item)
+                for key, item in value.items()
+                if item is not None and key not in cls.NON_SEMANTIC_QUERY_KEYS
+            }
+        if isinstance(value, list):
+            return [cls._canonical_parameters(item) for item in value]
+        return value
+    
     def _generate_cache_key(
         self,
         report_definition_id: str,
@@ -65,16 +192,42 @@ class ReportCacheService:
         # Create deterministic hash of parameters
         cache_data = {
             "report_definition_id": report_definition_id,
-            "query_parameters": query_parameters or {},
+            "query_parameters": self._canonical_parameters(query_parameters or {}),
             "date_range": date_range or {},
         }
         
-        # Sort keys for deterministic JSON serialization
-        cache_json = json.dumps(cache_data, sort_keys=True)
-        cache_hash = hashlib.sha256(cache_json.encode()).hexdigest()
+        # Sorted keys make the bytes canonical; orjson serializes straight to
+        # bytes in C, with no separate encode step
+        cache_bytes = orjson.dumps(
+            cache_data,
+            option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS,
+        )
+        # Non-cryptographic dedup key: BLAKE2b-128 is faster than SHA-256
+        # and collision-safe at this size
+        cache_hash = hashlib.blake2b(cache_bytes, digest_size=16).hexdigest()
         
         return f"{self.CACHE_KEY_PREFIX}{cache_hash}"
     
+    def _local_get(self, cache_key: str) -> Optional[dict]:
+        """Return an unexpired L1 entry, refreshing its LRU position."""
+        entry = _local_cache.get(cache_key)
+        if entry is None:
+            return None
+        if entry[0] <= time.monotonic():
+            del _local_cache[cache_key]
+            return None
+        _local_cache.move_to_end(cache_key)
+        return entry[1]
+    
+    def _local_put(self, cache_key: str, report: dict, ttl_seconds: float) -> None:
+        """Store a report in the L1, evicting the least recently used entries."""
+        if len(report["pdf_bytes"]) > self.LOCAL_CACHE_MAX_ITEM_BYTES:
+            return
+        _local_cache[cache_key] = (time.monotonic() + ttl_seconds, report)
+        _local_cache.move_to_end(cache_key)
+        while len(_local_cache) > self.LOCAL_CACHE_MAX_ENTRIES:
+            _local_cache.popitem(last=False)
+    
     async def get_cached_report(
         self,
         report_definition_id: str,
@@ -91,22 +244,37 @@ class ReportCacheService:
         Returns:
             Dict with pdf_bytes and metadata, or None if not cached
         """
-        redis = await self._get_redis()
         cache_key = self._generate_cache_key(
             report_definition_id, query_parameters, date_range
         )
         
+        local = self._local_get(cache_key)
+        if local is not None:
+            logger.debug(f"Local cache hit for key: {cache_key}")
+            return local
+        
+        redis = await self._get_redis()
+        
         try:
-            # Check if cache exists
-            pdf_bytes = await redis.get(cache_key)
+            if self._read_hit_script is None:
+                # Runs via EVALSHA, falling back to EVAL if not yet cached
+                self._read_hit_script = redis.register_script(self.READ_HIT_LUA)
+            
+            # Fetch PDF and metadata and record the hit age in one round trip
+            meta_key = f"{cache_key}{self.METADATA_SUFFIX}"
+            stats_key = f"{self.TTL_STATS_KEY_PREFIX}{report_definition_id}"
+            pdf_bytes, meta_json = await self._read_hit_script(
+                keys=[cache_key, meta_key, stats_key],
+                args=[time.time(), self.TTL_EMA_ALPHA, self.TTL_STATS_RETENTION_SECONDS],
+            )
             if pdf_bytes is None:
                 logger.debug(f"Cache miss for key: {cache_key}")
                 return None
             
-            # Get metadata
-            meta_key = f"{cache_key}{self.METADATA_SUFFIX}"
-            meta_json = await redis.get(meta_key)
-            metadata = json.loads(meta_json) if meta_json else {}
+            metadata = orjson.loads(meta_json) if meta_json else {}
+            # zstd releases the GIL; keep multi-MB inflates off the loop
+            if metadata.get("compressed") == "zstd":
+                pdf_bytes = await asyncio.to_thread(zstandard.decompress, pdf_bytes)
             
             logger.info(
                 f"Cache hit for report {report_definition_id}",
@@ -117,15 +285,53 @@ class ReportCacheService:
                 },
             )
             
-            return {
+            report = {
                 "pdf_bytes": pdf_bytes,
                 "metadata": metadata,
             }
+            # Never keep the L1 copy past the Redis entry's own expiry
+            local_ttl = self.LOCAL_CACHE_TTL_SECONDS
+            cached_at = metadata.get("cached_at")
+            ttl_seconds = metadata.get("ttl_seconds")
+            if isinstance(cached_at, (int, float)) and isinstance(ttl_seconds, (int, float)):
+                local_ttl = min(local_ttl, cached_at + ttl_seconds - time.time())
+            if local_ttl > 0:
+                self._local_put(cache_key, report, local_ttl)
+            return report
             
         except Exception as e:
             logger.error(f"Failed to retrieve cached report: {e}", exc_info=True)
             return None
     
+    async def estimate_ttl(self, report_definition_id: str, base_ttl: int) -> int:
+        """Choose a TTL for a report from how its cached entries get used.
+        
+        Args:
+            report_definition_id: The report definition ID
+            base_ttl: The report's configured TTL in seconds
+            
+        Returns:
+            TTL_HIT_AGE_FACTOR times the report's hit-age EMA, clamped to
+            [TTL_MIN_FACTOR, TTL_MAX_FACTOR] times base_ttl; base_ttl if the
+            report has no recorded hits
+        """
+        redis = await self._get_redis()
+        
+        try:
+            hit_age_ema = await redis.get(
+                f"{self.TTL_STATS_KEY_PREFIX}{report_definition_id}"
+            )
+        except Exception as e:
+            logger.error(f"Failed to read cache TTL stats: {e}", exc_info=True)
+            return base_ttl
+        
+        if hit_age_ema is None:
+            return base_ttl
+        
+        ttl = float(hit_age_ema) * self.TTL_HIT_AGE_FACTOR
+        ttl = min(max(ttl, base_ttl * self.TTL_MIN_FACTOR), base_ttl * self.TTL_MAX_FACTOR)
+        return max(int(ttl), 1)
+    
     async def cache_report(
         self,
         report_definition_id: str,
@@ -156,19 +362,42 @@ class ReportCacheService:
         ttl = ttl_seconds or self.DEFAULT_TTL_SECONDS
         
         try:
-            # Store PDF bytes
-            await redis.setex(cache_key, ttl, pdf_bytes)
-            
-            # Store metadata
             cache_metadata = {
                 "report_definition_id": report_definition_id,
-                "cached_at": datetime.utcnow().isoformat(),
+                "cached_at": int(time.time()),  # epoch seconds, UTC
                 "size_bytes": len(pdf_bytes),
                 "ttl_seconds": ttl,
                 **(metadata or {}),
             }
+            payload = pdf_bytes
+            if len(pdf_bytes) >= self.COMPRESS_MIN_BYTES:
+                compressed = await asyncio.to_thread(
+                    zstandard.compress, pdf_bytes, self.COMPRESS_LEVEL
+                )
+                if len(compressed) <= len(pdf_bytes) * (1 - self.COMPRESS_MIN_SAVING):
+                    payload = compressed
+                    cache_metadata["compressed"] = "zstd"
+                    cache_metadata["stored_bytes"] = len(compressed)
+            
             meta_key = f"{cache_key}{self.METADATA_SUFFIX}"
-            await redis.setex(meta_key, ttl, json.dumps(cache_metadata))
+            index_key = f"{self.INDEX_KEY_PREFIX}{report_definition_id}"
+            
+            # Store PDF bytes and metadata, and index the key under its report
+            # definition, in one round trip. The index lives as long as its
+            # longest-lived entry: NX sets a TTL on a new set, GT only extends it.
+            async with redis.pipeline(transaction=False) as pipe:
+                pipe.setex(cache_key, ttl, payload)
+                pipe.setex(meta_key, ttl, orjson.dumps(cache_metadata))
+                pipe.sadd(index_key, cache_key)
+                pipe.expire(index_key, ttl, nx=True)
+                pipe.expire(index_key, ttl, gt=True)
+                await pipe.execute()
+            
+            self._local_put(
+                cache_key,
+                {"pdf_bytes": pdf_bytes, "metadata": cache_metadata},
+                min(ttl, self.LOCAL_CACHE_TTL_SECONDS),
+            )
             
             logger.info(
                 f"Cached report {report_definition_id}",
@@ -206,9 +435,12 @@ class ReportCacheService:
             report_definition_id, query_parameters, date_range
         )
         
+        _local_cache.pop(cache_key, None)
+        
         try:
             meta_key = f"{cache_key}{self.METADATA_SUFFIX}"
-            deleted_count = await redis.delete(cache_key, meta_key)
+            # UNLINK frees large PDF values in a background thread on the server
+            deleted_count = await redis.unlink(cache_key, meta_key)
             
             logger.info(
                 f"Invalidated cache for report {report_definition_id}",
@@ -238,24 +470,23 @@ class ReportCacheService:
         """
         redis = await self._get_redis()
         
+        index_key = f"{self.INDEX_KEY_PREFIX}{report_definition_id}"
+        
         try:
-            # Find all keys matching this report definition
-            # Note: This is a simple implementation. For production, consider
-            # maintaining a separate index of cache keys per report definition.
-            pattern = f"{self.CACHE_KEY_PREFIX}*"
-            deleted_count = 0
+            cache_keys = list(await redis.smembers(index_key))
+            for cache_key in cache_keys:
+                _local_cache.pop(cache_key.decode(), None)
+            
+            # Unlink every indexed entry and the index itself in one round trip;
+            # UNLINK frees large PDF values off the server's main thread
+            async with redis.pipeline(transaction=False) as pipe:
+                for cache_key in cache_keys:
+                    pipe.unlink(cache_key, cache_key + self.METADATA_SUFFIX.encode())
+                pipe.unlink(index_key)
+                results = await pipe.execute()
             
-            async for key in redis.scan_iter(match=pattern, count=100):
-                # Check metadata to see if it matches report definition
-                if key.endswith(self.METADATA_SUFFIX.encode()):
-                    meta_json = await redis.get(key)
-                    if meta_json:
-                        metadata = json.loads(meta_json)
-                        if metadata.get("report_definition_id") == report_definition_id:
-                            # Delete both metadata and PDF
-                            pdf_key = key[: -len(self.METADATA_SUFFIX)]
-                            await redis.delete(pdf_key, key)
-                            deleted_count += 1
+            # Members whose entries already expired delete nothing
+            deleted_count = sum(1 for count in results[:-1] if count)
             
             logger.info(
                 f"Invalidated {deleted_count} cache entries for report {report_definition_id}",
@@ -281,15 +512,30 @@ class ReportCacheService:
         
         try:
             pattern = f"{self.CACHE_KEY_PREFIX}*"
+            meta_suffix = self.METADATA_SUFFIX.encode()
             total_keys = 0
             total_size_bytes = 0
+            batch: list[bytes] = []
             
-            async for key in redis.scan_iter(match=pattern, count=100):
-                if not key.endswith(self.METADATA_SUFFIX.encode()):
+            async def _add_sizes(keys: list[bytes]) -> None:
+                # One round trip for a whole batch of STRLENs
+                async with redis.pipeline(transaction=False) as pipe:
+                    for key in keys:
+                        pipe.strlen(key)
+                    sizes = await pipe.execute()
+                nonlocal total_size_bytes
+                total_size_bytes += sum(sizes)
+            
+            async for key in redis.scan_iter(match=pattern, count=self.STATS_BATCH_SIZE):
+                if not key.endswith(meta_suffix):
                     total_keys += 1
-                    # Get size of cached PDF
-                    size = await redis.strlen(key)
-                    total_size_bytes += size
+                    batch.append(key)
+                    if len(batch) >= self.STATS_BATCH_SIZE:
+                        await _add_sizes(batch)
+                        batch = []
+            
+            if batch:
+                await _add_sizes(batch)
             
             return {
                 "total_cached_reports": total_keys,
@@ -306,6 +552,10 @@ class ReportCacheService:
             }
     
     async def close(self):
-        """Close Redis connection."""
+        """Close an injected Redis client.
+        
+        The shared client outlives service instances and is closed by
+        close_shared_redis on shutdown.
+        """
         if self._redis:
             await self._redis.close()
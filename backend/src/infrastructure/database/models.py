@@ -1,8 +1,20 @@
 """SQLAlchemy database models."""
 
+import uuid
 from datetime import datetime
 from typing import Optional
-from sqlalchemy import String, DateTime, Boolean, Integer, Text, JSON, ForeignKey, Index
+from sqlalchemy import (
+    Boolean,
+    CheckConstraint,
+    DateTime,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    Text,
+    text,
+)
+from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
 from sqlalchemy.sql import func
 
@@ -18,7 +30,9 @@ class Tenant(Base):
 
     __tablename__ = "tenant"
 
-    id: Mapped[str] = mapped_column(String(36), primary_key=True)
+    id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), primary_key=True, server_default=text("gen_random_uuid()")
+    )
     name: Mapped[str] = mapped_column(String(255), nullable=False)
     tier: Mapped[str] = mapped_column(
         String(50), nullable=False, default="standard"
@@ -39,6 +53,10 @@ class Tenant(Base):
         back_populates="tenant", cascade="all, delete-orphan"
     )
 
+    __table_args__ = (
+        CheckConstraint("tier IN ('standard', 'premium', 'enterprise')", name="ck_tenant_tier"),
+    )
+
     def __repr__(self) -> str:
         return f"<Tenant(id={self.id}, name={self.name})>"
 
@@ -48,16 +66,20 @@ class ReportDefinition(Base):
 
     __tablename__ = "report_definition"
 
-    id: Mapped[str] = mapped_column(String(36), primary_key=True)
-    tenant_id: Mapped[str] = mapped_column(String(36), ForeignKey("tenant.id"), nullable=False)
+    id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), primary_key=True, server_default=text("gen_random_uuid()")
+    )
+    tenant_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), ForeignKey("tenant.id"), nullable=False
+    )
     name: Mapped[str] = mapped_column(String(255), nullable=False)
     description: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
-    query_spec: Mapped[dict] = mapped_column(JSON, nullable=False)  # data source, query, params
+    query_spec: Mapped[dict] = mapped_column(JSONB, nullable=False)  # data source, query, params
     template_ref: Mapped[str] = mapped_column(String(500), nullable=False)  # Blob storage path
     output_format: Mapped[str] = mapped_column(
         String(50), nullable=False, default="pdf"
     )  # pdf, csv, xlsx
-    created_by: Mapped[str] = mapped_column(String(36), nullable=False)
+    created_by: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), nullable=False)
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), server_default=func.now(), nullable=False
     )
@@ -72,7 +94,10 @@ class ReportDefinition(Base):
     )
 
     # Indexes
-    __table_args__ = (Index("idx_report_tenant_id", "tenant_id"),)
+    __table_args__ = (
+        Index("idx_report_tenant_id", "tenant_id"),
+        CheckConstraint("output_format IN ('pdf', 'csv', 'xlsx')", name="ck_report_output_format"),
+    )
 
     def __repr__(self) -> str:
         return f"<ReportDefinition(id={self.id}, name={self.name})>"
@@ -82,11 +107,18 @@ class Schedule(Base):
     """Schedule model for recurring reports."""
 
     __tablename__ = "schedule"
+    # Fetch server-generated updated_at via RETURNING on UPDATE instead of
+    # expiring it (which would need a SELECT to read back)
+    __mapper_args__ = {"eager_defaults": True}
 
-    id: Mapped[str] = mapped_column(String(36), primary_key=True)
-    tenant_id: Mapped[str] = mapped_column(String(36), ForeignKey("tenant.id"), nullable=False)
-    report_definition_id: Mapped[str] = mapped_column(
-        String(36), ForeignKey("report_definition.id"), nullable=False
+    id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), primary_key=True, server_default=text("gen_random_uuid()")
+    )
+    tenant_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), ForeignKey("tenant.id"), nullable=False
+    )
+    report_definition_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), ForeignKey("report_definition.id"), nullable=False
     )
     name: Mapped[str] = mapped_column(String(255), nullable=False)
     cron_expression: Mapped[str] = mapped_column(String(100), nullable=False)
@@ -95,9 +127,9 @@ class Schedule(Base):
     next_run_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
     last_run_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
     email_delivery_config: Mapped[Optional[dict]] = mapped_column(
-        JSON, nullable=True
+        JSONB, nullable=True
     )  # recipients, subject, body_template
-    created_by: Mapped[str] = mapped_column(String(36), nullable=False)
+    created_by: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), nullable=False)
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), server_default=func.now(), nullable=False
     )
@@ -114,8 +146,25 @@ class Schedule(Base):
 
     # Indexes
     __table_args__ = (
-        Index("idx_schedule_tenant_id", "tenant_id"),
-        Index("idx_schedule_next_run", "next_run_at", "is_active"),
+        Index(
+            "idx_schedule_active_due",
+            "tenant_id",
+            "next_run_at",
+            postgresql_where=text("is_active = true"),
+        ),
+        Index(
+            "idx_schedule_due",
+            "next_run_at",
+            "id",
+            postgresql_where=text("is_active = true AND next_run_at IS NOT NULL"),
+        ),
+        Index(
+            "idx_schedule_tenant_list",
+            "tenant_id",
+            text("created_at DESC"),
+            text("id DESC"),
+            postgresql_include=["is_active"],
+        ),
         Index("idx_schedule_report_id", "report_definition_id"),
     )
 
@@ -128,13 +177,17 @@ class ExecutionRun(Base):
 
     __tablename__ = "execution_run"
 
-    id: Mapped[str] = mapped_column(String(36), primary_key=True)
-    tenant_id: Mapped[str] = mapped_column(String(36), ForeignKey("tenant.id"), nullable=False)
-    schedule_id: Mapped[Optional[str]] = mapped_column(
-        String(36), ForeignKey("schedule.id"), nullable=True
+    id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), primary_key=True, server_default=text("gen_random_uuid()")
+    )
+    tenant_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), ForeignKey("tenant.id"), nullable=False
+    )
+    schedule_id: Mapped[Optional[uuid.UUID]] = mapped_column(
+        UUID(as_uuid=True), ForeignKey("schedule.id"), nullable=True
     )  # Nullable for manual runs
-    report_definition_id: Mapped[str] = mapped_column(
-        String(36), ForeignKey("report_definition.id"), nullable=False
+    report_definition_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), ForeignKey("report_definition.id"), nullable=False
     )
     status: Mapped[str] = mapped_column(
         String(50), nullable=False, default="pending"
@@ -143,7 +196,7 @@ class ExecutionRun(Base):
     completed_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
     duration_seconds: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
     error_message: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
-    execution_metadata: Mapped[Optional[dict]] = mapped_column(JSON, nullable=True)  # Additional context
+    execution_metadata: Mapped[Optional[dict]] = mapped_column(JSONB, nullable=True)  # Additional context
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), server_default=func.now(), nullable=False
     )
@@ -156,25 +209,56 @@ class ExecutionRun(Base):
 
     # Indexes
     __table_args__ = (
-        Index("idx_execution_tenant_id", "tenant_id"),
-        Index("idx_execution_schedule_id", "schedule_id"),
+        Index("idx_execution_tenant_created", "tenant_id", text("created_at DESC")),
+        Index("idx_execution_schedule_time", "schedule_id", text("created_at DESC")),
         Index("idx_execution_status", "status"),
-        Index("idx_execution_created_at", "created_at"),
+        Index(
+            "idx_execution_active_tenant",
+            "tenant_id",
+            postgresql_where=text("status IN ('pending', 'running')"),
+        ),
+        Index(
+            "idx_execution_created_at",
+            "created_at",
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32},
+        ),
+        CheckConstraint(
+            "status IN ('pending', 'running', 'completed', 'failed')", name="ck_execution_status"
+        ),
     )
 
     def __repr__(self) -> str:
         return f"<ExecutionRun(id={self.id}, status={self.status})>"
 
 
+class TenantConcurrency(Base):
+    """In-flight execution count per tenant, maintained by a trigger on execution_run."""
+
+    __tablename__ = "tenant_concurrency"
+
+    tenant_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), ForeignKey("tenant.id"), primary_key=True
+    )
+    running_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+    def __repr__(self) -> str:
+        return f"<TenantConcurrency(tenant_id={self.tenant_id}, running={self.running_count})>"
+
+
 class Artifact(Base):
     """Artifact model for generated report files."""
 
     __tablename__ = "artifact"
 
-    id: Mapped[str] = mapped_column(String(36), primary_key=True)
-    tenant_id: Mapped[str] = mapped_column(String(36), ForeignKey("tenant.id"), nullable=False)
-    execution_run_id: Mapped[str] = mapped_column(
-        String(36), ForeignKey("execution_run.id"), nullable=False, unique=True
+    id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), primary_key=True, server_default=text("gen_random_uuid()")
+    )
+    tenant_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), ForeignKey("tenant.id"), nullable=False
+    )
+    execution_run_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), ForeignKey("execution_run.id"), nullable=False, unique=True
     )
     blob_path: Mapped[str] = mapped_column(String(1000), nullable=False)  # Azure Blob Storage path
     file_size_bytes: Mapped[int] = mapped_column(Integer, nullable=False)
@@ -194,7 +278,13 @@ class Artifact(Base):
     # Indexes
     __table_args__ = (
         Index("idx_artifact_tenant_id", "tenant_id"),
-        Index("idx_artifact_created_at", "created_at"),
+        Index(
+            "idx_artifact_created_at",
+            "created_at",
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32},
+        ),
+        CheckConstraint("file_format IN ('pdf', 'csv', 'xlsx')", name="ck_artifact_file_format"),
     )
 
     def __repr__(self) -> str:
@@ -206,9 +296,15 @@ class DeliveryReceipt(Base):
 
     __tablename__ = "delivery_receipt"
 
-    id: Mapped[str] = mapped_column(String(36), primary_key=True)
-    tenant_id: Mapped[str] = mapped_column(String(36), ForeignKey("tenant.id"), nullable=False)
-    artifact_id: Mapped[str] = mapped_column(String(36), ForeignKey("artifact.id"), nullable=False)
+    id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), primary_key=True, server_default=text("gen_random_uuid()")
+    )
+    tenant_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), ForeignKey("tenant.id"), nullable=False
+    )
+    artifact_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), ForeignKey("artifact.id"), nullable=False
+    )
     channel: Mapped[str] = mapped_column(String(50), nullable=False)  # email, webhook, slack
     recipient: Mapped[str] = mapped_column(String(500), nullable=False)  # email address or URL
     status: Mapped[str] = mapped_column(
@@ -228,6 +324,10 @@ class DeliveryReceipt(Base):
     __table_args__ = (
         Index("idx_delivery_tenant_id", "tenant_id"),
         Index("idx_delivery_artifact_id", "artifact_id"),
+        CheckConstraint("channel IN ('email', 'webhook', 'slack')", name="ck_delivery_channel"),
+        CheckConstraint(
+            "status IN ('pending', 'sent', 'failed', 'bounced')", name="ck_delivery_status"
+        ),
     )
 
     def __repr__(self) -> str:
@@ -239,27 +339,54 @@ class AuditEvent(Base):
 
     __tablename__ = "audit_event"
 
-    id: Mapped[str] = mapped_column(String(36), primary_key=True)
-    tenant_id: Mapped[str] = mapped_column(String(36), ForeignKey("tenant.id"), nullable=False)
-    user_id: Mapped[str] = mapped_column(String(36), nullable=False)
+    id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), primary_key=True, server_default=text("gen_random_uuid()")
+    )
+    tenant_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), ForeignKey("tenant.id"), nullable=False
+    )
+    user_id: Mapped[Optional[uuid.UUID]] = mapped_column(
+        UUID(as_uuid=True), nullable=True
+    )  # None for anonymous signed-URL access
     event_type: Mapped[str] = mapped_column(
         String(100), nullable=False
     )  # create_report, delete_schedule, etc.
     resource_type: Mapped[str] = mapped_column(String(100), nullable=False)  # report, schedule, etc.
-    resource_id: Mapped[str] = mapped_column(String(36), nullable=False)
-    event_data: Mapped[Optional[dict]] = mapped_column(JSON, nullable=True)
+    resource_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), nullable=False)
+    event_data: Mapped[Optional[dict]] = mapped_column(JSONB, nullable=True)
     created_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), server_default=func.now(), nullable=False
-    )
+        DateTime(timezone=True), server_default=func.now(), primary_key=True
+    )  # Partition key, so part of the primary key
 
     # Relationships
     tenant: Mapped["Tenant"] = relationship()
 
     # Indexes
     __table_args__ = (
-        Index("idx_audit_tenant_id", "tenant_id"),
-        Index("idx_audit_created_at", "created_at"),
+        Index("idx_audit_tenant_created", "tenant_id", text("created_at DESC")),
+        Index("idx_audit_tenant_id_desc", "tenant_id", text("id DESC")),
+        Index(
+            "idx_audit_tenant_resource",
+            "tenant_id",
+            "resource_type",
+            "resource_id",
+            text("id DESC"),
+        ),
+        Index("idx_audit_tenant_user", "tenant_id", "user_id", text("id DESC")),
+        Index(
+            "idx_audit_created_at",
+            "created_at",
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32},
+        ),
         Index("idx_audit_event_type", "event_type"),
+        Index(
+            "idx_audit_event_data_gin",
+            "event_data",
+            postgresql_using="gin",
+            postgresql_ops={"event_data": "jsonb_path_ops"},
+        ),
+        {"postgresql_partition_by": "RANGE (created_at)"},
     )
 
     def __repr__(self) -> str:
@@ -1,21 +1,91 @@
-"""PostgreSQL implementation of the schedule repository."""
+"""PostgreSQL implementation of the schedule repository.
 
-import base64
-import json
+The engine caches asyncpg prepared statements per connection, keyed by SQL
+text. Keep query shapes stable: bind values instead of inlining them, and
+pass variable-length lists as a single array parameter (``= ANY(:ids)``)
+rather than a sized IN list, so repeated calls hit the cache.
+"""
+
+import uuid
 from datetime import datetime
 from typing import Optional
 
-from sqlalchemy import and_, delete, func, or_, select
+from sqlalchemy import (
+    Integer,
+    and_,
+    bindparam,
+    delete,
+    func,
+    insert,
+    literal,
+    select,
+    tuple_,
+    update,
+)
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import joinedload, raiseload, selectinload
 
+from src.config import settings
 from src.domain.interfaces.schedule_repository import IScheduleRepository
 from src.infrastructure.database.models import Schedule
+from src.utils.pagination import KeysetCursor
+
+# Column attribute names in table order, for bulk_create row dicts
+_SCHEDULE_COLUMNS = tuple(column.key for column in Schedule.__table__.columns)
+
+# Reads never need the session's pending changes flushed first, so skip the
+# autoflush pass (sessions outside the API keep autoflush on)
+_READ_OPTIONS = {"autoflush": False}
+
+# Fixed-shape statements, built once and executed with bound parameters
+_FIND_BY_ID = (
+    select(Schedule)
+    .where(
+        and_(
+            Schedule.id == bindparam("schedule_id"),
+            Schedule.tenant_id == bindparam("tenant_id"),
+        )
+    )
+    .options(
+        # Both are many-to-one: join them into the same SELECT
+        joinedload(Schedule.report_definition),
+        joinedload(Schedule.tenant),
+    )
+)
+_FIND_DUE = (
+    select(Schedule)
+    .where(
+        and_(
+            Schedule.is_active == True,  # noqa: E712
+            Schedule.next_run_at <= bindparam("current_time"),
+            Schedule.next_run_at.is_not(None),
+        )
+    )
+    .order_by(Schedule.next_run_at.asc(), Schedule.id.asc())
+    .limit(bindparam("limit", type_=Integer))
+    # Claim the rows until the caller's transaction ends; concurrent
+    # dispatchers skip them and take the next due schedules instead
+    .with_for_update(skip_locked=True)
+)
+_NEXT_RUN_AT = select(func.min(Schedule.next_run_at)).where(
+    and_(
+        Schedule.is_active == True,  # noqa: E712
+        Schedule.next_run_at.is_not(None),
+    )
+)
+
+# List pages load report_definition only. Outside production, any other
+# relationship access raises instead of lazy loading one row at a time.
+_LIST_OPTIONS = (selectinload(Schedule.report_definition),)
+if settings.is_development or settings.is_test:
+    _LIST_OPTIONS += (raiseload("*"),)
 
 
 class PostgresScheduleRepository(IScheduleRepository):
     """Concrete implementation of schedule repository using PostgreSQL."""
 
+    __slots__ = ("_session",)
+
     def __init__(self, session: AsyncSession):
         """Initialize repository with database session.
         
@@ -27,21 +97,47 @@ class PostgresScheduleRepository(IScheduleRepository):
     async def create(self, schedule: Schedule) -> Schedule:
         """Create a new schedule.
         
+        Relationships are not loaded; use find_by_id when they are needed.
+        Every column must be set on the entity (None included), since no
+        SELECT follows the INSERT to load server-side values.
+        
         Args:
             schedule: The schedule entity to persist
             
         Returns:
-            The created schedule with database-generated fields
+            The created schedule
         """
         self._session.add(schedule)
-        await self._session.flush()  # Populate generated fields
-        await self._session.refresh(schedule)  # Load relationships
+        await self._session.flush()
         return schedule
 
+    async def bulk_create(self, schedules: list[Schedule]) -> list[Schedule]:
+        """Create several schedules with a single multi-row INSERT.
+        
+        Rows go through a Core insert, which SQLAlchemy batches into
+        multi-VALUES statements (insertmanyvalues), instead of the unit of
+        work. The entities are not attached to the session and relationships
+        are not loaded; all column values, including timestamps, must be set
+        by the caller.
+        
+        Args:
+            schedules: The schedule entities to persist
+            
+        Returns:
+            The created schedules, in input order
+        """
+        if schedules:
+            rows = [
+                {key: getattr(schedule, key) for key in _SCHEDULE_COLUMNS}
+                for schedule in schedules
+            ]
+            await self._session.execute(insert(Schedule), rows)
+        return schedules
+
     async def find_by_id(
         self,
-        schedule_id: str,
-        tenant_id: str,
+        schedule_id: uuid.UUID,
+        tenant_id: uuid.UUID,
     ) -> Optional[Schedule]:
         """Find a schedule by ID within a tenant.
         
@@ -52,25 +148,16 @@ class PostgresScheduleRepository(IScheduleRepository):
         Returns:
             The schedule if found, None otherwise
         """
-        stmt = (
-            select(Schedule)
-            .where(
-                and_(
-                    Schedule.id == schedule_id,
-                    Schedule.tenant_id == tenant_id,
-                )
-            )
-            .options(
-                selectinload(Schedule.report_definition),
-                selectinload(Schedule.tenant),
-            )
+        result = await self._session.execute(
+            _FIND_BY_ID,
+            {"schedule_id": schedule_id, "tenant_id": tenant_id},
+            execution_options=_READ_OPTIONS,
         )
-        result = await self._session.execute(stmt)
         return result.scalar_one_or_none()
 
     async def find_by_tenant_id(
         self,
-        tenant_id: str,
+        tenant_id: uuid.UUID,
         cursor: Optional[str] = None,
         limit: int = 20,
         is_active: Optional[bool] = None,
@@ -79,7 +166,7 @@ class PostgresScheduleRepository(IScheduleRepository):
         
         Args:
             tenant_id: The tenant unique identifier
-            cursor: Opaque cursor for pagination (base64-encoded timestamp+id)
+            cursor: Opaque cursor for pagination (signed KeysetCursor token)
             limit: Maximum number of schedules to return (default: 20, max: 100)
             is_active: Filter by active status (None = all schedules)
             
@@ -96,24 +183,19 @@ class PostgresScheduleRepository(IScheduleRepository):
             conditions.append(Schedule.is_active == is_active)
 
         # Decode cursor for pagination
-        cursor_created_at: Optional[datetime] = None
-        cursor_id: Optional[str] = None
         if cursor:
             try:
-                decoded = base64.b64decode(cursor).decode("utf-8")
-                cursor_data = json.loads(decoded)
-                cursor_created_at = datetime.fromisoformat(cursor_data["created_at"])
-                cursor_id = cursor_data["id"]
+                position = KeysetCursor.decode(cursor, settings.JWT_SECRET)
+                # Row-value comparison is an index range condition on
+                # idx_schedule_tenant_list, unlike the equivalent OR form.
                 conditions.append(
-                    or_(
-                        Schedule.created_at < cursor_created_at,
-                        and_(
-                            Schedule.created_at == cursor_created_at,
-                            Schedule.id < cursor_id,
-                        ),
+                    tuple_(Schedule.created_at, Schedule.id)
+                    < tuple_(
+                        literal(position.created_at, Schedule.created_at.type),
+                        literal(position.id, Schedule.id.type),
                     )
                 )
-            except (ValueError, KeyError, json.JSONDecodeError):
+            except ValueError:
                 # Invalid cursor, ignore and return from start
                 pass
 
@@ -123,10 +205,10 @@ class PostgresScheduleRepository(IScheduleRepository):
             .where(and_(*conditions))
             .order_by(Schedule.created_at.desc(), Schedule.id.desc())
             .limit(limit + 1)
-            .options(selectinload(Schedule.report_definition))
+            .options(*_LIST_OPTIONS)
         )
 
-        result = await self._session.execute(stmt)
+        result = await self._session.execute(stmt, execution_options=_READ_OPTIONS)
         schedules = list(result.scalars().all())
 
         # Calculate next cursor
@@ -134,13 +216,10 @@ class PostgresScheduleRepository(IScheduleRepository):
         if len(schedules) > limit:
             schedules = schedules[:limit]  # Remove the extra row
             last_schedule = schedules[-1]
-            cursor_data = {
-                "created_at": last_schedule.created_at.isoformat(),
-                "id": last_schedule.id,
-            }
-            next_cursor = base64.b64encode(
-                json.dumps(cursor_data).encode("utf-8")
-            ).decode("utf-8")
+            next_cursor = KeysetCursor(
+                created_at=last_schedule.created_at,
+                id=last_schedule.id,
+            ).encode(settings.JWT_SECRET)
 
         return schedules, next_cursor
 
@@ -151,6 +230,12 @@ class PostgresScheduleRepository(IScheduleRepository):
     ) -> list[Schedule]:
         """Find schedules that are due for execution.
         
+        The rows are locked FOR UPDATE SKIP LOCKED, so the caller should
+        update next_run_at and commit in the same transaction.
+        
+        Relationships are not loaded: the dispatcher only needs the
+        schedule's own columns.
+        
         Args:
             current_time: The reference time for finding due schedules
             limit: Maximum number of schedules to return (default: 100)
@@ -158,25 +243,28 @@ class PostgresScheduleRepository(IScheduleRepository):
         Returns:
             List of schedules where next_run_at <= current_time and is_active = True
         """
-        stmt = (
-            select(Schedule)
-            .where(
-                and_(
-                    Schedule.is_active == True,  # noqa: E712
-                    Schedule.next_run_at <= current_time,
-                    Schedule.next_run_at.is_not(None),
-                )
-            )
-            .order_by(Schedule.next_run_at.asc())
-            .limit(limit)
-            .options(
-                selectinload(Schedule.report_definition),
-                selectinload(Schedule.tenant),
-            )
+        result = await self._session.execute(
+            _FIND_DUE,
+            {"current_time": current_time, "limit": limit},
+            execution_options=_READ_OPTIONS,
         )
-        result = await self._session.execute(stmt)
         return list(result.scalars().all())
 
+    async def find_next_run_at(self) -> Optional[datetime]:
+        """Find the earliest upcoming run time across active schedules.
+        
+        Reads the first entry of idx_schedule_due, so the cost does not grow
+        with the number of schedules.
+        
+        Returns:
+            The smallest next_run_at of any active schedule, or None if there
+            are none
+        """
+        result = await self._session.execute(
+            _NEXT_RUN_AT, execution_options=_READ_OPTIONS
+        )
+        return result.scalar_one()
+
     async def update(self, schedule: Schedule) -> Schedule:
         """Update an existing schedule.
         
@@ -186,15 +274,31 @@ class PostgresScheduleRepository(IScheduleRepository):
         Returns:
             The updated schedule
         """
-        schedule.updated_at = datetime.utcnow()
+        # updated_at is set by the database (onupdate=now()) and returned by
+        # the same UPDATE, since Schedule maps with eager_defaults
         await self._session.flush()
-        await self._session.refresh(schedule)
         return schedule
 
+    async def update_run_times(self, updates: list[dict]) -> None:
+        """Set run bookkeeping columns on many schedules in one batch.
+        
+        An ORM bulk UPDATE by primary key, sent as a single executemany.
+        Flushing the same changes through the unit of work would issue one
+        UPDATE ... RETURNING per row, since Schedule maps with eager_defaults.
+        updated_at is still set by the column's onupdate default. Loaded
+        entities are not refreshed.
+        
+        Args:
+            updates: One dict per schedule with id, last_run_at, next_run_at
+                and is_active
+        """
+        if updates:
+            await self._session.execute(update(Schedule), updates)
+
     async def delete(
         self,
-        schedule_id: str,
-        tenant_id: str,
+        schedule_id: uuid.UUID,
+        tenant_id: uuid.UUID,
     ) -> bool:
         """Delete a schedule by ID within a tenant.
         
@@ -216,7 +320,7 @@ class PostgresScheduleRepository(IScheduleRepository):
 
     async def count_by_tenant_id(
         self,
-        tenant_id: str,
+        tenant_id: uuid.UUID,
         is_active: Optional[bool] = None,
     ) -> int:
         """Count schedules for a tenant.
@@ -233,5 +337,5 @@ class PostgresScheduleRepository(IScheduleRepository):
             conditions.append(Schedule.is_active == is_active)
 
         stmt = select(func.count()).select_from(Schedule).where(and_(*conditions))
-        result = await self._session.execute(stmt)
+        result = await self._session.execute(stmt, execution_options=_READ_OPTIONS)
         return result.scalar_one()
@@ -1,6 +1,8 @@
 """Database session management."""
 
-from typing import AsyncGenerator
+from typing import Any, AsyncGenerator
+
+import orjson
 from sqlalchemy.ext.asyncio import (
     AsyncSession,
     create_async_engine,
@@ -8,12 +10,40 @@ from sqlalchemy.ext.asyncio import (
 )
 from src.config import settings
 
+
+def json_serializer(value: Any) -> str:
+    """Serialize JSONB bind values with orjson.
+
+    Non-string keys are coerced to strings, as the stdlib encoder does.
+    """
+    return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
+json_deserializer = orjson.loads
+
+
 # Create async engine
 engine = create_async_engine(
     settings.DATABASE_URL.replace("postgresql://", "postgresql+asyncpg://"),
     pool_size=settings.DB_POOL_SIZE,
     max_overflow=settings.DB_POOL_MAX_OVERFLOW,
+    # Test connections on checkout and rotate old ones, so sockets dropped
+    # by PgBouncer or a load balancer are replaced instead of failing a request
+    pool_pre_ping=True,
+    pool_recycle=settings.DB_POOL_RECYCLE_SECONDS,
+    pool_timeout=settings.DB_POOL_TIMEOUT_SECONDS,
     echo=settings.is_development,
+    # Rows per multi-VALUES INSERT for batched inserts (bulk_create)
+    insertmanyvalues_page_size=1000,
+    json_serializer=json_serializer,
+    json_deserializer=json_deserializer,
+    connect_args={
+        # Reuse server-side prepared statements for the repeated schedule queries
+        "prepared_statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE,
+        "statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE,
+        # Short OLTP queries never benefit from JIT compilation
+        "server_settings": {"jit": "off"},
+    },
 )
 
 # Create session factory
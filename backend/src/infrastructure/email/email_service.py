@@ -1,18 +1,103 @@
 """Email delivery service using Azure Communication Services."""
 
+import asyncio
+import html
 import logging
 from typing import Optional
 
-from azure.communication.email import EmailClient
+from azure.communication.email.aio import EmailClient
 from azure.core.exceptions import AzureError
 
 from src.config import settings
 
 logger = logging.getLogger(__name__)
 
+# Email bodies. The HTML head and tail are constant; only the middle
+# fragment is filled with str.format_map per send.
+_HTML_HEAD = """\
+<!DOCTYPE html>
+<html>
+<head>
+    <style>
+        body { font-family: Arial, sans-serif; line-height: 1.6; color: #333; }
+        .container { max-width: 600px; margin: 0 auto; padding: 20px; }
+        .header { background-color: #1976D2; color: white; padding: 20px; text-align: center; }
+        .content { background-color: #f9f9f9; padding: 30px; }
+        .button { 
+            display: inline-block; 
+            padding: 12px 24px; 
+            background-color: #1976D2; 
+            color: white; 
+            text-decoration: none; 
+            border-radius: 4px;
+            margin: 20px 0;
+        }
+        .footer { text-align: center; padding: 20px; color: #666; font-size: 12px; }
+    </style>
+</head>
+<body>
+    <div class="container">
+        <div class="header">
+            <h1>Your Report is Ready</h1>
+        </div>
+        <div class="content">
+"""
+
+_HTML_BODY_TEMPLATE = """\
+            <p>Hello,</p>
+            <p>Your scheduled report <strong>{report_name}</strong> has been generated successfully.</p>
+            <p><strong>Generated at:</strong> {execution_time}</p>
+            <p>Click the button below to download your report:</p>
+            <div style="text-align: center;">
+                <a href="{artifact_url}" class="button">Download Report</a>
+            </div>
+            <p><em>Note: This link will expire in 24 hours.</em></p>
+"""
+
+_HTML_TAIL = """\
+        </div>
+        <div class="footer">
+            <p>This is an automated message from Report Scheduler.</p>
+            <p>If you have questions, please contact your system administrator.</p>
+        </div>
+    </div>
+</body>
+</html>
+"""
+
+_TEXT_TEMPLATE = """
+Your Report is Ready
+
+Hello,
+
+Your scheduled report "{report_name}" has been generated successfully.
+
+Generated at: {execution_time}
+
+Download your report:
+{artifact_url}
+
+Note: This link will expire in 24 hours.
+
+---
+This is an automated message from Report Scheduler.
+If you have questions, please contact your system administrator.
+""".strip()
+
 
 class EmailService:
-    """Service for sending emails via Azure Communication Services."""
+    """Service for sending emails via Azure Communication Services.
+    
+    Uses the async ACS client; use as an async context manager (or call
+    close()) so the HTTP session is released.
+    """
+    
+    # ACS accepts at most this many recipients (to + cc + bcc) per message
+    MAX_RECIPIENTS_PER_MESSAGE = 50
+    
+    # Messages in flight at once per service instance, to stay within ACS
+    # rate limits on very large recipient lists
+    MAX_CONCURRENT_SENDS = 16
     
     def __init__(self):
         """Initialize Email client."""
@@ -23,8 +108,20 @@ class EmailService:
         else:
             logger.warning("ACS_CONNECTION_STRING not configured, email sending disabled")
             self._client = None
+        self._send_semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_SENDS)
+    
+    async def __aenter__(self) -> "EmailService":
+        return self
+    
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+    
+    async def close(self) -> None:
+        """Close the underlying HTTP session."""
+        if self._client:
+            await self._client.close()
     
-    def send_report_email(
+    async def send_report_email(
         self,
         recipients: list[str],
         subject: str,
@@ -36,6 +133,10 @@ class EmailService:
     ) -> tuple[bool, Optional[str]]:
         """Send report delivery email with artifact link.
         
+        Recipient lists larger than one ACS message allows are split into
+        several messages sent concurrently (at most MAX_CONCURRENT_SENDS at
+        a time); cc and bcc go on the first one.
+        
         Args:
             recipients: List of recipient email addresses
             subject: Email subject
@@ -46,62 +147,90 @@ class EmailService:
             bcc: Optional BCC recipients
             
         Returns:
-            Tuple of (success, message_id_or_error)
+            Tuple of (success, message_id_or_error); success only if every
+            message was sent, with message IDs comma-separated
         """
         if not self._client:
             logger.warning("Email client not configured, skipping email delivery")
             return False, "Email service not configured"
         
-        try:
-            # Build HTML email body
-            html_content = self._build_email_html(
+        # Build both bodies once for all messages
+        content = {
+            "subject": subject,
+            "plainText": self._build_email_text(
                 report_name=report_name,
                 execution_time=execution_time,
                 artifact_url=artifact_url,
-            )
-            
-            # Build plain text fallback
-            plain_text = self._build_email_text(
+            ),
+            "html": self._build_email_html(
                 report_name=report_name,
                 execution_time=execution_time,
                 artifact_url=artifact_url,
-            )
-            
-            # Prepare message
+            ),
+        }
+        
+        limit = self.MAX_RECIPIENTS_PER_MESSAGE
+        first = max(limit - len(cc or ()) - len(bcc or ()), 1)
+        chunks = [recipients[:first]] + [
+            recipients[i:i + limit] for i in range(first, len(recipients), limit)
+        ]
+        
+        messages = []
+        for index, chunk in enumerate(chunks):
             message = {
                 "senderAddress": settings.EMAIL_FROM_ADDRESS,
                 "recipients": {
-                    "to": [{"address": email} for email in recipients],
-                },
-                "content": {
-                    "subject": subject,
-                    "plainText": plain_text,
-                    "html": html_content,
+                    "to": [{"address": email} for email in chunk],
                 },
+                "content": content,
             }
+            if index == 0:
+                if cc:
+                    message["recipients"]["cc"] = [{"address": email} for email in cc]
+                if bcc:
+                    message["recipients"]["bcc"] = [{"address": email} for email in bcc]
+            messages.append(message)
+        
+        results = await asyncio.gather(
+            *(self._send_message(message, subject) for message in messages)
+        )
+        
+        errors = [value for ok, value in results if not ok]
+        if errors:
+            return False, errors[0]
+        return True, ",".join(value for _, value in results)
+    
+    async def _send_message(
+        self,
+        message: dict,
+        subject: str,
+    ) -> tuple[bool, Optional[str]]:
+        """Send one ACS message and wait for it to be accepted.
+        
+        Args:
+            message: The ACS message payload
+            subject: Email subject (for logging)
             
-            # Add CC if provided
-            if cc:
-                message["recipients"]["cc"] = [{"address": email} for email in cc]
-            
-            # Add BCC if provided
-            if bcc:
-                message["recipients"]["bcc"] = [{"address": email} for email in bcc]
-            
-            # Send email
-            poller = self._client.begin_send(message)
-            result = poller.result()
+        Returns:
+            Tuple of (success, message_id_or_error)
+        """
+        recipients = [entry["address"] for entry in message["recipients"]["to"]]
+        try:
+            async with self._send_semaphore:
+                poller = await self._client.begin_send(message)
+                result = await poller.result()
             
+            message_id = result["id"]  # 1.x returns the operation status as a dict
             logger.info(
-                f"Email sent successfully: {result.message_id}",
+                f"Email sent successfully: {message_id}",
                 extra={
-                    "message_id": result.message_id,
+                    "message_id": message_id,
                     "recipients": recipients,
                     "subject": subject,
                 },
             )
             
-            return True, result.message_id
+            return True, message_id
             
         except AzureError as e:
             logger.error(
@@ -134,50 +263,12 @@ class EmailService:
         Returns:
             HTML email content
         """
-        return f"""
-        <!DOCTYPE html>
-        <html>
-        <head>
-            <style>
-                body {{ font-family: Arial, sans-serif; line-height: 1.6; color: #333; }}
-                .container {{ max-width: 600px; margin: 0 auto; padding: 20px; }}
-                .header {{ background-color: #1976D2; color: white; padding: 20px; text-align: center; }}
-                .content {{ background-color: #f9f9f9; padding: 30px; }}
-                .button {{ 
-                    display: inline-block; 
-                    padding: 12px 24px; 
-                    background-color: #1976D2; 
-                    color: white; 
-                    text-decoration: none; 
-                    border-radius: 4px;
-                    margin: 20px 0;
-                }}
-                .footer {{ text-align: center; padding: 20px; color: #666; font-size: 12px; }}
-            </style>
-        </head>
-        <body>
-            <div class="container">
-                <div class="header">
-                    <h1>Your Report is Ready</h1>
-                </div>
-                <div class="content">
-                    <p>Hello,</p>
-                    <p>Your scheduled report <strong>{report_name}</strong> has been generated successfully.</p>
-                    <p><strong>Generated at:</strong> {execution_time}</p>
-                    <p>Click the button below to download your report:</p>
-                    <div style="text-align: center;">
-                        <a href="{artifact_url}" class="button">Download Report</a>
-                    </div>
-                    <p><em>Note: This link will expire in 24 hours.</em></p>
-                </div>
-                <div class="footer">
-                    <p>This is an automated message from Report Scheduler.</p>
-                    <p>If you have questions, please contact your system administrator.</p>
-                </div>
-            </div>
-        </body>
-        </html>
-        """
+        body = _HTML_BODY_TEMPLATE.format_map({
+            "report_name": html.escape(report_name),
+            "execution_time": html.escape(execution_time),
+            "artifact_url": html.escape(artifact_url, quote=True),
+        })
+        return "".join((_HTML_HEAD, body, _HTML_TAIL))
     
     def _build_email_text(
         self,
@@ -195,21 +286,8 @@ class EmailService:
         Returns:
             Plain text email content
         """
-        return f"""
-Your Report is Ready
-
-Hello,
-
-Your scheduled report "{report_name}" has been generated successfully.
-
-Generated at: {execution_time}
-
-Download your report:
-{artifact_url}
-
-Note: This link will expire in 24 hours.
-
----
-This is an automated message from Report Scheduler.
-If you have questions, please contact your system administrator.
-        """.strip()
+        return _TEXT_TEMPLATE.format_map({
+            "report_name": report_name,
+            "execution_time": execution_time,
+            "artifact_url": artifact_url,
+        })
@@ -8,11 +8,17 @@ import logging
 from src.config import settings
 from src.api.routes import health
 from src.api.middleware.logging import LoggingMiddleware
+from src.domain.services.audit_service import audit_writer
+from src.infrastructure.cache.report_cache import close_shared_redis
+from src.scheduler.scheduler_loop import start_scheduler_loop, stop_scheduler_loop
+from src.utils.logging import JsonFormatter
 
 # Configure logging
+_log_handler = logging.StreamHandler()
+_log_handler.setFormatter(JsonFormatter())
 logging.basicConfig(
     level=getattr(logging, settings.LOG_LEVEL),
-    format='{"timestamp": "%(asctime)s", "level": "%(levelname)s", "message": "%(message)s", "module": "%(name)s"}',
+    handlers=[_log_handler],
 )
 logger = logging.getLogger(__name__)
 
@@ -57,9 +63,11 @@ async def startup_event() -> None:
         extra={"environment": settings.ENVIRONMENT, "version": "1.0.0"},
     )
     
+    # Batch audit event inserts in the background
+    audit_writer.start()
+    
     # Start scheduler loop (Phase 2)
     if settings.ENABLE_SCHEDULER:
-        from src.scheduler.scheduler_loop import start_scheduler_loop
         await start_scheduler_loop()
         logger.info("Scheduler loop started")
 
@@ -69,9 +77,14 @@ async def shutdown_event() -> None:
     """Application shutdown event handler."""
     logger.info("Shutting down Report Scheduler API")
     
+    # Flush pending audit events before the event loop goes away
+    await audit_writer.stop()
+    
+    # Release the shared report cache connection pool
+    await close_shared_redis()
+    
     # Stop scheduler loop (Phase 2)
     if settings.ENABLE_SCHEDULER:
-        from src.scheduler.scheduler_loop import stop_scheduler_loop
         await stop_scheduler_loop()
         logger.info("Scheduler loop stopped")
 
@@ -1 +1 @@
-"""Scheduler package for APScheduler loop."""
+"""Scheduler package for the due-schedule dispatch loop."""
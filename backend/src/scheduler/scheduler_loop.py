@@ -1,31 +1,59 @@
-"""APScheduler service for evaluating and triggering scheduled reports."""
+"""Scheduler loop for evaluating and triggering scheduled reports."""
 
 import asyncio
 import logging
+import time
 from datetime import datetime, timezone
 from typing import Optional
 
-from apscheduler.schedulers.asyncio import AsyncIOScheduler
-from apscheduler.triggers.interval import IntervalTrigger
 from redis.asyncio import Redis
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
-from sqlalchemy.orm import sessionmaker
 
 from src.config import settings
+from src.domain.services.burst_protection import BurstProtectionService
+from src.infrastructure.cache.report_cache import get_shared_redis
 from src.infrastructure.database.repositories.postgres_schedule_repository import (
     PostgresScheduleRepository,
 )
+from src.infrastructure.database.session import json_deserializer, json_serializer
 from src.utils.cron import calculate_next_run
 
 logger = logging.getLogger(__name__)
 
+# Pub/sub channel carrying the epoch time a schedule next falls due
+WAKE_CHANNEL = "scheduler:wake"
+
+
+async def wake_scheduler(next_run_at: Optional[datetime]) -> None:
+    """Tell running scheduler loops about a new or changed next run time.
+    
+    Best effort: without the message the loop still finds the schedule on
+    its next bounded sleep.
+    
+    Args:
+        next_run_at: When the created, updated or resumed schedule falls due
+    """
+    if next_run_at is None:
+        return
+    try:
+        await get_shared_redis().publish(WAKE_CHANNEL, str(next_run_at.timestamp()))
+    except Exception as e:
+        logger.warning(f"Failed to wake scheduler: {e}")
+
 
 class SchedulerLoop:
     """Service for evaluating schedules and enqueuing report generation tasks."""
 
-    LOCK_TTL_SECONDS = 60  # Redis lock TTL
-    SCAN_INTERVAL_SECONDS = 30  # Poll database every 30 seconds
+    MAX_SLEEP_SECONDS = 60  # Longest wait between scans, as a safety net
+    MIN_SLEEP_SECONDS = 1  # Shortest wait after a scan that left work behind
+    # Wait after a scan that advanced nothing while schedules stayed past due
+    # (burst-blocked, broker down, or claimed by another instance)
+    BACKOFF_SECONDS = 30
     BATCH_SIZE = 100  # Max schedules to process per scan
+    # Pub/sub and burst checks each hold at most one
+    REDIS_MAX_CONNECTIONS = 4
+    # Published by name, so the scheduler never imports the worker task module
+    GENERATE_REPORT_TASK = "src.workers.tasks.generate_report"
 
     def __init__(
         self,
@@ -36,14 +64,17 @@ class SchedulerLoop:
         
         Args:
             database_url: Async PostgreSQL connection string
-            redis_url: Redis connection string for distributed locking
+            redis_url: Redis connection string for wake-ups and burst protection
         """
         self._database_url = database_url
         self._redis_url = redis_url
-        self._scheduler: Optional[AsyncIOScheduler] = None
+        self._task: Optional[asyncio.Task] = None
+        self._scan_task: Optional[asyncio.Task] = None
         self._redis: Optional[Redis] = None
+        self._burst_protection: Optional[BurstProtectionService] = None
+        self._celery_app = None
         self._engine = None
-        self._session_maker = None
+        self._session: Optional[AsyncSession] = None
 
     async def start(self) -> None:
         """Start the scheduler loop."""
@@ -55,73 +86,166 @@ class SchedulerLoop:
             echo=False,
             pool_size=5,
             max_overflow=10,
+            json_serializer=json_serializer,
+            json_deserializer=json_deserializer,
         )
-        self._session_maker = sessionmaker(
-            self._engine,
-            class_=AsyncSession,
-            expire_on_commit=False,
-        )
+        # One session for the loop's lifetime; each use runs in its own
+        # transaction, so the connection goes back to the pool in between.
+        # Commits expire loaded schedules, so the next scan sees API edits.
+        self._session = AsyncSession(self._engine)
 
         # Initialize Redis connection
+        # RESP3 with raw bytes replies: nothing the loop reads needs str
+        # (counters and wake times are parsed straight from bytes)
         self._redis = Redis.from_url(
             self._redis_url,
-            encoding="utf-8",
-            decode_responses=True,
+            protocol=3,
+            decode_responses=False,
+            max_connections=self.REDIS_MAX_CONNECTIONS,
+            health_check_interval=30,
+            socket_keepalive=True,
         )
+        self._burst_protection = BurstProtectionService(redis_client=self._redis)
 
-        # Initialize APScheduler
-        self._scheduler = AsyncIOScheduler()
-        self._scheduler.add_job(
-            self._scan_and_trigger,
-            trigger=IntervalTrigger(seconds=self.SCAN_INTERVAL_SECONDS),
-            id="schedule_scanner",
-            name="Scan and trigger due schedules",
-            max_instances=1,
-            replace_existing=True,
-        )
-        self._scheduler.start()
-        logger.info(f"Scheduler loop started (scan interval: {self.SCAN_INTERVAL_SECONDS}s)")
+        self._task = asyncio.create_task(self._run_loop(), name="scheduler_loop")
+        logger.info(f"Scheduler loop started (max sleep: {self.MAX_SLEEP_SECONDS}s)")
 
     async def stop(self) -> None:
         """Stop the scheduler loop."""
         logger.info("Stopping scheduler loop")
 
-        if self._scheduler:
-            self._scheduler.shutdown(wait=True)
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            except Exception as e:
+                logger.error(f"Scheduler loop exited with an error: {e}", exc_info=True)
+
+        # A scan in flight is left to commit: cancelling it would roll back
+        # next_run_at for tasks it already enqueued, re-triggering them later
+        if self._scan_task and not self._scan_task.done():
+            await self._scan_task
 
         if self._redis:
-            await self._redis.close()
+            await self._redis.aclose()
+
+        if self._session:
+            await self._session.close()
 
         if self._engine:
             await self._engine.dispose()
 
         logger.info("Scheduler loop stopped")
 
-    async def _scan_and_trigger(self) -> None:
-        """Scan for due schedules and enqueue report generation tasks."""
-        lock_key = "scheduler:scan_lock"
-        lock_value = f"{asyncio.current_task().get_name()}_{datetime.now().timestamp()}"
-
-        # Acquire distributed lock to prevent duplicate processing
-        acquired = await self._redis.set(
-            lock_key,
-            lock_value,
-            nx=True,
-            ex=self.LOCK_TTL_SECONDS,
-        )
-
-        if not acquired:
-            logger.debug("Another scheduler instance is running, skipping scan")
-            return
+    async def _run_loop(self) -> None:
+        """Scan whenever the earliest schedule falls due.
+        
+        Sleeps until the next known run time (at most MAX_SLEEP_SECONDS),
+        waking early when the API publishes an earlier one on WAKE_CHANNEL.
+        While Redis is unreachable the loop keeps scanning on timed sleeps
+        and re-subscribes on each pass.
+        """
+        pubsub = self._redis.pubsub()
+        subscribed = False
+        deadline = 0.0  # Scan once right away
+        try:
+            while True:
+                try:
+                    delay = deadline - time.time()
+                    if delay <= 0:
+                        self._scan_task = asyncio.create_task(self._scan_and_trigger())
+                        advanced = await asyncio.shield(self._scan_task)
+                        deadline = await self._next_deadline(advanced)
+                        continue
+                    
+                    if not subscribed:
+                        try:
+                            await pubsub.subscribe(WAKE_CHANNEL)
+                            subscribed = True
+                        except asyncio.CancelledError:
+                            raise
+                        except Exception as e:
+                            logger.warning(
+                                f"Scheduler wake-ups unavailable, polling instead: {e}"
+                            )
+                            await pubsub.aclose()
+                            await asyncio.sleep(delay)
+                            continue
+                    
+                    try:
+                        message = await pubsub.get_message(
+                            ignore_subscribe_messages=True,
+                            timeout=delay,
+                        )
+                    except asyncio.CancelledError:
+                        raise
+                    except Exception as e:
+                        logger.warning(f"Lost scheduler wake-up channel: {e}")
+                        subscribed = False
+                        await pubsub.aclose()
+                        await asyncio.sleep(self.MIN_SLEEP_SECONDS)
+                        continue
+                    if message is not None:
+                        deadline = min(deadline, float(message["data"]))
+                except asyncio.CancelledError:
+                    raise
+                except Exception as e:
+                    logger.error(f"Scheduler loop iteration failed: {e}", exc_info=True)
+                    await asyncio.sleep(self.MAX_SLEEP_SECONDS)
+                    deadline = 0.0
+        finally:
+            await pubsub.aclose()
 
+    async def _next_deadline(self, advanced: int) -> float:
+        """Work out when to scan next.
+        
+        Args:
+            advanced: Number of schedules the last scan moved to their next run
+            
+        Returns:
+            Epoch seconds of the next scan
+        """
+        now = time.time()
+        if advanced >= self.BATCH_SIZE:
+            return now  # Batch was full; more schedules may be due already
+        
+        async with self._session.begin():
+            next_run_at = await PostgresScheduleRepository(self._session).find_next_run_at()
+        
+        latest = now + self.MAX_SLEEP_SECONDS
+        if next_run_at is None:
+            return latest
+        if next_run_at.timestamp() <= now:
+            # The head is still past due: those schedules were blocked, failed
+            # to publish or are claimed elsewhere. Rescanning at once would
+            # only repeat that, so back off unless the scan made progress.
+            return now + (self.MIN_SLEEP_SECONDS if advanced else self.BACKOFF_SECONDS)
+        return min(next_run_at.timestamp(), latest)
+
+    async def _scan_and_trigger(self) -> int:
+        """Scan for due schedules and enqueue report generation tasks.
+        
+        Safe to run on several instances at once: find_due_schedules locks
+        the rows it returns FOR UPDATE SKIP LOCKED, so each scan claims a
+        disjoint batch until its transaction commits. A crashed instance's
+        claims are released with its connection.
+        
+        Returns:
+            Number of schedules advanced to their next run; burst-blocked
+            schedules and a batch that failed to publish are not counted
+        """
         try:
             start_time = datetime.now(timezone.utc)
             logger.info(f"Starting schedule scan at {start_time.isoformat()}")
 
-            async with self._session_maker() as session:
+            # Commits on exit, after every enqueue, releasing the row locks
+            session = self._session
+            async with session.begin():
                 repository = PostgresScheduleRepository(session)
 
-                # Find schedules that are due
+                # Find and claim schedules that are due
                 due_schedules = await repository.find_due_schedules(
                     current_time=start_time,
                     limit=self.BATCH_SIZE,
@@ -129,136 +253,164 @@ class SchedulerLoop:
 
                 if not due_schedules:
                     logger.debug("No due schedules found")
-                    return
+                    return 0
 
                 logger.info(f"Found {len(due_schedules)} due schedules")
 
-                # Process each schedule
-                for schedule in due_schedules:
-                    try:
-                        await self._trigger_schedule(schedule, session)
-                    except Exception as e:
-                        logger.error(
-                            f"Failed to trigger schedule {schedule.id}: {e}",
-                            exc_info=True,
-                            extra={
-                                "schedule_id": schedule.id,
-                                "tenant_id": schedule.tenant_id,
-                            },
-                        )
+                try:
+                    updates = await self._trigger_schedules(
+                        due_schedules, session, start_time
+                    )
+                except Exception as e:
+                    logger.error(f"Failed to trigger due schedules: {e}", exc_info=True)
+                    updates = []
 
-                # Commit all schedule updates
-                await session.commit()
+                # Outside the try: a failed write must roll back, not commit
+                await repository.update_run_times(updates)
 
             duration = (datetime.now(timezone.utc) - start_time).total_seconds()
             logger.info(
                 f"Schedule scan completed in {duration:.2f}s, "
-                f"triggered {len(due_schedules)} schedules"
+                f"triggered {len(updates)} of {len(due_schedules)} due schedules"
             )
 
             # TODO: Emit metrics
             # await metrics.histogram("scheduler_scan_duration_seconds", duration)
-            # await metrics.counter("schedules_triggered_total", len(due_schedules))
+            # await metrics.counter("schedules_triggered_total", len(updates))
+            return len(updates)
 
         except Exception as e:
             logger.error(f"Schedule scan failed: {e}", exc_info=True)
-        finally:
-            # Release lock
-            await self._redis.delete(lock_key)
+            return 0
 
-    async def _trigger_schedule(
+    async def _trigger_schedules(
         self,
-        schedule,
+        schedules: list,
         session: AsyncSession,
-    ) -> None:
-        """Trigger a single schedule by enqueuing a Celery task.
+        now: datetime,
+    ) -> list[dict]:
+        """Trigger a batch of due schedules by enqueuing Celery tasks.
+        
+        Burst protection is checked for the whole batch with one Redis read,
+        and the allowed schedules are published over one broker connection.
+        The schedule entities are not modified; the caller writes the
+        returned updates.
         
         Args:
-            schedule: The schedule to trigger
-            session: Database session for updating schedule
+            schedules: The due schedules
+            session: Database session for the burst-protection fallback
+            now: The scan time, used as last_run_at and as the base for
+                next_run_at
+            
+        Returns:
+            Rows for update_run_times, one per triggered schedule
         """
-        logger.info(
-            f"Triggering schedule {schedule.id} ({schedule.name})",
-            extra={
-                "schedule_id": schedule.id,
-                "tenant_id": schedule.tenant_id,
-                "report_definition_id": schedule.report_definition_id,
-            },
+        # Check burst protection before enqueuing (fails open on errors)
+        decisions = await self._burst_protection.check_can_execute_many(
+            [str(schedule.tenant_id) for schedule in schedules],
+            session=session,
         )
-
-        # Check burst protection before enqueuing
-        try:
-            from src.domain.services.burst_protection import BurstProtectionService
-            
-            burst_protection = BurstProtectionService()
-            can_execute, reason = await burst_protection.check_can_execute(
-                tenant_id=schedule.tenant_id,
-            )
-            
-            if not can_execute:
-                logger.warning(
-                    f"Skipping schedule {schedule.id} due to burst protection: {reason}",
-                    extra={
-                        "schedule_id": schedule.id,
-                        "tenant_id": schedule.tenant_id,
-                        "reason": reason,
-                    },
-                )
-                # Don't update schedule timestamps - will retry next scan
-                return
-            
-        except Exception as e:
-            logger.error(
-                f"Burst protection check failed for schedule {schedule.id}: {e}",
-                exc_info=True,
-            )
-            # Continue with enqueue if burst protection check fails
-
-        # Enqueue Celery task for report generation
-        try:
-            from src.workers.tasks import generate_report
-            
-            task = generate_report.delay(
-                tenant_id=schedule.tenant_id,
-                schedule_id=schedule.id,
-                report_definition_id=schedule.report_definition_id,
-                email_delivery_config=schedule.email_delivery_config,
-            )
-            
-            logger.info(
-                f"Enqueued report generation task {task.id} for schedule {schedule.id}",
+        
+        allowed = []
+        for schedule, (can_execute, reason) in zip(schedules, decisions, strict=True):
+            if can_execute:
+                allowed.append(schedule)
+                continue
+            logger.warning(
+                f"Skipping schedule {schedule.id} due to burst protection: {reason}",
                 extra={
                     "schedule_id": schedule.id,
-                    "task_id": task.id,
+                    "tenant_id": schedule.tenant_id,
+                    "reason": reason,
                 },
             )
-        except Exception as e:
-            logger.error(
-                f"Failed to enqueue task for schedule {schedule.id}: {e}",
-                exc_info=True,
-                extra={"schedule_id": schedule.id},
-            )
-            # Don't raise - continue processing other schedules
+            # Don't update schedule timestamps - will retry next scan
+        
+        if not allowed:
+            return []
+        
+        # Publishing blocks on broker I/O; do the whole batch in one thread hop
+        await asyncio.to_thread(self._enqueue_reports, allowed)
+        
+        # Update schedule timestamps, even where the enqueue failed, so a
+        # broken schedule is not re-triggered on every scan
+        updates = []
+        for schedule in allowed:
+            update = {
+                "id": schedule.id,
+                "last_run_at": now,
+                "next_run_at": schedule.next_run_at,
+                "is_active": True,
+            }
+            try:
+                update["next_run_at"] = calculate_next_run(
+                    cron_expr=schedule.cron_expression,
+                    tz=schedule.timezone,
+                    base_time=now,
+                )
+            except ValueError as e:
+                logger.error(
+                    f"Failed to calculate next run for schedule {schedule.id}: {e}",
+                    extra={"schedule_id": schedule.id},
+                )
+                # Disable schedule if cron calculation fails
+                update["is_active"] = False
+            updates.append(update)
+        return updates
 
-        # Update schedule timestamps
-        schedule.last_run_at = datetime.now(timezone.utc)
+    def _enqueue_reports(self, schedules: list) -> None:
+        """Publish a generate_report task per schedule on a single producer.
+        
+        ``delay()`` acquires and releases a pooled producer for every call;
+        holding one for the batch reuses its connection and channel. The
+        queue comes from the app's task_routes, as it would for ``delay()``.
+        
+        Args:
+            schedules: The schedules to enqueue
+        """
+        if self._celery_app is None:
+            # Loaded on first enqueue, inside the scan's error handling, so a
+            # broken worker/Celery config fails scans, not API startup
+            from src.workers.celery_app import celery_app
 
-        # Calculate next run time
-        try:
-            schedule.next_run_at = calculate_next_run(
-                cron_expr=schedule.cron_expression,
-                tz=schedule.timezone,
-            )
-        except ValueError as e:
-            logger.error(
-                f"Failed to calculate next run for schedule {schedule.id}: {e}",
-                extra={"schedule_id": schedule.id},
-            )
-            # Disable schedule if cron calculation fails
-            schedule.is_active = False
+            self._celery_app = celery_app
 
-        # Persist changes (will be committed by caller)
-        session.add(schedule)
+        with self._celery_app.producer_or_acquire() as producer:
+            for schedule in schedules:
+                logger.info(
+                    f"Triggering schedule {schedule.id} ({schedule.name})",
+                    extra={
+                        "schedule_id": schedule.id,
+                        "tenant_id": schedule.tenant_id,
+                        "report_definition_id": schedule.report_definition_id,
+                    },
+                )
+                try:
+                    task = self._celery_app.send_task(
+                        self.GENERATE_REPORT_TASK,
+                        kwargs={
+                            "tenant_id": str(schedule.tenant_id),
+                            "schedule_id": str(schedule.id),
+                            "report_definition_id": str(schedule.report_definition_id),
+                            "email_delivery_config": schedule.email_delivery_config,
+                        },
+                        producer=producer,
+                    )
+                    
+                    logger.info(
+                        f"Enqueued report generation task {task.id} for schedule {schedule.id}",
+                        extra={
+                            "schedule_id": schedule.id,
+                            "task_id": task.id,
+                        },
+                    )
+                except Exception as e:
+                    logger.error(
+                        f"Failed to enqueue task for schedule {schedule.id}: {e}",
+                        exc_info=True,
+                        extra={"schedule_id": schedule.id},
+                    )
+                    # Don't raise - continue processing other schedules
 
 
 # Singleton instance
@@ -1,10 +1,121 @@
 """Cron expression validation and calculation utilities."""
 
-from datetime import datetime, timezone
-from typing import Optional
+import time
+from datetime import datetime, timezone, tzinfo
+from functools import lru_cache
+from itertools import islice
+from typing import NamedTuple, Optional
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 
-from croniter import croniter
-import pytz
+from cronsim import CronSim, CronSimError
+
+# Standard five-field expressions only: cronsim would read a sixth field as
+# leading seconds, where croniter (used before) read it as trailing seconds
+_CRON_FIELDS = 5
+
+# Fixed base used only to validate expressions
+_VALIDATION_BASE = datetime(2000, 1, 1, tzinfo=timezone.utc)
+
+
+class CompiledCron(NamedTuple):
+    """A validated cron expression bound to its timezone.
+    
+    Immutable, so one compiled object can be shared; :func:`iter_from`
+    starts a fresh iterator from it for each base time.
+    """
+
+    expr: str
+    tz: tzinfo
+
+
+@lru_cache(maxsize=1024)
+def compile_cron(cron_expr: str, tz: str = "UTC") -> CompiledCron:
+    """Validate a cron expression and resolve its timezone, memoized per pair.
+    
+    Args:
+        cron_expr: The cron expression (e.g., "0 9 * * *")
+        tz: The timezone string (e.g., "America/New_York")
+        
+    Returns:
+        The compiled cron expression
+        
+    Raises:
+        ValueError: If cron expression or timezone is invalid
+    """
+    return CompiledCron(expr=_parse_cron(cron_expr), tz=_timezone(tz))
+
+
+@lru_cache(maxsize=1024)
+def _parse_cron(cron_expr: str) -> str:
+    """Validate a cron expression once, shared by every timezone using it.
+    
+    Raises:
+        ValueError: If the cron expression is invalid
+    """
+    if len(cron_expr.split()) != _CRON_FIELDS:
+        raise ValueError(f"Invalid cron expression: expected {_CRON_FIELDS} fields")
+    try:
+        CronSim(cron_expr, _VALIDATION_BASE)
+    except (CronSimError, ValueError) as e:
+        raise ValueError(f"Invalid cron expression: {str(e)}") from e
+    return cron_expr
+
+
+@lru_cache(maxsize=512)
+def _timezone(tz: str) -> tzinfo:
+    """Resolve a timezone name once, shared by every expression using it.
+    
+    Raises:
+        ValueError: If the timezone is unknown
+    """
+    try:
+        return ZoneInfo(tz)
+    except (ZoneInfoNotFoundError, ValueError) as e:
+        # ValueError covers malformed keys such as absolute paths
+        raise ValueError(f"Invalid timezone: {tz}") from e
+
+
+def iter_from(compiled: CompiledCron, base_time: Optional[datetime] = None) -> CronSim:
+    """Get a fresh iterator over a compiled expression.
+    
+    Args:
+        compiled: The compiled cron expression
+        base_time: The reference time (defaults to now in the compiled timezone)
+        
+    Returns:
+        An iterator over the run times after base_time, in the compiled
+        timezone
+    """
+    timezone_obj = compiled.tz
+    if base_time is None:
+        base_time = datetime.now(timezone_obj)
+    elif base_time.tzinfo is None:
+        # Interpret naive datetime as wall time in the specified timezone
+        base_time = base_time.replace(tzinfo=timezone_obj)
+    else:
+        # Convert to the specified timezone
+        base_time = base_time.astimezone(timezone_obj)
+
+    return CronSim(compiled.expr, base_time)
+
+
+def next_run_from(
+    compiled: CompiledCron,
+    base_time: Optional[datetime] = None,
+) -> datetime:
+    """Calculate the next run time for a compiled cron expression.
+    
+    Args:
+        compiled: The compiled cron expression
+        base_time: The reference time (defaults to now in the compiled timezone)
+        
+    Returns:
+        The next run datetime in UTC with timezone info
+    """
+    next_run = next(iter_from(compiled, base_time))
+
+    # Convert to UTC
+    return next_run.astimezone(timezone.utc)
 
 
 def validate_cron_expression(cron_expr: str) -> tuple[bool, Optional[str]]:
@@ -18,10 +129,11 @@ def validate_cron_expression(cron_expr: str) -> tuple[bool, Optional[str]]:
         error_message is None if valid
     """
     try:
-        croniter(cron_expr)
+        # Warms the check that compile_cron reuses for any timezone
+        _parse_cron(cron_expr)
         return True, None
-    except (ValueError, KeyError) as e:
-        return False, f"Invalid cron expression: {str(e)}"
+    except ValueError as e:
+        return False, str(e)
 
 
 def calculate_next_run(
@@ -42,25 +154,7 @@ def calculate_next_run(
     Raises:
         ValueError: If cron expression or timezone is invalid
     """
-    try:
-        timezone_obj = pytz.timezone(tz)
-    except pytz.exceptions.UnknownTimeZoneError as e:
-        raise ValueError(f"Invalid timezone: {tz}") from e
-
-    if base_time is None:
-        base_time = datetime.now(timezone_obj)
-    elif base_time.tzinfo is None:
-        # Localize naive datetime to the specified timezone
-        base_time = timezone_obj.localize(base_time)
-    else:
-        # Convert to the specified timezone
-        base_time = base_time.astimezone(timezone_obj)
-
-    cron = croniter(cron_expr, base_time)
-    next_run = cron.get_next(datetime)
-
-    # Convert to UTC
-    return next_run.astimezone(timezone.utc)
+    return next_run_from(compile_cron(cron_expr, tz), base_time)
 
 
 def get_next_n_runs(
@@ -87,27 +181,50 @@ def get_next_n_runs(
     """
     n = min(n, 20)  # Cap at 20 to prevent abuse
 
-    try:
-        timezone_obj = pytz.timezone(tz)
-    except pytz.exceptions.UnknownTimeZoneError as e:
-        raise ValueError(f"Invalid timezone: {tz}") from e
+    cron = iter_from(compile_cron(cron_expr, tz), base_time)
+    return [next_run.astimezone(timezone.utc) for next_run in islice(cron, n)]
 
-    if base_time is None:
-        base_time = datetime.now(timezone_obj)
-    elif base_time.tzinfo is None:
-        base_time = timezone_obj.localize(base_time)
-    else:
-        base_time = base_time.astimezone(timezone_obj)
 
-    cron = croniter(cron_expr, base_time)
-    runs = []
-    for _ in range(n):
-        next_run = cron.get_next(datetime)
-        runs.append(next_run.astimezone(timezone.utc))
+def get_next_n_runs_cached(
+    cron_expr: str,
+    n: int = 5,
+    tz: str = "UTC",
+) -> list[datetime]:
+    """Get the next N run times from now, memoized per wall-clock minute.
+    
+    Preview requests for the same expression within the same minute share
+    one computation. The base time is truncated to the start of the
+    current minute, which yields the same runs as "now" for minute-level
+    cron expressions.
+    
+    Args:
+        cron_expr: The cron expression (e.g., "0 9 * * *")
+        n: Number of future runs to calculate (default: 5, max: 20)
+        tz: The timezone string (e.g., "America/New_York")
+        
+    Returns:
+        List of next N run datetimes in UTC with timezone info
+        
+    Raises:
+        ValueError: If cron expression or timezone is invalid
+    """
+    minute = int(time.time() // 60)
+    return list(_next_n_runs_for_minute(cron_expr, n, tz, minute))
+
 
-    return runs
+@lru_cache(maxsize=4096)
+def _next_n_runs_for_minute(
+    cron_expr: str,
+    n: int,
+    tz: str,
+    minute: int,
+) -> tuple[datetime, ...]:
+    """Cached worker for get_next_n_runs_cached keyed on the minute bucket."""
+    base_time = datetime.fromtimestamp(minute * 60, tz=timezone.utc)
+    return tuple(get_next_n_runs(cron_expr=cron_expr, n=n, tz=tz, base_time=base_time))
 
 
+@lru_cache(maxsize=4096)
 def get_human_readable_cron(cron_expr: str) -> str:
     """Convert cron expression to human-readable description.
     
@@ -2,11 +2,122 @@
 
 import logging
 from datetime import datetime, timedelta, timezone
-from typing import Optional
+from typing import Callable, Optional
 
 logger = logging.getLogger(__name__)
 
 
+_MIDNIGHT = {"hour": 0, "minute": 0, "second": 0, "microsecond": 0}
+_END_OF_DAY = {"hour": 23, "minute": 59, "second": 59}
+
+DateRange = tuple[datetime, datetime]
+
+
+def _trailing(delta: timedelta) -> Callable[[datetime], DateRange]:
+    """Build a handler for the window of length delta ending at the reference."""
+    def handler(reference_date: datetime) -> DateRange:
+        return reference_date - delta, reference_date
+
+    return handler
+
+
+def _yesterday(reference_date: datetime) -> DateRange:
+    """Previous calendar day, midnight to 23:59:59."""
+    start_date = (reference_date - timedelta(days=1)).replace(**_MIDNIGHT)
+    return start_date, start_date.replace(**_END_OF_DAY)
+
+
+def _last_week(reference_date: datetime) -> DateRange:
+    """Previous Monday through Sunday."""
+    last_monday = reference_date - timedelta(days=reference_date.weekday() + 7)
+    start_date = last_monday.replace(**_MIDNIGHT)
+    return start_date, (start_date + timedelta(days=6)).replace(**_END_OF_DAY)
+
+
+def _last_month(reference_date: datetime) -> DateRange:
+    """Previous calendar month."""
+    end_date = reference_date.replace(day=1, **_MIDNIGHT) - timedelta(microseconds=1)
+    return end_date.replace(day=1, **_MIDNIGHT), end_date
+
+
+def _month_to_date(reference_date: datetime) -> DateRange:
+    """First day of the current month to the reference."""
+    return reference_date.replace(day=1, **_MIDNIGHT), reference_date
+
+
+def _quarter_to_date(reference_date: datetime) -> DateRange:
+    """First day of the current quarter to the reference."""
+    first_month_of_quarter = (reference_date.month - 1) // 3 * 3 + 1
+    return reference_date.replace(month=first_month_of_quarter, day=1, **_MIDNIGHT), reference_date
+
+
+def _year_to_date(reference_date: datetime) -> DateRange:
+    """First day of the current year to the reference."""
+    return reference_date.replace(month=1, day=1, **_MIDNIGHT), reference_date
+
+
+def _last_year(reference_date: datetime) -> DateRange:
+    """Previous calendar year."""
+    year = reference_date.year - 1
+    return (
+        reference_date.replace(year=year, month=1, day=1, **_MIDNIGHT),
+        reference_date.replace(year=year, month=12, day=31, **_END_OF_DAY),
+    )
+
+
+_DEFAULT_RANGE_TYPE = "last_7_days"
+
+# range_type -> handler returning (start_date, end_date)
+_RANGE_HANDLERS: dict[str, Callable[[datetime], DateRange]] = {
+    "last_7_days": _trailing(timedelta(days=7)),
+    "last_30_days": _trailing(timedelta(days=30)),
+    "last_90_days": _trailing(timedelta(days=90)),
+    "yesterday": _yesterday,
+    "last_week": _last_week,
+    "last_month": _last_month,
+    "month_to_date": _month_to_date,
+    "quarter_to_date": _quarter_to_date,
+    "year_to_date": _year_to_date,
+    "last_year": _last_year,
+    "last_hour": _trailing(timedelta(hours=1)),
+    "last_24_hours": _trailing(timedelta(hours=24)),
+}
+
+
+def range_bounds(
+    range_type: str,
+    reference_date: Optional[datetime] = None,
+    timezone_str: str = "UTC",
+) -> DateRange:
+    """Calculate the (start_date, end_date) bounds of a date range.
+    
+    Args:
+        range_type: Type of date range (e.g., "last_7_days", "last_30_days", 
+                   "last_month", "month_to_date", "year_to_date", "custom")
+        reference_date: Reference date for calculations (default: now);
+            naive values are taken as UTC
+        timezone_str: Timezone for date calculations
+        
+    Returns:
+        Tuple of (start_date, end_date) as timezone-aware datetimes
+    """
+    if reference_date is None:
+        reference_date = datetime.now(timezone.utc)
+    
+    # Ensure datetime is timezone-aware
+    if reference_date.tzinfo is None:
+        reference_date = reference_date.replace(tzinfo=timezone.utc)
+    
+    handler = _RANGE_HANDLERS.get(range_type)
+    if handler is None:
+        # Default to last 7 days
+        logger.warning(
+            f"Unknown range_type '{range_type}', defaulting to {_DEFAULT_RANGE_TYPE}"
+        )
+        handler = _RANGE_HANDLERS[_DEFAULT_RANGE_TYPE]
+    return handler(reference_date)
+
+
 class DateRangeCalculator:
     """Calculate date ranges for scheduled reports."""
     
@@ -16,7 +127,10 @@ class DateRangeCalculator:
         reference_date: Optional[datetime] = None,
         timezone_str: str = "UTC",
     ) -> dict:
-        """Calculate date range based on range type.
+        """Calculate date range based on range type, with its metadata.
+        
+        For response payloads; code that only needs the bounds should call
+        :func:`range_bounds` directly.
         
         Args:
             range_type: Type of date range (e.g., "last_7_days", "last_30_days", 
@@ -25,121 +139,20 @@ class DateRangeCalculator:
             timezone_str: Timezone for date calculations
             
         Returns:
-            Dict with start_date and end_date
+            Dict with start_date and end_date as timezone-aware datetimes;
+            format them at the serialization boundary if strings are needed
         """
         if reference_date is None:
             reference_date = datetime.now(timezone.utc)
-        
-        # Ensure datetime is timezone-aware
-        if reference_date.tzinfo is None:
+        elif reference_date.tzinfo is None:
             reference_date = reference_date.replace(tzinfo=timezone.utc)
         
-        if range_type == "last_7_days":
-            start_date = reference_date - timedelta(days=7)
-            end_date = reference_date
-            
-        elif range_type == "last_30_days":
-            start_date = reference_date - timedelta(days=30)
-            end_date = reference_date
-            
-        elif range_type == "last_90_days":
-            start_date = reference_date - timedelta(days=90)
-            end_date = reference_date
-            
-        elif range_type == "yesterday":
-            start_date = (reference_date - timedelta(days=1)).replace(
-                hour=0, minute=0, second=0, microsecond=0
-            )
-            end_date = start_date.replace(hour=23, minute=59, second=59)
-            
-        elif range_type == "last_week":
-            # Previous Monday to Sunday
-            days_since_monday = reference_date.weekday()
-            last_monday = reference_date - timedelta(days=days_since_monday + 7)
-            start_date = last_monday.replace(hour=0, minute=0, second=0, microsecond=0)
-            end_date = (start_date + timedelta(days=6)).replace(
-                hour=23, minute=59, second=59
-            )
-            
-        elif range_type == "last_month":
-            # Previous calendar month
-            first_of_this_month = reference_date.replace(
-                day=1, hour=0, minute=0, second=0, microsecond=0
-            )
-            end_date = first_of_this_month - timedelta(microseconds=1)
-            start_date = end_date.replace(
-                day=1, hour=0, minute=0, second=0, microsecond=0
-            )
-            
-        elif range_type == "month_to_date":
-            # First day of current month to now
-            start_date = reference_date.replace(
-                day=1, hour=0, minute=0, second=0, microsecond=0
-            )
-            end_date = reference_date
-            
-        elif range_type == "quarter_to_date":
-            # First day of current quarter to now
-            current_quarter = (reference_date.month - 1) // 3
-            first_month_of_quarter = current_quarter * 3 + 1
-            start_date = reference_date.replace(
-                month=first_month_of_quarter,
-                day=1,
-                hour=0,
-                minute=0,
-                second=0,
-                microsecond=0,
-            )
-            end_date = reference_date
-            
-        elif range_type == "year_to_date":
-            # First day of current year to now
-            start_date = reference_date.replace(
-                month=1, day=1, hour=0, minute=0, second=0, microsecond=0
-            )
-            end_date = reference_date
-            
-        elif range_type == "last_year":
-            # Previous calendar year
-            start_date = reference_date.replace(
-                year=reference_date.year - 1,
-                month=1,
-                day=1,
-                hour=0,
-                minute=0,
-                second=0,
-                microsecond=0,
-            )
-            end_date = reference_date.replace(
-                year=reference_date.year - 1,
-                month=12,
-                day=31,
-                hour=23,
-                minute=59,
-                second=59,
-            )
-            
-        elif range_type == "last_hour":
-            start_date = reference_date - timedelta(hours=1)
-            end_date = reference_date
-            
-        elif range_type == "last_24_hours":
-            start_date = reference_date - timedelta(hours=24)
-            end_date = reference_date
-            
-        else:
-            # Default to last 7 days
-            logger.warning(
-                f"Unknown range_type '{range_type}', defaulting to last_7_days"
-            )
-            start_date = reference_date - timedelta(days=7)
-            end_date = reference_date
-        
+        start_date, end_date = range_bounds(range_type, reference_date, timezone_str)
         return {
-            "start_date": start_date.isoformat(),
-            "end_date": end_date.isoformat(),
+            "start_date": start_date,
+            "end_date": end_date,
             "range_type": range_type,
-            "reference_date": reference_date.isoformat(),
+            "reference_date": reference_date,
         }
 
 
@@ -160,7 +173,7 @@ class IncrementalReportTracker:
             overlap_seconds: Seconds to overlap with previous run to avoid gaps
             
         Returns:
-            Dict with start_date and end_date for incremental query
+            Dict with start_date and end_date (datetimes) for incremental query
         """
         if current_time is None:
             current_time = datetime.now(timezone.utc)
@@ -175,8 +188,8 @@ class IncrementalReportTracker:
             is_first_run = False
         
         return {
-            "start_date": start_date.isoformat(),
-            "end_date": current_time.isoformat(),
+            "start_date": start_date,
+            "end_date": current_time,
             "is_incremental": not is_first_run,
             "is_first_run": is_first_run,
             "overlap_seconds": overlap_seconds,
@@ -0,0 +1,32 @@
+"""Structured JSON log formatting."""
+
+import logging
+from datetime import datetime, timezone
+
+import orjson
+
+# Attributes every LogRecord has; anything else was passed via ``extra=``
+_RECORD_ATTRS = frozenset(vars(logging.makeLogRecord({}))) | {"message", "asctime"}
+
+
+class JsonFormatter(logging.Formatter):
+    """Render each record as one JSON object per line.
+
+    ``extra={}`` fields are included as top-level keys. Values orjson cannot
+    encode natively are rendered with ``str()``.
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        """Format a record as a JSON line."""
+        entry = {
+            "timestamp": datetime.fromtimestamp(record.created, tz=timezone.utc),
+            "level": record.levelname,
+            "message": record.getMessage(),
+            "module": record.name,
+        }
+        for key, value in vars(record).items():
+            if key not in _RECORD_ATTRS:
+                entry[key] = value
+        if record.exc_info:
+            entry["exc_info"] = self.formatException(record.exc_info)
+        return orjson.dumps(entry, default=str, option=orjson.OPT_NON_STR_KEYS).decode()
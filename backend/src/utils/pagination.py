@@ -0,0 +1,87 @@
+"""Signed keyset pagination cursors."""
+
+import base64
+import hashlib
+import hmac
+import struct
+import uuid
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_ONE_MICROSECOND = timedelta(microseconds=1)
+
+# Little-endian signed 64-bit epoch microseconds (PostgreSQL timestamp precision)
+_TIMESTAMP = struct.Struct("<q")
+_PAYLOAD_SIZE = _TIMESTAMP.size + 16
+_TAG_SIZE = 8
+
+
+@dataclass(frozen=True, slots=True)
+class KeysetCursor:
+    """Position after the last row of a (created_at DESC, id DESC) page.
+
+    Encoded as packed binary (timestamp, 16-byte id) followed by a truncated
+    HMAC-SHA256 tag, so clients cannot forge positions and decoding needs
+    no JSON or ISO-8601 parsing.
+    """
+
+    created_at: datetime
+    id: uuid.UUID
+
+    def encode(self, secret: str) -> str:
+        """Encode the cursor as an opaque URL-safe token.
+
+        Args:
+            secret: Key used to sign the cursor
+
+        Returns:
+            The cursor token
+        """
+        created_at = self.created_at
+        if created_at.tzinfo is None:
+            created_at = created_at.replace(tzinfo=timezone.utc)
+        micros = (created_at - _EPOCH) // _ONE_MICROSECOND
+
+        payload = _TIMESTAMP.pack(micros) + self.id.bytes
+        token = payload + _sign(secret, payload)
+        return base64.urlsafe_b64encode(token).rstrip(b"=").decode("ascii")
+
+    @classmethod
+    def decode(cls, token: str, secret: str) -> "KeysetCursor":
+        """Decode and verify a cursor token.
+
+        Args:
+            token: The cursor token from a previous page
+            secret: Key the cursor was signed with
+
+        Returns:
+            The decoded cursor
+
+        Raises:
+            ValueError: If the token is malformed or its signature does not match
+        """
+        try:
+            raw = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4))
+        except (ValueError, TypeError) as e:
+            raise ValueError("Invalid cursor") from e
+
+        if len(raw) != _PAYLOAD_SIZE + _TAG_SIZE:
+            raise ValueError("Invalid cursor")
+
+        payload, tag = raw[:-_TAG_SIZE], raw[-_TAG_SIZE:]
+        if not hmac.compare_digest(tag, _sign(secret, payload)):
+            raise ValueError("Invalid cursor")
+
+        (micros,) = _TIMESTAMP.unpack_from(payload)
+        return cls(
+            created_at=_EPOCH + timedelta(microseconds=micros),
+            id=uuid.UUID(bytes=payload[_TIMESTAMP.size:]),
+        )
+
+
+def _sign(secret: str, payload: bytes) -> bytes:
+    """Return the truncated HMAC-SHA256 tag for a cursor payload."""
+    return hmac.new(
+        secret.encode("utf-8"), b"cursor:" + payload, hashlib.sha256
+    ).digest()[:_TAG_SIZE]
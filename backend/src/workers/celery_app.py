@@ -2,6 +2,7 @@
 
 import logging
 from celery import Celery
+from celery.schedules import crontab
 from kombu import Exchange, Queue
 
 from src.config import settings
@@ -35,12 +36,14 @@ celery_app.conf.update(
     
     # Worker settings
     worker_prefetch_multiplier=1,  # Prefetch one task at a time for fair distribution
-    worker_max_tasks_per_child=1000,  # Restart worker after 1000 tasks (prevent memory leaks)
+    worker_max_tasks_per_child=200,  # Restart worker after 200 tasks (bounds WeasyPrint memory growth)
     
     # Task routing
     task_routes={
         "src.workers.tasks.generate_report": {"queue": "reports"},
         "src.workers.tasks.send_email": {"queue": "notifications"},
+        "src.workers.tasks.deliver_report_email": {"queue": "notifications"},
+        "src.workers.tasks.ensure_audit_partitions": {"queue": "reports"},
     },
     
     # Queue definitions
@@ -58,6 +61,16 @@ celery_app.conf.update(
         ),
     ),
     
+    # Periodic tasks, run by `celery -A src.workers.celery_app beat`
+    beat_schedule={
+        # Daily, keeping audit_event partitions two months ahead
+        "ensure-audit-partitions": {
+            "task": "src.workers.tasks.ensure_audit_partitions",
+            "schedule": crontab(hour=0, minute=15),
+            "kwargs": {"months_ahead": 2},
+        },
+    },
+    
     # Task time limits
     task_soft_time_limit=300,  # 5 minutes soft limit (raises exception)
     task_time_limit=600,  # 10 minutes hard limit (kills task)
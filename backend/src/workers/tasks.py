@@ -1,19 +1,32 @@
 """Celery tasks for report generation and delivery."""
 
-import io
+import asyncio
+import gc
+import html
 import logging
-from datetime import datetime, timezone
-from typing import Optional
+import re
+import shutil
+import tempfile
+import threading
+from datetime import date, datetime, timezone
+from functools import lru_cache
+from typing import IO, Any, Callable, Coroutine, Optional, Union
 
+import aiohttp
 from celery import Task
+from celery.signals import worker_process_init, worker_process_shutdown
 from liquidpy import Liquid
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
-from sqlalchemy.orm import sessionmaker
-from weasyprint import HTML
+from sqlalchemy import and_, insert, text, update
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from ulid import ULID
+from weasyprint import CSS, HTML, default_url_fetcher
+from weasyprint.text.fonts import FontConfiguration
 
 from src.config import settings
+from src.domain.services.audit_service import ArtifactRetentionService
+from src.domain.services.burst_protection import BurstProtectionService
 from src.infrastructure.azure.blob_storage import BlobStorageService
-from src.infrastructure.cache.report_cache import ReportCacheService
+from src.infrastructure.cache.report_cache import ReportCacheService, close_shared_redis
 from src.infrastructure.database.models import (
     Artifact,
     AuditEvent,
@@ -22,40 +35,132 @@ from src.infrastructure.database.models import (
     ReportDefinition,
     Schedule,
 )
+from src.infrastructure.database.session import json_deserializer, json_serializer
 from src.infrastructure.email.email_service import EmailService
 from src.workers.celery_app import celery_app
 
 logger = logging.getLogger(__name__)
 
+# One per worker process, so every task reuses its Redis connection pool and
+# registered scripts; the client is created on first use on the worker loop
+_BURST_PROTECTION = BurstProtectionService()
+
 
 class DatabaseTask(Task):
-    """Base task with database session management."""
+    """Base task with database session management.
+    
+    Task bodies run on one event loop per worker process, kept on a
+    background thread, so the engine's connection pool and other
+    loop-bound clients survive from one task to the next. The loop, engine
+    and session maker are shared by every task class in the process. The
+    engine is built when a prefork child starts (worker_process_init), or on
+    first use under pools that don't fork.
+    """
     
+    _loop: Optional[asyncio.AbstractEventLoop] = None
+    _loop_lock = threading.Lock()
     _engine = None
     _session_maker = None
     
+    @classmethod
+    def event_loop(cls) -> asyncio.AbstractEventLoop:
+        """Get or start the worker process's event loop."""
+        with DatabaseTask._loop_lock:
+            if DatabaseTask._loop is None:
+                loop = asyncio.new_event_loop()
+                threading.Thread(
+                    target=loop.run_forever,
+                    name="celery-asyncio",
+                    daemon=True,
+                ).start()
+                DatabaseTask._loop = loop
+        return DatabaseTask._loop
+    
+    def run_async(self, coro: Coroutine[Any, Any, Any]) -> Any:
+        """Run a coroutine on the worker loop and wait for its result.
+        
+        If the wait is interrupted (e.g. by the soft time limit), the
+        coroutine is cancelled rather than left running.
+        
+        Args:
+            coro: The coroutine to run
+            
+        Returns:
+            The coroutine's result
+        """
+        future = asyncio.run_coroutine_threadsafe(coro, self.event_loop())
+        try:
+            return future.result()
+        except BaseException:
+            future.cancel()
+            raise
+    
+    @classmethod
+    def init_database(cls) -> None:
+        """Create the process's engine and session maker."""
+        DatabaseTask._engine = create_async_engine(
+            settings.DATABASE_URL,
+            echo=False,
+            pool_size=settings.WORKER_DB_POOL_SIZE,
+            max_overflow=settings.WORKER_DB_POOL_MAX_OVERFLOW,
+            # Connections now outlive tasks; replace ones dropped while idle
+            pool_pre_ping=True,
+            pool_recycle=settings.DB_POOL_RECYCLE_SECONDS,
+            json_serializer=json_serializer,
+            json_deserializer=json_deserializer,
+            connect_args={
+                "prepared_statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE,
+                "statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE,
+            },
+        )
+        DatabaseTask._session_maker = async_sessionmaker(
+            DatabaseTask._engine,
+            class_=AsyncSession,
+            expire_on_commit=False,
+        )
+    
     @property
     def engine(self):
         """Get or create database engine."""
-        if self._engine is None:
-            self._engine = create_async_engine(
-                settings.DATABASE_URL,
-                echo=False,
-                pool_size=5,
-                max_overflow=10,
-            )
-        return self._engine
+        if DatabaseTask._engine is None:
+            self.init_database()
+        return DatabaseTask._engine
     
     @property
     def session_maker(self):
         """Get or create session maker."""
-        if self._session_maker is None:
-            self._session_maker = sessionmaker(
-                self.engine,
-                class_=AsyncSession,
-                expire_on_commit=False,
-            )
-        return self._session_maker
+        if DatabaseTask._session_maker is None:
+            self.init_database()
+        return DatabaseTask._session_maker
+
+
+@worker_process_init.connect
+def _init_worker_process(**kwargs) -> None:
+    """Give each prefork child its own engine rather than one inherited."""
+    DatabaseTask.init_database()
+
+
+async def _close_worker_resources() -> None:
+    """Release the worker loop's database pool and Redis clients."""
+    if DatabaseTask._engine is not None:
+        await DatabaseTask._engine.dispose()
+    await close_shared_redis()
+    await _BURST_PROTECTION.close()
+
+
+@worker_process_shutdown.connect
+def _stop_worker_loop(**kwargs) -> None:
+    """Close loop-bound resources and stop the worker loop on shutdown."""
+    loop = DatabaseTask._loop
+    if loop is None:
+        return
+    try:
+        asyncio.run_coroutine_threadsafe(_close_worker_resources(), loop).result(
+            timeout=10
+        )
+    except Exception as e:
+        logger.warning(f"Failed to close worker resources: {e}")
+    loop.call_soon_threadsafe(loop.stop)
 
 
 @celery_app.task(
@@ -81,8 +186,8 @@ def generate_report(
     4. Generate PDF
     5. Upload to Blob Storage
     6. Create Artifact record
-    7. Send email (if configured)
-    8. Create DeliveryReceipt record
+    7. Create pending DeliveryReceipt records (if email is configured)
+    8. Queue deliver_report_email to send the email and settle the receipts
     
     Args:
         tenant_id: The tenant unique identifier
@@ -93,29 +198,29 @@ def generate_report(
     Returns:
         Dict with execution details
     """
-    import asyncio
-    
-    # Run async task in sync context
-    loop = asyncio.new_event_loop()
-    asyncio.set_event_loop(loop)
-    
+    # task.request is thread-local, so read it here rather than on the loop
+    # thread; retry() must likewise be called from this thread
+    retries = self.request.retries
     try:
-        result = loop.run_until_complete(
+        return self.run_async(
             _generate_report_async(
                 task=self,
+                task_id=self.request.id,
+                retries=retries,
                 tenant_id=tenant_id,
                 schedule_id=schedule_id,
                 report_definition_id=report_definition_id,
                 email_delivery_config=email_delivery_config,
             )
         )
-        return result
-    finally:
-        loop.close()
+    except Exception as e:
+        raise self.retry(exc=e, countdown=60 * (retries + 1)) from e
 
 
 async def _generate_report_async(
     task: DatabaseTask,
+    task_id: Optional[str],
+    retries: int,
     tenant_id: str,
     schedule_id: Optional[str],
     report_definition_id: str,
@@ -125,6 +230,8 @@ async def _generate_report_async(
     
     Args:
         task: The Celery task instance
+        task_id: The Celery task id, recorded on the ExecutionRun
+        retries: How many times the task has already been retried
         tenant_id: The tenant unique identifier
         schedule_id: The schedule ID (None for manual runs)
         report_definition_id: The report definition to generate
@@ -132,32 +239,42 @@ async def _generate_report_async(
         
     Returns:
         Dict with execution details
+        
+    Raises:
+        Exception: The generation error, while retries remain; the task
+            schedules the retry
     """
     execution_run_id = None
+    pdf_file: Optional[IO[bytes]] = None
     started_at = datetime.now(timezone.utc)
     
     async with task.session_maker() as session:
         try:
-            # 0. Increment burst protection counter
-            from src.domain.services.burst_protection import BurstProtectionService
-            
-            burst_protection = BurstProtectionService()
-            await burst_protection.increment_execution_count(tenant_id)
-            
             # 1. Create ExecutionRun record
             execution_run = ExecutionRun(
-                id=f"exec_{datetime.now().strftime('%Y%m%d_%H%M%S')}_{tenant_id[:8]}",
+                # ULID in UUID form: time-ordered, so inserts append to the index
+                id=ULID().to_uuid(),
                 tenant_id=tenant_id,
                 schedule_id=schedule_id,
                 report_definition_id=report_definition_id,
                 status="running",
                 started_at=started_at,
-                execution_metadata={"task_id": task.request.id},
+                execution_metadata={"task_id": task_id},
                 created_at=started_at,
             )
             session.add(execution_run)
-            await session.commit()
-            await session.refresh(execution_run)
+            # All fields read later are set client-side and expire_on_commit is
+            # off, so no refresh SELECT is needed after the insert. The counter
+            # increment is independent of the insert, so both round trips
+            # overlap. Both finish before a failed commit is raised, so the
+            # failure path never decrements ahead of the increment.
+            _, commit_error = await asyncio.gather(
+                _BURST_PROTECTION.increment_execution_count(tenant_id),
+                session.commit(),
+                return_exceptions=True,
+            )
+            if commit_error is not None:
+                raise commit_error
             execution_run_id = execution_run.id
             
             logger.info(
@@ -175,7 +292,7 @@ async def _generate_report_async(
                 raise ValueError(f"Report definition not found: {report_definition_id}")
             
             # 2.5. Check cache if report is cacheable
-            pdf_bytes = None
+            pdf_content: Union[bytes, IO[bytes], None] = None
             cache_hit = False
             cache_ttl = report_def.execution_metadata.get("cache_ttl_seconds") if report_def.execution_metadata else None
             
@@ -188,10 +305,16 @@ async def _generate_report_async(
                 )
                 
                 if cached:
-                    pdf_bytes = cached["pdf_bytes"]
+                    pdf_content = cached["pdf_bytes"]
                     cache_hit = True
-                    execution_run.execution_metadata["cache_hit"] = True
-                    execution_run.execution_metadata["cached_at"] = cached["metadata"].get("cached_at")
+                    # Reassigned, not mutated in place: a plain JSONB column
+                    # doesn't track in-place edits. The new value is written
+                    # by the same UPDATE that completes the run.
+                    execution_run.execution_metadata = {
+                        **execution_run.execution_metadata,
+                        "cache_hit": True,
+                        "cached_at": cached["metadata"].get("cached_at"),
+                    }
                     logger.info(f"Using cached report for {execution_run_id}")
             
             # 3-5. Generate report if not cached
@@ -200,25 +323,51 @@ async def _generate_report_async(
                 # TODO: Replace with actual Synapse query execution
                 report_data = await _fetch_report_data(report_def.query_spec)
                 
-                # 4. Render template with data
-                rendered_html = await _render_template(
-                    template_ref=report_def.template_ref,
-                    data=report_data,
-                    report_name=report_def.name,
-                )
-                
-                # 5. Generate PDF
-                pdf_bytes = await _generate_pdf(rendered_html)
+                # 4-5. Render template with data and generate the PDF, spooled
+                # to disk past _PDF_SPOOL_MAX_BYTES so large reports are never
+                # held in memory whole
+                pdf_file = tempfile.SpooledTemporaryFile(max_size=_PDF_SPOOL_MAX_BYTES)
+                if (
+                    settings.PDF_CHROMIUM_PATH
+                    and len(report_data.get("rows", ())) >= settings.PDF_CHROMIUM_MIN_ROWS
+                ):
+                    rendered_html = await _render_template(
+                        template_ref=report_def.template_ref,
+                        data=report_data,
+                        report_name=report_def.name,
+                    )
+                    await _generate_pdf_chromium(rendered_html, pdf_file)
+                else:
+                    # Long reports are laid out by WeasyPrint in row shards
+                    rendered_shards = [
+                        await _render_template(
+                            template_ref=report_def.template_ref,
+                            data=shard,
+                            report_name=report_def.name,
+                        )
+                        for shard in _split_data(report_data, settings.PDF_SHARD_ROWS)
+                    ]
+                    await _generate_pdf(rendered_shards, pdf_file)
+                pdf_file.seek(0)
+                pdf_content = pdf_file
                 
                 # 5.5. Cache the report if caching is enabled
                 if cache_ttl and cache_ttl > 0:
+                    # The cache stores bytes; read them only for cacheable reports
+                    pdf_bytes = pdf_file.read()
+                    pdf_file.seek(0)
                     cache_service = ReportCacheService()
+                    # cache_ttl_seconds is the baseline; the TTL adapts to
+                    # how late this report's cached copies are still read
+                    ttl_seconds = await cache_service.estimate_ttl(
+                        report_definition_id, base_ttl=cache_ttl
+                    )
                     await cache_service.cache_report(
                         report_definition_id=report_definition_id,
                         pdf_bytes=pdf_bytes,
                         query_parameters=report_def.query_spec,
                         date_range=None,
-                        ttl_seconds=cache_ttl,
+                        ttl_seconds=ttl_seconds,
                         metadata={
                             "execution_run_id": execution_run_id,
                             "report_name": report_def.name,
@@ -226,20 +375,20 @@ async def _generate_report_async(
                     )
             
             # 6. Upload to Blob Storage
-            blob_service = BlobStorageService()
-            blob_path, file_size_bytes = blob_service.upload_artifact(
-                tenant_id=tenant_id,
-                execution_run_id=execution_run_id,
-                file_content=pdf_bytes,
-                file_format=report_def.output_format,
-            )
-            
-            # Generate SAS URL
-            signed_url, signed_url_expires_at = blob_service.generate_sas_url(blob_path)
+            async with BlobStorageService() as blob_service:
+                blob_path, file_size_bytes = await blob_service.upload_artifact(
+                    tenant_id=tenant_id,
+                    execution_run_id=str(execution_run_id),
+                    file_content=pdf_content,
+                    file_format=report_def.output_format,
+                )
+                
+                # Generate SAS URL
+                signed_url, signed_url_expires_at = blob_service.generate_sas_url(blob_path)
             
             # 7. Create Artifact record
             artifact = Artifact(
-                id=f"artifact_{execution_run_id}",
+                id=ULID().to_uuid(),
                 tenant_id=tenant_id,
                 execution_run_id=execution_run_id,
                 blob_path=blob_path,
@@ -251,15 +400,17 @@ async def _generate_report_async(
             )
             session.add(artifact)
             
-            # 8. Send email if configured
-            if email_delivery_config and email_delivery_config.get("recipients"):
-                await _send_report_email(
+            # 8. Record pending deliveries; the email itself is sent by
+            # deliver_report_email once this transaction has committed
+            deliver_email = bool(
+                email_delivery_config and email_delivery_config.get("recipients")
+            )
+            if deliver_email:
+                await _create_pending_receipts(
                     session=session,
                     tenant_id=tenant_id,
                     artifact=artifact,
-                    report_name=report_def.name,
-                    email_config=email_delivery_config,
-                    execution_time=started_at.isoformat(),
+                    recipients=email_delivery_config["recipients"],
                 )
             
             # 9. Update ExecutionRun to completed
@@ -270,8 +421,45 @@ async def _generate_report_async(
             
             await session.commit()
             
+            if deliver_email:
+                # The run is committed as completed, so a publish failure must
+                # not reach the generation failure path: retrying would build
+                # a second artifact and strand this one's receipts as pending
+                try:
+                    # Publishing is blocking broker I/O; keep it off the loop
+                    await asyncio.to_thread(
+                        deliver_report_email.apply_async,
+                        kwargs={
+                            "tenant_id": str(tenant_id),
+                            "artifact_id": str(artifact.id),
+                            "artifact_url": artifact.signed_url,
+                            "report_name": report_def.name,
+                            "email_config": email_delivery_config,
+                            "execution_time": started_at.isoformat(),
+                        },
+                    )
+                except Exception as publish_error:
+                    logger.error(
+                        f"Failed to queue delivery email for artifact {artifact.id}: "
+                        f"{publish_error}",
+                        exc_info=True,
+                        extra={
+                            "execution_run_id": execution_run_id,
+                            "artifact_id": artifact.id,
+                        },
+                    )
+                    try:
+                        await _fail_pending_receipts(
+                            session=session,
+                            tenant_id=tenant_id,
+                            artifact_id=artifact.id,
+                            error_message=f"Failed to queue delivery: {publish_error}",
+                        )
+                    except Exception as receipt_error:
+                        logger.error(f"Failed to mark delivery receipts failed: {receipt_error}")
+            
             # Decrement burst protection counter
-            await burst_protection.decrement_execution_count(tenant_id)
+            await _BURST_PROTECTION.decrement_execution_count(tenant_id)
             
             logger.info(
                 f"Completed report generation: {execution_run_id}",
@@ -283,9 +471,9 @@ async def _generate_report_async(
             )
             
             return {
-                "execution_run_id": execution_run_id,
+                "execution_run_id": str(execution_run_id),
                 "status": "completed",
-                "artifact_id": artifact.id,
+                "artifact_id": str(artifact.id),
                 "blob_path": blob_path,
                 "file_size_bytes": file_size_bytes,
                 "duration_seconds": execution_run.duration_seconds,
@@ -304,9 +492,7 @@ async def _generate_report_async(
             
             # Decrement burst protection counter on failure
             try:
-                from src.domain.services.burst_protection import BurstProtectionService
-                burst_protection = BurstProtectionService()
-                await burst_protection.decrement_execution_count(tenant_id)
+                await _BURST_PROTECTION.decrement_execution_count(tenant_id)
             except Exception as burst_error:
                 logger.error(f"Failed to decrement burst protection counter: {burst_error}")
             
@@ -325,22 +511,33 @@ async def _generate_report_async(
                 except Exception as update_error:
                     logger.error(f"Failed to update ExecutionRun status: {update_error}")
             
-            # Retry task if retries remaining
-            if task.request.retries < task.max_retries:
-                raise task.retry(exc=e, countdown=60 * (task.request.retries + 1))
+            # Hand the error back to the task to retry if retries remain
+            if retries < task.max_retries:
+                raise
             
             return {
-                "execution_run_id": execution_run_id,
+                "execution_run_id": str(execution_run_id) if execution_run_id else None,
                 "status": "failed",
                 "error": str(e),
             }
+        
+        finally:
+            if pdf_file is not None:
+                pdf_file.close()
 
 
 async def _fetch_report_data(query_spec: dict) -> dict:
     """Fetch data from data source (Synapse).
     
+    Totals cover the whole result set, but only the first drilldown_limit
+    rows (from query_spec, if set) are returned for the detail table. A
+    real implementation should compute the totals with an aggregate query
+    and fetch only the limited rows, run concurrently, instead of
+    materializing every row.
+    
     Args:
-        query_spec: Query specification with connection and query details
+        query_spec: Query specification with connection and query details,
+            and an optional drilldown_limit
         
     Returns:
         Report data as dict
@@ -349,53 +546,74 @@ async def _fetch_report_data(query_spec: dict) -> dict:
     # For now, return mock data
     logger.info("Fetching report data (mock implementation)")
     
+    rows = [
+        {"product": "Product A", "quantity": 100, "revenue": 10000},
+        {"product": "Product B", "quantity": 50, "revenue": 5000},
+        {"product": "Product C", "quantity": 75, "revenue": 7500},
+    ]
+    drilldown_limit = query_spec.get("drilldown_limit")
+    
     return {
         "title": "Sales Report",
         "generated_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-        "rows": [
-            {"product": "Product A", "quantity": 100, "revenue": 10000},
-            {"product": "Product B", "quantity": 50, "revenue": 5000},
-            {"product": "Product C", "quantity": 75, "revenue": 7500},
-        ],
+        "rows": rows if drilldown_limit is None else rows[:drilldown_limit],
         "total_revenue": 22500,
         "total_quantity": 225,
     }
 
 
-async def _render_template(template_ref: str, data: dict, report_name: str) -> str:
-    """Render report template with data using Liquid.
-    
-    Args:
-        template_ref: Reference to template (file path or content)
-        data: Data to render in template
-        report_name: Name of the report
-        
-    Returns:
-        Rendered HTML content
-    """
-    logger.info(f"Rendering template: {template_ref}")
-    
-    # TODO: Fetch template from Blob Storage or use embedded template
-    # For now, use a simple inline template
-    template_content = """
+# Rendered PDFs stay in memory up to this size, then spill to a temp file
+_PDF_SPOOL_MAX_BYTES = 8 * 1024 * 1024
+
+# One font configuration for every render: WeasyPrint caches fonts per
+# configuration, so a fresh one per PDF grows worker memory render by render
+_FONT_CONFIG = FontConfiguration()
+
+# Report stylesheet, parsed once and applied to every PDF render instead of
+# being re-parsed from a <style> block each time. A fixed table layout sizes
+# columns from the first row instead of measuring every cell.
+_REPORT_STYLESHEET = """
+    body { font-family: Arial, sans-serif; margin: 40px; }
+    h1 { color: #1976D2; }
+    table { border-collapse: collapse; width: 100%; margin-top: 20px; table-layout: fixed; }
+    th, td { border: 1px solid #ddd; padding: 12px; text-align: left; }
+    th { background-color: #1976D2; color: white; }
+    tr:nth-child(even) { background-color: #f9f9f9; }
+    .footer { margin-top: 40px; color: #666; font-size: 12px; }
+"""
+_REPORT_CSS = CSS(font_config=_FONT_CONFIG, string=_REPORT_STYLESHEET)
+
+# Web-page asset bundles that templates sometimes link; irrelevant to the PDF
+# and fetched and parsed by WeasyPrint on every render if left in
+_UNUSED_STYLESHEET_LINK = re.compile(
+    r'<link[^>]+href="[^"]*(?:bundle|bootstrap|fontawesome)[^"]*"[^>]*>',
+    re.IGNORECASE,
+)
+
+# Remote images and stylesheets referenced by a rendered report. WeasyPrint
+# fetches these one at a time while laying out, so they are downloaded
+# concurrently up front and served to it from memory.
+_REMOTE_ASSET = re.compile(
+    r'<(?:img|link)\b[^>]*?\b(?:src|href)\s*=\s*["\'](https?://[^"\']+)["\']',
+    re.IGNORECASE,
+)
+_ASSET_FETCH_CONCURRENCY = 16
+_ASSET_FETCH_TIMEOUT_SECONDS = 10
+
+# TODO: Fetch templates from Blob Storage by template_ref; for now every
+# reference renders this inline template
+_INLINE_TEMPLATE = """
     <!DOCTYPE html>
     <html>
     <head>
         <meta charset="UTF-8">
         <title>{{ title }}</title>
-        <style>
-            body { font-family: Arial, sans-serif; margin: 40px; }
-            h1 { color: #1976D2; }
-            table { border-collapse: collapse; width: 100%; margin-top: 20px; }
-            th, td { border: 1px solid #ddd; padding: 12px; text-align: left; }
-            th { background-color: #1976D2; color: white; }
-            tr:nth-child(even) { background-color: #f9f9f9; }
-            .footer { margin-top: 40px; color: #666; font-size: 12px; }
-        </style>
     </head>
     <body>
+        {% unless is_continuation %}
         <h1>{{ title }}</h1>
         <p><strong>Generated:</strong> {{ generated_at }}</p>
+        {% endunless %}
         
         <table>
             <thead>
@@ -414,6 +632,7 @@ async def _render_template(template_ref: str, data: dict, report_name: str) -> s
                 </tr>
                 {% endfor %}
             </tbody>
+            {% unless has_continuation %}
             <tfoot>
                 <tr>
                     <th>Total</th>
@@ -421,98 +640,482 @@ async def _render_template(template_ref: str, data: dict, report_name: str) -> s
                     <th>${{ total_revenue }}</th>
                 </tr>
             </tfoot>
+            {% endunless %}
         </table>
         
+        {% unless has_continuation %}
         <div class="footer">
             <p>This report was automatically generated by Report Scheduler.</p>
         </div>
+        {% endunless %}
     </body>
     </html>
     """
+
+
+@lru_cache(maxsize=128)
+def _compiled_template(template_ref: str) -> Liquid:
+    """Compile a report template once per reference.
     
-    # Render template with Liquid
-    liq = Liquid(template_content, liquid_loglevel="ERROR")
-    rendered = liq.render(**data)
+    Args:
+        template_ref: Reference to template (file path or content)
+        
+    Returns:
+        The parsed template, reusable across renders
+    """
+    return Liquid(_INLINE_TEMPLATE, liquid_loglevel="ERROR")
+
+
+def _split_data(data: dict, chunk_size: int) -> list[dict]:
+    """Split report data into shards of at most chunk_size rows.
+    
+    Every shard carries the report's other fields. All but the first set
+    is_continuation and all but the last set has_continuation, so templates
+    can print headings and totals once.
+    
+    Args:
+        data: Report data with a rows list
+        chunk_size: Maximum rows per shard
+        
+    Returns:
+        The shards in order; [data] itself if no split is needed
+    """
+    rows = data.get("rows") or []
+    if len(rows) <= chunk_size:
+        return [data]
+    
+    starts = range(0, len(rows), chunk_size)
+    return [
+        {
+            **data,
+            "rows": rows[start:start + chunk_size],
+            "is_continuation": start > 0,
+            "has_continuation": start + chunk_size < len(rows),
+        }
+        for start in starts
+    ]
+
+
+async def _render_template(template_ref: str, data: dict, report_name: str) -> str:
+    """Render report template with data using Liquid.
+    
+    Args:
+        template_ref: Reference to template (file path or content)
+        data: Data to render in template
+        report_name: Name of the report
+        
+    Returns:
+        Rendered HTML content
+    """
+    logger.info(f"Rendering template: {template_ref}")
     
-    return rendered
+    # Parsed once per template_ref; only the render runs per report. Liquid
+    # does not autoescape, so tenant data is escaped before it gets there.
+    return _compiled_template(template_ref).render(**_escape_values(data))
 
 
-async def _generate_pdf(html_content: str) -> bytes:
+def _escape_values(value: Any) -> Any:
+    """HTML-escape every string in report data, recursing into dicts and lists.
+    
+    Args:
+        value: Report data or a value within it
+        
+    Returns:
+        A copy with all strings escaped; other values are returned as is
+    """
+    if isinstance(value, str):
+        return html.escape(value)
+    if isinstance(value, dict):
+        return {key: _escape_values(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_escape_values(item) for item in value]
+    return value
+
+
+async def _generate_pdf(html_content: Union[str, list[str]], target: IO[bytes]) -> int:
     """Generate PDF from HTML using WeasyPrint.
     
+    Several HTML documents (shards of one report) are laid out separately
+    and their pages joined into a single PDF.
+    
     Args:
-        html_content: HTML content to convert to PDF
+        html_content: HTML content to convert to PDF, or its shards in order
+        target: Writable binary file the PDF is written to
         
     Returns:
-        PDF content as bytes
+        Size of the PDF in bytes
     """
-    logger.info("Generating PDF from HTML")
+    shards = [html_content] if isinstance(html_content, str) else html_content
+    logger.info(f"Generating PDF from HTML ({len(shards)} shards)")
+    
+    shards = [_UNUSED_STYLESHEET_LINK.sub("", shard) for shard in shards]
+    url_fetcher = await _prefetch_assets("".join(shards))
     
     # Convert HTML to PDF
-    pdf_file = io.BytesIO()
-    HTML(string=html_content).write_pdf(pdf_file)
-    pdf_bytes = pdf_file.getvalue()
+    documents = [
+        HTML(string=shard, url_fetcher=url_fetcher).render(
+            stylesheets=[_REPORT_CSS],
+            font_config=_FONT_CONFIG,
+        )
+        for shard in shards
+    ]
+    pages = [page for document in documents for page in document.pages]
+    start = target.tell()
+    documents[0].copy(pages).write_pdf(target)
+    pdf_size = target.tell() - start
+    del documents, pages
+    
+    # Release the render's layout tree and Pango/cairo buffers now rather
+    # than whenever the next collection happens to run
+    gc.collect()
+    
+    logger.info(f"Generated PDF: {pdf_size} bytes")
+    return pdf_size
+
+
+async def _generate_pdf_chromium(html_content: str, target: IO[bytes]) -> int:
+    """Generate PDF from HTML with headless Chromium.
+    
+    Much faster than WeasyPrint on long tables, so used for large reports.
+    Chromium runs as a child process per render and fetches remote assets
+    itself.
+    
+    Args:
+        html_content: HTML content to convert to PDF
+        target: Writable binary file the PDF is written to
+        
+    Returns:
+        Size of the PDF in bytes
+        
+    Raises:
+        RuntimeError: If Chromium fails or exceeds PDF_CHROMIUM_TIMEOUT_SECONDS
+    """
+    logger.info("Generating PDF from HTML with Chromium")
+    
+    html_content = _UNUSED_STYLESHEET_LINK.sub("", html_content)
+    # The WeasyPrint path applies the stylesheet separately; inline it here
+    html_content = html_content.replace(
+        "</head>", f"<style>{_REPORT_STYLESHEET}</style></head>", 1
+    )
+    
+    with tempfile.TemporaryDirectory(prefix="report-pdf-") as workdir:
+        html_path = f"{workdir}/report.html"
+        pdf_path = f"{workdir}/report.pdf"
+        with open(html_path, "w", encoding="utf-8") as html_file:
+            html_file.write(html_content)
+        
+        process = await asyncio.create_subprocess_exec(
+            settings.PDF_CHROMIUM_PATH,
+            "--headless",
+            "--disable-gpu",
+            # Report data is tenant-controlled; never run script from it
+            "--blink-settings=scriptEnabled=false",
+            "--no-pdf-header-footer",
+            f"--user-data-dir={workdir}/profile",
+            f"--print-to-pdf={pdf_path}",
+            f"file://{html_path}",
+            stdout=asyncio.subprocess.DEVNULL,
+            stderr=asyncio.subprocess.PIPE,
+        )
+        try:
+            _, stderr = await asyncio.wait_for(
+                process.communicate(), timeout=settings.PDF_CHROMIUM_TIMEOUT_SECONDS
+            )
+        except TimeoutError:
+            process.kill()
+            await process.wait()
+            raise RuntimeError(
+                f"Chromium PDF render timed out after "
+                f"{settings.PDF_CHROMIUM_TIMEOUT_SECONDS}s"
+            ) from None
+        if process.returncode != 0:
+            raise RuntimeError(
+                f"Chromium PDF render failed ({process.returncode}): "
+                f"{stderr.decode(errors='replace')[-500:]}"
+            )
+        
+        start = target.tell()
+        with open(pdf_path, "rb") as pdf_output:
+            shutil.copyfileobj(pdf_output, target)
+        pdf_size = target.tell() - start
     
-    logger.info(f"Generated PDF: {len(pdf_bytes)} bytes")
-    return pdf_bytes
+    logger.info(f"Generated PDF: {pdf_size} bytes")
+    return pdf_size
 
 
-async def _send_report_email(
+async def _prefetch_assets(html_content: str) -> Callable[..., dict]:
+    """Download the report's remote assets concurrently.
+    
+    Args:
+        html_content: Rendered report HTML
+        
+    Returns:
+        A WeasyPrint url_fetcher that serves the downloaded assets and falls
+        back to default_url_fetcher for anything else, including assets
+        whose download failed
+    """
+    # Attribute values are HTML-escaped; WeasyPrint requests the unescaped URL
+    urls = {html.unescape(url) for url in _REMOTE_ASSET.findall(html_content)}
+    if not urls:
+        return default_url_fetcher
+    
+    async def fetch(session: aiohttp.ClientSession, url: str) -> Optional[dict]:
+        try:
+            async with session.get(url) as response:
+                response.raise_for_status()
+                return {
+                    "string": await response.read(),
+                    "mime_type": response.content_type,
+                    "encoding": response.charset,
+                    "redirected_url": str(response.url),
+                }
+        except (aiohttp.ClientError, TimeoutError) as e:
+            logger.warning(f"Failed to prefetch report asset {url}: {e}")
+            return None
+    
+    async with aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(limit=_ASSET_FETCH_CONCURRENCY),
+        timeout=aiohttp.ClientTimeout(total=_ASSET_FETCH_TIMEOUT_SECONDS),
+    ) as session:
+        ordered = list(urls)
+        results = await asyncio.gather(*(fetch(session, url) for url in ordered))
+    
+    assets = {url: result for url, result in zip(ordered, results, strict=True) if result}
+    logger.info(f"Prefetched {len(assets)}/{len(urls)} report assets")
+    
+    def url_fetcher(url: str, *args: Any, **kwargs: Any) -> dict:
+        asset = assets.get(url)
+        if asset is None:
+            return default_url_fetcher(url, *args, **kwargs)
+        return dict(asset)
+    
+    return url_fetcher
+
+
+async def _create_pending_receipts(
     session: AsyncSession,
     tenant_id: str,
     artifact: Artifact,
+    recipients: list[str],
+) -> None:
+    """Record one pending email delivery receipt per recipient.
+    
+    Written as a single multi-row INSERT. The ORM insert autoflushes the
+    pending artifact first.
+    
+    Args:
+        session: Database session
+        tenant_id: The tenant unique identifier
+        artifact: The artifact record
+        recipients: Recipient email addresses
+    """
+    now = datetime.now(timezone.utc)
+    receipts = [
+        {
+            "id": ULID().to_uuid(),
+            "tenant_id": tenant_id,
+            "artifact_id": artifact.id,
+            "channel": "email",
+            "recipient": recipient,
+            "status": "pending",
+            "created_at": now,
+        }
+        for recipient in recipients
+    ]
+    if receipts:
+        await session.execute(insert(DeliveryReceipt), receipts)
+
+
+async def _fail_pending_receipts(
+    session: AsyncSession,
+    tenant_id: str,
+    artifact_id: str,
+    error_message: str,
+) -> None:
+    """Mark an artifact's pending delivery receipts as failed and commit.
+    
+    Args:
+        session: Database session
+        tenant_id: The tenant unique identifier
+        artifact_id: The artifact whose deliveries failed
+        error_message: Why the deliveries failed
+    """
+    await session.execute(
+        update(DeliveryReceipt)
+        .where(
+            and_(
+                DeliveryReceipt.artifact_id == artifact_id,
+                DeliveryReceipt.tenant_id == tenant_id,
+                DeliveryReceipt.status == "pending",
+            )
+        )
+        .values(status="failed", error_message=error_message)
+        .execution_options(synchronize_session=False)
+    )
+    await session.commit()
+
+
+@celery_app.task(
+    bind=True,
+    base=DatabaseTask,
+    name="src.workers.tasks.deliver_report_email",
+    max_retries=3,
+    default_retry_delay=30,
+)
+def deliver_report_email(
+    self,
+    tenant_id: str,
+    artifact_id: str,
+    artifact_url: str,
     report_name: str,
     email_config: dict,
     execution_time: str,
+) -> dict:
+    """Send a generated report's delivery email and settle its receipts.
+    
+    Queued by generate_report after its transaction commits, so report
+    generation does not hold a database connection across the send. Errors
+    are retried; once retries run out the pending receipts are marked
+    failed so none stay pending.
+    
+    Args:
+        tenant_id: The tenant unique identifier
+        artifact_id: The artifact being delivered
+        artifact_url: Signed URL to download the report
+        report_name: Name of the report
+        email_config: Email configuration with recipients, subject, etc.
+        execution_time: When the report was generated
+        
+    Returns:
+        Dict with send status
+    """
+    try:
+        return self.run_async(
+            _deliver_report_email_async(
+                task=self,
+                tenant_id=tenant_id,
+                artifact_id=artifact_id,
+                artifact_url=artifact_url,
+                report_name=report_name,
+                email_config=email_config,
+                execution_time=execution_time,
+            )
+        )
+    except Exception as e:
+        retries = self.request.retries
+        if retries < self.max_retries:
+            raise self.retry(exc=e, countdown=30 * (retries + 1)) from e
+        
+        logger.error(
+            f"Giving up on delivery email for artifact {artifact_id}: {e}",
+            exc_info=True,
+            extra={"artifact_id": artifact_id},
+        )
+        self.run_async(
+            _fail_artifact_receipts(
+                task=self,
+                tenant_id=tenant_id,
+                artifact_id=artifact_id,
+                error_message=f"Delivery failed after {retries} retries: {e}",
+            )
+        )
+        raise
+
+
+async def _fail_artifact_receipts(
+    task: DatabaseTask,
+    tenant_id: str,
+    artifact_id: str,
+    error_message: str,
 ) -> None:
-    """Send report delivery email.
+    """Mark an artifact's pending delivery receipts as failed in a new session.
     
     Args:
-        session: Database session
+        task: The Celery task instance
         tenant_id: The tenant unique identifier
-        artifact: The artifact record
+        artifact_id: The artifact whose deliveries failed
+        error_message: Why the deliveries failed
+    """
+    async with task.session_maker() as session:
+        await _fail_pending_receipts(
+            session=session,
+            tenant_id=tenant_id,
+            artifact_id=artifact_id,
+            error_message=error_message,
+        )
+
+
+async def _deliver_report_email_async(
+    task: DatabaseTask,
+    tenant_id: str,
+    artifact_id: str,
+    artifact_url: str,
+    report_name: str,
+    email_config: dict,
+    execution_time: str,
+) -> dict:
+    """Async implementation of report email delivery.
+    
+    Args:
+        task: The Celery task instance
+        tenant_id: The tenant unique identifier
+        artifact_id: The artifact being delivered
+        artifact_url: Signed URL to download the report
         report_name: Name of the report
         email_config: Email configuration with recipients, subject, etc.
         execution_time: When the report was generated
+        
+    Returns:
+        Dict with send status
     """
     logger.info("Sending report delivery email")
     
-    email_service = EmailService()
-    
-    # Send email
-    success, message_id_or_error = email_service.send_report_email(
-        recipients=email_config["recipients"],
-        subject=email_config.get("subject", f"Report: {report_name}"),
-        artifact_url=artifact.signed_url,
-        report_name=report_name,
-        execution_time=execution_time,
-        cc=email_config.get("cc"),
-        bcc=email_config.get("bcc"),
-    )
+    async with EmailService() as email_service:
+        success, message_id_or_error = await email_service.send_report_email(
+            recipients=email_config["recipients"],
+            subject=email_config.get("subject", f"Report: {report_name}"),
+            artifact_url=artifact_url,
+            report_name=report_name,
+            execution_time=execution_time,
+            cc=email_config.get("cc"),
+            bcc=email_config.get("bcc"),
+        )
     
-    # Create delivery receipt for each recipient
-    for recipient in email_config["recipients"]:
-        receipt = DeliveryReceipt(
-            id=f"receipt_{artifact.id}_{recipient[:20]}",
-            tenant_id=tenant_id,
-            artifact_id=artifact.id,
-            channel="email",
-            recipient=recipient,
-            status="sent" if success else "failed",
-            sent_at=datetime.now(timezone.utc) if success else None,
-            error_message=message_id_or_error if not success else None,
-            created_at=datetime.now(timezone.utc),
+    # Settle every pending receipt of the artifact in one UPDATE
+    async with task.session_maker() as session:
+        await session.execute(
+            update(DeliveryReceipt)
+            .where(
+                and_(
+                    DeliveryReceipt.artifact_id == artifact_id,
+                    DeliveryReceipt.tenant_id == tenant_id,
+                    DeliveryReceipt.status == "pending",
+                )
+            )
+            .values(
+                status="sent" if success else "failed",
+                sent_at=datetime.now(timezone.utc) if success else None,
+                error_message=None if success else message_id_or_error,
+            )
+            .execution_options(synchronize_session=False)
         )
-        session.add(receipt)
+        await session.commit()
     
     logger.info(
         f"Email delivery {'successful' if success else 'failed'}",
         extra={
             "success": success,
+            "artifact_id": artifact_id,
             "recipients": email_config["recipients"],
             "message_id_or_error": message_id_or_error,
         },
     )
+    
+    return {
+        "status": "sent" if success else "failed",
+        "artifact_id": artifact_id,
+        "message_id_or_error": message_id_or_error,
+    }
 
 
 @celery_app.task(
@@ -539,8 +1142,6 @@ def send_email(
     """
     logger.info(f"Sending email to {len(recipients)} recipients")
     
-    email_service = EmailService()
-    
     # TODO: Implement generic email sending
     # For now, just log
     logger.info(f"Email task executed: {subject} -> {recipients}")
@@ -573,28 +1174,17 @@ def cleanup_expired_artifacts(
     Returns:
         Dict with cleanup results
     """
-    import asyncio
-    from src.domain.services.audit_service import ArtifactRetentionService
-    from src.infrastructure.azure.blob_storage import BlobStorageService
-    
     logger.info(
         f"Starting artifact cleanup (retention: {retention_days} days, dry_run: {dry_run})"
     )
     
-    loop = asyncio.new_event_loop()
-    asyncio.set_event_loop(loop)
-    
-    try:
-        result = loop.run_until_complete(
-            _cleanup_expired_artifacts_async(
-                task=self,
-                retention_days=retention_days,
-                dry_run=dry_run,
-            )
+    return self.run_async(
+        _cleanup_expired_artifacts_async(
+            task=self,
+            retention_days=retention_days,
+            dry_run=dry_run,
         )
-        return result
-    finally:
-        loop.close()
+    )
 
 
 async def _cleanup_expired_artifacts_async(
@@ -614,16 +1204,16 @@ async def _cleanup_expired_artifacts_async(
     """
     async with task.session_maker() as session:
         try:
-            blob_service = BlobStorageService()
             retention_service = ArtifactRetentionService()
             
-            result = await retention_service.delete_expired_artifacts(
-                session=session,
-                blob_storage_service=blob_service,
-                tenant_id=None,  # Cleanup for all tenants
-                retention_days=retention_days,
-                dry_run=dry_run,
-            )
+            async with BlobStorageService() as blob_service:
+                result = await retention_service.delete_expired_artifacts(
+                    session=session,
+                    blob_storage_service=blob_service,
+                    tenant_id=None,  # Cleanup for all tenants
+                    retention_days=retention_days,
+                    dry_run=dry_run,
+                )
             
             logger.info(
                 f"Artifact cleanup completed: {result['deleted_count']} deleted, "
@@ -640,3 +1230,143 @@ async def _cleanup_expired_artifacts_async(
                 "failed_count": 0,
                 "error": str(e),
             }
+
+
+@celery_app.task(
+    bind=True,
+    base=DatabaseTask,
+    name="src.workers.tasks.ensure_audit_partitions",
+)
+def ensure_audit_partitions(self, months_ahead: int = 2) -> dict:
+    """Create upcoming monthly audit_event partitions.
+    
+    audit_event is range-partitioned by created_at. Rows outside every
+    monthly partition land in audit_event_default, so partitions should
+    exist before their month starts. If rows for a missing month are
+    already in the default partition, they are moved into the new partition
+    as it is created. Runs daily from Celery beat; it is idempotent.
+    
+    Args:
+        months_ahead: Number of months beyond the current one to provision
+        
+    Returns:
+        Dict with the partition names ensured
+    """
+    return self.run_async(
+        _ensure_audit_partitions_async(task=self, months_ahead=months_ahead)
+    )
+
+
+def _add_months(month_start: date, months: int) -> date:
+    """Return the first day of the month `months` after `month_start`."""
+    index = month_start.year * 12 + month_start.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+async def _ensure_audit_partitions_async(task: DatabaseTask, months_ahead: int) -> dict:
+    """Async implementation of audit partition provisioning.
+    
+    Each month is provisioned in its own transaction.
+    
+    Args:
+        task: The Celery task instance
+        months_ahead: Number of months beyond the current one to provision
+        
+    Returns:
+        Dict with the partition names ensured and the rows moved out of the
+        default partition
+    """
+    current_month = datetime.now(timezone.utc).date().replace(day=1)
+    partitions = []
+    moved_rows = 0
+    
+    async with task.session_maker() as session:
+        for offset in range(months_ahead + 1):
+            month_start = _add_months(current_month, offset)
+            partition_name = f"audit_event_{month_start:%Y_%m}"
+            async with session.begin():
+                moved_rows += await _ensure_audit_partition(
+                    session, partition_name, month_start, _add_months(month_start, 1)
+                )
+            partitions.append(partition_name)
+    
+    logger.info(
+        f"Ensured {len(partitions)} audit_event partitions",
+        extra={"partitions": partitions, "moved_rows": moved_rows},
+    )
+    
+    return {"partitions": partitions, "moved_rows": moved_rows}
+
+
+async def _ensure_audit_partition(
+    session: AsyncSession,
+    partition_name: str,
+    month_start: date,
+    month_end: date,
+) -> int:
+    """Create one monthly audit_event partition if it does not exist.
+    
+    Postgres refuses to create a partition whose range already has rows in
+    the default partition. In that case the partition is built detached,
+    the rows are moved into it and it is then attached. Writes to the
+    default partition wait until the transaction commits.
+    
+    Args:
+        session: Database session, inside a transaction
+        partition_name: Name of the partition table
+        month_start: First day of the month (inclusive bound)
+        month_end: First day of the next month (exclusive bound)
+        
+    Returns:
+        Number of rows moved out of the default partition
+    """
+    exists = await session.scalar(
+        text("SELECT to_regclass(:name) IS NOT NULL"), {"name": partition_name}
+    )
+    if exists:
+        return 0
+    
+    # Literals, so the range is read exactly as the partition bounds are
+    bounds = f"FROM ('{month_start.isoformat()}') TO ('{month_end.isoformat()}')"
+    in_range = (
+        f"created_at >= '{month_start.isoformat()}' "
+        f"AND created_at < '{month_end.isoformat()}'"
+    )
+    
+    # Block new default-partition rows until the move is complete
+    await session.execute(text("LOCK TABLE audit_event_default IN EXCLUSIVE MODE"))
+    stranded = await session.scalar(
+        text(
+            f"SELECT EXISTS (SELECT 1 FROM audit_event_default WHERE {in_range})"
+        )
+    )
+    if not stranded:
+        await session.execute(
+            text(f"CREATE TABLE {partition_name} PARTITION OF audit_event FOR VALUES {bounds}")
+        )
+        return 0
+    
+    await session.execute(
+        text(
+            f"CREATE TABLE {partition_name} "
+            f"(LIKE audit_event INCLUDING DEFAULTS INCLUDING CONSTRAINTS)"
+        )
+    )
+    result = await session.execute(
+        text(
+            f"WITH moved AS ("
+            f"DELETE FROM audit_event_default WHERE {in_range} RETURNING *"
+            f") INSERT INTO {partition_name} SELECT * FROM moved"
+        )
+    )
+    # Attaching builds the parent's indexes and constraints on the partition
+    await session.execute(
+        text(f"ALTER TABLE audit_event ATTACH PARTITION {partition_name} FOR VALUES {bounds}")
+    )
+    
+    logger.warning(
+        f"Moved {result.rowcount} audit events from audit_event_default "
+        f"into {partition_name}",
+        extra={"partition": partition_name, "moved_rows": result.rowcount},
+    )
+    return result.rowcount
@@ -0,0 +1,102 @@
+"""Test audit event batching."""
+
+from src.domain.services.audit_service import ArtifactRetentionService, AuditEventWriter
+from src.infrastructure.database.models import Artifact
+
+
+class _RecordingSession:
+    """Minimal async session that records executed batches."""
+
+    def __init__(self, batches: list):
+        self._batches = batches
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+    async def execute(self, statement, params):
+        self._batches.append(list(params))
+
+    async def commit(self):
+        pass
+
+
+async def test_audit_writer_batches_and_flushes_on_stop():
+    """Test queued events are written together and none are lost on stop."""
+    batches: list = []
+    writer = AuditEventWriter(session_factory=lambda: _RecordingSession(batches))
+    writer.MAX_BATCH_SIZE = 3
+    writer.FLUSH_INTERVAL_SECONDS = 10
+
+    writer.start()
+    for i in range(5):
+        assert writer.enqueue({"id": str(i)})
+    await writer.stop()
+
+    assert [len(batch) for batch in batches] == [3, 2]
+    assert [row["id"] for batch in batches for row in batch] == ["0", "1", "2", "3", "4"]
+
+
+async def test_audit_writer_retries_failed_batches():
+    """Test a transient write failure delays a batch instead of dropping it."""
+    batches: list = []
+    failures = [RuntimeError("connection reset"), RuntimeError("connection reset")]
+
+    class _FlakySession(_RecordingSession):
+        async def execute(self, statement, params):
+            if failures:
+                raise failures.pop()
+            await super().execute(statement, params)
+
+    writer = AuditEventWriter(session_factory=lambda: _FlakySession(batches))
+    writer.WRITE_RETRY_BASE_SECONDS = 0
+
+    await writer._write([{"id": "1"}, {"id": "2"}])
+
+    assert batches == [[{"id": "1"}, {"id": "2"}]]
+
+
+async def test_audit_writer_falls_back_to_rows_when_a_batch_keeps_failing():
+    """Test a persistently failing batch still writes every good row."""
+    batches: list = []
+
+    class _BadRowSession(_RecordingSession):
+        async def execute(self, statement, params):
+            if any(row["id"] == "bad" for row in params):
+                raise ValueError("invalid row")
+            await super().execute(statement, params)
+
+    writer = AuditEventWriter(session_factory=lambda: _BadRowSession(batches))
+    writer.WRITE_RETRY_BASE_SECONDS = 0
+
+    await writer._write([{"id": "1"}, {"id": "bad"}, {"id": "2"}])
+
+    assert batches == [[{"id": "1"}], [{"id": "2"}]]
+
+
+async def test_audit_writer_rejects_events_when_stopped():
+    """Test callers fall back to a direct insert when the writer is not running."""
+    writer = AuditEventWriter(session_factory=lambda: None)
+    assert writer.enqueue({"id": "1"}) is False
+
+
+async def test_delete_blobs_reports_only_successful_deletions():
+    """Test failed blob deletions are excluded from the rows to delete."""
+
+    class _BlobStorage:
+        async def delete_artifact(self, blob_path: str) -> bool:
+            if blob_path == "broken":
+                raise RuntimeError("storage unavailable")
+            return True
+
+    artifacts = [
+        Artifact(id="a1", blob_path="t/a1.pdf", file_size_bytes=10),
+        Artifact(id="a2", blob_path="broken", file_size_bytes=20),
+        Artifact(id="a3", blob_path="t/a3.pdf", file_size_bytes=30),
+    ]
+
+    deleted_ids = await ArtifactRetentionService._delete_blobs(_BlobStorage(), artifacts)
+
+    assert deleted_ids == ["a1", "a3"]
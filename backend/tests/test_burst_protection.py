@@ -0,0 +1,164 @@
+"""Test burst protection count caching."""
+
+import asyncio
+
+from src.domain.services import burst_protection
+from src.domain.services.burst_protection import BurstProtectionService
+
+
+class _CountingRedis:
+    """Minimal Redis stand-in that counts MGET round trips."""
+
+    def __init__(self, tenant_count: str, global_count: str):
+        self.values = [tenant_count, global_count]
+        self.mget_calls = 0
+
+    def register_script(self, script):
+        async def _run(keys=None, args=None):
+            return None
+
+        return _run
+
+    async def mget(self, keys):
+        self.mget_calls += 1
+        return list(self.values)
+
+
+async def test_check_can_execute_reuses_counts_within_window():
+    """Test a burst of checks costs one Redis read and sees pending starts."""
+    burst_protection._count_cache.clear()
+    redis = _CountingRedis("3", "10")
+    service = BurstProtectionService(redis_client=redis)
+
+    results = [
+        await service.check_can_execute("tenant-a", max_concurrent_per_tenant=5)
+        for _ in range(3)
+    ]
+
+    assert [allowed for allowed, _ in results] == [True, True, False]
+    assert redis.mget_calls == 1
+
+    await service.decrement_execution_count("tenant-a")
+    assert "tenant-a" not in burst_protection._count_cache
+
+
+class _KeyedRedis(_CountingRedis):
+    """Redis stand-in holding counter values by key."""
+
+    def __init__(self, values: dict):
+        super().__init__("0", "0")
+        self.store = values
+
+    async def mget(self, keys):
+        self.mget_calls += 1
+        return [self.store.get(key) for key in keys]
+
+
+async def test_check_can_execute_many_uses_one_read_and_counts_admissions():
+    """Test a batch is decided from one MGET and never over-admits."""
+    burst_protection._count_cache.clear()
+    redis = _KeyedRedis({
+        "concurrent_executions:tenant:tenant-a": "4",
+        "concurrent_executions:tenant:tenant-b": "0",
+        "concurrent_executions:global": "7",
+    })
+    service = BurstProtectionService(redis_client=redis)
+
+    results = await service.check_can_execute_many(
+        ["tenant-a", "tenant-a", "tenant-b", "tenant-b"],
+        max_concurrent_per_tenant=5,
+        max_concurrent_global=10,
+    )
+
+    assert [allowed for allowed, _ in results] == [True, False, True, True]
+    assert redis.mget_calls == 1
+    assert burst_protection._count_cache["tenant-b"][:2] == (2, 10)
+
+
+class _GatedRedis(_KeyedRedis):
+    """Keyed Redis stand-in whose reads for one tenant wait on a gate."""
+
+    def __init__(self, values: dict, gated_key: str):
+        super().__init__(values)
+        self.gated_key = gated_key
+        self.gate = asyncio.Event()
+
+    async def mget(self, keys):
+        if self.gated_key in keys:
+            await self.gate.wait()
+        return await super().mget(keys)
+
+
+async def test_count_cache_misses_coalesce_per_tenant():
+    """Test concurrent misses share one read and a slow tenant blocks no other."""
+    burst_protection._count_cache.clear()
+    redis = _GatedRedis(
+        {
+            "concurrent_executions:tenant:tenant-a": "1",
+            "concurrent_executions:tenant:tenant-b": "2",
+            "concurrent_executions:global": "5",
+        },
+        gated_key="concurrent_executions:tenant:tenant-a",
+    )
+    service = BurstProtectionService(redis_client=redis)
+
+    slow = [asyncio.create_task(service._get_counts("tenant-a")) for _ in range(3)]
+    await asyncio.sleep(0)
+
+    assert await asyncio.wait_for(service._get_counts("tenant-b"), timeout=1) == (2, 5)
+
+    redis.gate.set()
+    assert await asyncio.gather(*slow) == [(1, 5)] * 3
+    assert redis.mget_calls == 2
+
+
+class _SeedingRedis(_KeyedRedis):
+    """Keyed Redis stand-in recording pipelined SETs."""
+
+    def __init__(self, values: dict):
+        super().__init__(values)
+        self.sets = []
+
+    def pipeline(self, transaction=True):
+        redis = self
+
+        class _Pipeline:
+            async def __aenter__(self):
+                return self
+
+            async def __aexit__(self, *exc_info):
+                return None
+
+            def set(self, key, value, **kwargs):
+                redis.sets.append((key, value, kwargs))
+
+            async def execute(self):
+                return None
+
+        return _Pipeline()
+
+
+class _ScalarSession:
+    """Session stand-in answering scalar() calls in order."""
+
+    def __init__(self, *values):
+        self.values = list(values)
+
+    async def scalar(self, statement):
+        return self.values.pop(0)
+
+
+async def test_missing_counters_are_reseeded_from_the_table():
+    """Test an expired counter is overwritten from tenant_concurrency with a fresh TTL."""
+    burst_protection._count_cache.clear()
+    redis = _SeedingRedis({"concurrent_executions:global": "40"})
+    service = BurstProtectionService(redis_client=redis)
+
+    counts = await service._get_counts("tenant-a", session=_ScalarSession(2, 7))
+
+    assert counts == (2, 7)
+    ttl = BurstProtectionService.COUNTER_TTL_SECONDS
+    assert redis.sets == [
+        ("concurrent_executions:tenant:tenant-a", 2, {"ex": ttl}),
+        ("concurrent_executions:global", 7, {"ex": ttl}),
+    ]
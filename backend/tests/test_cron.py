@@ -0,0 +1,66 @@
+"""Test cron utilities."""
+
+from datetime import datetime, timezone
+
+import pytest
+
+from src.utils.cron import (
+    calculate_next_run,
+    compile_cron,
+    get_next_n_runs,
+    get_next_n_runs_cached,
+    next_run_from,
+)
+
+
+def test_get_next_n_runs_from_base_time():
+    """Test next runs are computed after the base time in UTC."""
+    base_time = datetime(2025, 1, 1, 8, 30, tzinfo=timezone.utc)
+    runs = get_next_n_runs("0 9 * * *", n=3, base_time=base_time)
+    assert runs == [
+        datetime(2025, 1, 1, 9, 0, tzinfo=timezone.utc),
+        datetime(2025, 1, 2, 9, 0, tzinfo=timezone.utc),
+        datetime(2025, 1, 3, 9, 0, tzinfo=timezone.utc),
+    ]
+
+
+def test_get_next_n_runs_cached_matches_uncached():
+    """Test the cached preview returns the same runs as a fresh computation."""
+    cached = get_next_n_runs_cached("*/15 * * * *", n=4)
+    assert cached == get_next_n_runs("*/15 * * * *", n=4)
+
+    # Callers get their own list, not the cached value
+    cached.clear()
+    assert len(get_next_n_runs_cached("*/15 * * * *", n=4)) == 4
+
+
+def test_calculate_next_run_converts_timezone_to_utc():
+    """Test next run in a local timezone is returned in UTC."""
+    base_time = datetime(2025, 6, 1, 12, 0, tzinfo=timezone.utc)
+    next_run = calculate_next_run("0 9 * * *", tz="America/New_York", base_time=base_time)
+    assert next_run == datetime(2025, 6, 1, 13, 0, tzinfo=timezone.utc)
+
+
+def test_compile_cron_is_shared_and_not_advanced():
+    """Test compiled expressions are memoized and reusable across callers."""
+    compiled = compile_cron("0 9 * * *", "UTC")
+    assert compile_cron("0 9 * * *", "UTC") is compiled
+
+    base_time = datetime(2025, 1, 1, 8, 30, tzinfo=timezone.utc)
+    first = next_run_from(compiled, base_time)
+    assert next_run_from(compiled, base_time) == first == datetime(
+        2025, 1, 1, 9, 0, tzinfo=timezone.utc
+    )
+
+
+@pytest.mark.parametrize(
+    ("cron_expr", "tz", "message"),
+    [
+        ("not a cron", "UTC", "Invalid cron expression"),
+        ("0 9 * * *", "Mars/Base", "Invalid timezone"),
+    ],
+)
+def test_compile_cron_rejects_invalid_input(cron_expr, tz, message):
+    """Test invalid expressions and timezones raise ValueError."""
+    with pytest.raises(ValueError, match=message):
+        compile_cron(cron_expr, tz)
@@ -0,0 +1,28 @@
+"""Test structured JSON log formatting."""
+
+import logging
+
+import orjson
+
+from src.utils.logging import JsonFormatter
+
+
+def test_json_formatter_escapes_message_and_includes_extra():
+    """Test quotes survive encoding and extra fields become top-level keys."""
+    record = logging.makeLogRecord({
+        "name": "src.test",
+        "levelname": "INFO",
+        "msg": 'Schedule "%s" triggered',
+        "args": ("daily",),
+        "request_id": "abc",
+        "status_code": 200,
+    })
+
+    entry = orjson.loads(JsonFormatter().format(record))
+
+    assert entry["message"] == 'Schedule "daily" triggered'
+    assert entry["module"] == "src.test"
+    assert entry["level"] == "INFO"
+    assert entry["request_id"] == "abc"
+    assert entry["status_code"] == 200
+    assert "args" not in entry
@@ -0,0 +1,37 @@
+"""Test keyset cursor encoding."""
+
+import uuid
+from datetime import datetime, timezone
+
+import pytest
+
+from src.utils.pagination import KeysetCursor
+
+
+def test_keyset_cursor_round_trip():
+    """Test a cursor decodes to the exact position it was created from."""
+    cursor = KeysetCursor(
+        created_at=datetime(2024, 5, 1, 12, 30, 15, 123456, tzinfo=timezone.utc),
+        id=uuid.UUID("5f0c3c1e-8d3a-4b8e-9a57-1f9c2c1d7e42"),
+    )
+
+    token = cursor.encode("secret")
+
+    assert KeysetCursor.decode(token, "secret") == cursor
+    # 8-byte timestamp + 16-byte id + 8-byte tag, base64 without padding
+    assert len(token) == 43
+
+
+@pytest.mark.parametrize("token", ["", "not-a-cursor", "AAAA"])
+def test_keyset_cursor_rejects_malformed(token):
+    """Test malformed tokens raise ValueError."""
+    with pytest.raises(ValueError):
+        KeysetCursor.decode(token, "secret")
+
+
+def test_keyset_cursor_rejects_wrong_secret():
+    """Test a cursor signed with another key is rejected."""
+    token = KeysetCursor(created_at=datetime.now(timezone.utc), id=uuid.uuid4()).encode("secret")
+
+    with pytest.raises(ValueError):
+        KeysetCursor.decode(token, "other-secret")
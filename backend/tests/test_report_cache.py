@@ -0,0 +1,179 @@
+"""Test report cache local tier and key/TTL derivation."""
+
+import time
+
+import orjson
+
+from src.infrastructure.cache import report_cache
+from src.infrastructure.cache.report_cache import ReportCacheService
+
+
+class _CountingRedis:
+    """Minimal Redis stand-in that serves one cached report."""
+
+    def __init__(self):
+        self.read_calls = 0
+        self.read_keys = None
+
+    def register_script(self, script):
+        async def _read(keys=None, args=None):
+            self.read_calls += 1
+            self.read_keys = keys
+            return [b"%PDF", b'{"cached_at": "2025-01-01T00:00:00"}']
+
+        return _read
+
+    async def unlink(self, *keys):
+        return len(keys)
+
+
+async def test_hot_report_is_served_from_local_cache_until_invalidated():
+    """Test repeated lookups skip Redis and invalidation drops the local copy."""
+    report_cache._local_cache.clear()
+    redis = _CountingRedis()
+    service = ReportCacheService(redis_client=redis)
+
+    first = await service.get_cached_report("report-1")
+    second = await service.get_cached_report("report-1")
+
+    assert first == second == {
+        "pdf_bytes": b"%PDF",
+        "metadata": {"cached_at": "2025-01-01T00:00:00"},
+    }
+    assert redis.read_calls == 1
+    assert redis.read_keys[2] == "report_ttl_stats:report-1"
+
+    await service.invalidate_report("report-1")
+    await service.get_cached_report("report-1")
+    assert redis.read_calls == 2
+
+
+def test_cache_key_ignores_non_semantic_query_fields():
+    """Test specs differing only in descriptive or null fields share a key."""
+    service = ReportCacheService(redis_client=_CountingRedis())
+    base = {"table": "sales", "filters": [{"column": "region", "value": "EU"}]}
+    annotated = {
+        "filters": [{"column": "region", "value": "EU", "comment": "EU only"}],
+        "table": "sales",
+        "description": "Monthly EU sales",
+        "limit": None,
+    }
+
+    assert service._generate_cache_key("report-1", base) == service._generate_cache_key(
+        "report-1", annotated
+    )
+    assert service._generate_cache_key("report-1", base) != service._generate_cache_key(
+        "report-1", {**base, "table": "returns"}
+    )
+
+
+class _StatsRedis:
+    """Redis stand-in holding the TTL stats keys."""
+
+    def __init__(self):
+        self.values = {}
+
+    async def get(self, key):
+        return self.values.get(key)
+
+
+async def test_estimate_ttl_follows_hit_age_within_bounds():
+    """Test TTLs start at the base and track how late entries are hit."""
+    redis = _StatsRedis()
+    service = ReportCacheService(redis_client=redis)
+
+    assert await service.estimate_ttl("report-1", base_ttl=3600) == 3600
+
+    redis.values["report_ttl_stats:report-1"] = b"3000.0"
+    assert await service.estimate_ttl("report-1", base_ttl=3600) == 6000
+    # Clamped to TTL_MAX_FACTOR of the base
+    assert await service.estimate_ttl("report-1", base_ttl=1000) == 4000
+
+
+class _StoreRedis:
+    """Redis stand-in that keeps values written through a pipeline."""
+
+    def __init__(self):
+        self.values = {}
+
+    def pipeline(self, transaction=True):
+        return _StorePipeline(self)
+
+    def register_script(self, script):
+        async def _read(keys=None, args=None):
+            return [self.values.get(keys[0]), self.values.get(keys[1])]
+
+        return _read
+
+
+class _StorePipeline:
+    def __init__(self, redis):
+        self._redis = redis
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return None
+
+    def setex(self, key, ttl, value):
+        self._redis.values[key] = value
+
+    def sadd(self, *args):
+        pass
+
+    def expire(self, *args, **kwargs):
+        pass
+
+    async def execute(self):
+        return []
+
+
+async def test_large_reports_are_stored_zstd_compressed():
+    """Test compressible PDFs round-trip through zstd storage."""
+    report_cache._local_cache.clear()
+    redis = _StoreRedis()
+    service = ReportCacheService(redis_client=redis)
+    pdf = b"%PDF-1.7 " + b"table row " * 20000
+
+    assert await service.cache_report("report-1", pdf)
+    key = service._generate_cache_key("report-1")
+    metadata = orjson.loads(redis.values[key + service.METADATA_SUFFIX])
+    assert metadata["compressed"] == "zstd"
+    assert len(redis.values[key]) < len(pdf)
+
+    report_cache._local_cache.clear()
+    cached = await service.get_cached_report("report-1")
+    assert cached["pdf_bytes"] == pdf
+
+
+class _ExpiringRedis:
+    """Redis stand-in serving a report cached with the given age and TTL."""
+
+    def __init__(self, age_seconds, ttl_seconds):
+        self.meta = orjson.dumps({
+            "cached_at": int(time.time()) - age_seconds,
+            "ttl_seconds": ttl_seconds,
+        })
+
+    def register_script(self, script):
+        async def _read(keys=None, args=None):
+            return [b"%PDF", self.meta]
+
+        return _read
+
+
+async def test_local_copy_expires_with_the_redis_entry():
+    """Test the L1 entry never outlives the remaining Redis TTL."""
+    report_cache._local_cache.clear()
+    service = ReportCacheService(redis_client=_ExpiringRedis(age_seconds=90, ttl_seconds=100))
+
+    await service.get_cached_report("report-1")
+
+    expires_at, _ = report_cache._local_cache[service._generate_cache_key("report-1")]
+    assert expires_at - time.monotonic() <= 11
+
+    report_cache._local_cache.clear()
+    service = ReportCacheService(redis_client=_ExpiringRedis(age_seconds=200, ttl_seconds=100))
+    await service.get_cached_report("report-1")
+    assert not report_cache._local_cache
@@ -0,0 +1,9 @@
+"""Test schedule route parameter validation."""
+
+from fastapi.testclient import TestClient
+
+
+def test_malformed_schedule_id_is_rejected_before_the_database(client: TestClient):
+    """Test a non-UUID schedule id returns 422 rather than reaching the query."""
+    response = client.get("/v1/schedules/abc")
+    assert response.status_code == 422
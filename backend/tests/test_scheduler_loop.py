@@ -0,0 +1,101 @@
+"""Test scheduler loop resilience."""
+
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta, timezone
+
+from src.scheduler import scheduler_loop
+from src.scheduler.scheduler_loop import SchedulerLoop
+
+
+class _DownPubSub:
+    """Pub/sub stand-in whose server is unreachable."""
+
+    async def subscribe(self, *channels):
+        raise ConnectionError("Redis unavailable")
+
+    async def aclose(self):
+        pass
+
+
+class _DownRedis:
+    def pubsub(self):
+        return _DownPubSub()
+
+
+async def test_loop_keeps_scanning_while_pubsub_is_down():
+    """Test the loop polls on timed sleeps when it cannot subscribe."""
+    loop = SchedulerLoop(database_url="postgresql+asyncpg://", redis_url="redis://")
+    loop._redis = _DownRedis()
+    scans = 0
+
+    async def scan():
+        nonlocal scans
+        scans += 1
+        return 0
+
+    async def next_deadline(triggered):
+        # Short waits go through the failed subscribe and a timed sleep
+        return time.time() + 0.005 if scans < 3 else time.time() + 60
+
+    loop._scan_and_trigger = scan
+    loop._next_deadline = next_deadline
+    loop._task = asyncio.create_task(loop._run_loop())
+    await asyncio.sleep(0.1)
+
+    assert scans == 3
+    assert not loop._task.done()
+    loop._redis = None
+    await loop.stop()
+
+
+class _Session:
+    @asynccontextmanager
+    async def begin(self):
+        yield
+
+
+def _loop_with_head(monkeypatch, next_run_at):
+    """Build a loop whose repository reports the given earliest run time."""
+
+    class _Repository:
+        def __init__(self, session):
+            pass
+
+        async def find_next_run_at(self):
+            return next_run_at
+
+    monkeypatch.setattr(scheduler_loop, "PostgresScheduleRepository", _Repository)
+    loop = SchedulerLoop(database_url="postgresql+asyncpg://", redis_url="redis://")
+    loop._session = _Session()
+    return loop
+
+
+async def test_next_deadline_backs_off_when_nothing_advanced(monkeypatch):
+    """Test a past-due head that the scan could not advance is not rescanned at once."""
+    past_due = datetime.now(timezone.utc) - timedelta(minutes=5)
+    loop = _loop_with_head(monkeypatch, past_due)
+
+    deadline = await loop._next_deadline(0)
+
+    assert deadline - time.time() > SchedulerLoop.BACKOFF_SECONDS - 1
+
+
+async def test_next_deadline_rescans_soon_after_progress(monkeypatch):
+    """Test a partly advanced scan with a past-due head rescans after MIN_SLEEP."""
+    past_due = datetime.now(timezone.utc) - timedelta(minutes=5)
+    loop = _loop_with_head(monkeypatch, past_due)
+
+    deadline = await loop._next_deadline(3)
+
+    assert deadline - time.time() <= SchedulerLoop.MIN_SLEEP_SECONDS
+
+
+async def test_next_deadline_rescans_at_once_after_full_batch(monkeypatch):
+    """Test a full batch of advanced schedules triggers an immediate rescan."""
+    loop = _loop_with_head(monkeypatch, None)
+
+    deadline = await loop._next_deadline(SchedulerLoop.BATCH_SIZE)
+
+    assert deadline <= time.time()
@@ -0,0 +1,31 @@
+"""Test API schemas."""
+
+import pytest
+from pydantic import BaseModel, ValidationError
+
+from src.api.schemas import schedule as schedule_schemas
+from src.api.schemas.schedule import EmailDeliveryConfig
+
+
+def test_email_delivery_config_accepts_valid_addresses():
+    """Test well-formed recipient lists pass validation."""
+    config = EmailDeliveryConfig(recipients=["ops@example.com"], cc=["a.b@mail.example.org"])
+    assert config.recipients == ["ops@example.com"]
+
+
+@pytest.mark.parametrize("email", ["not-an-email", "a@b", "a @example.com", "a@@example.com"])
+def test_email_delivery_config_rejects_invalid_addresses(email):
+    """Test malformed addresses are rejected."""
+    with pytest.raises(ValidationError, match="Invalid email address"):
+        EmailDeliveryConfig(recipients=["ops@example.com", email])
+
+
+def test_schedule_schemas_are_built_at_import():
+    """Test validators are compiled eagerly, not deferred to the first request."""
+    models = [
+        obj
+        for obj in vars(schedule_schemas).values()
+        if isinstance(obj, type) and issubclass(obj, BaseModel) and obj is not BaseModel
+    ]
+    assert models
+    assert all(model.__pydantic_complete__ for model in models)